@@ -0,0 +1,161 @@
+"""
+======================================================
+    Power Efficient Error Correction Encoding for
+            On-Chip Interconnection Links
+
+            Shlomit Lenefsky & Omri Triki
+                        06.2025
+======================================================
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add python_simulation to path for imports
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from coding_schemes import kernels
+from coding_schemes.bit_ops import pack_rows
+from coding_schemes.paper1.mbit_bi import MbitBI
+from coding_schemes.paper1.offset_xor import Offset_XOR
+from coding_schemes.paper2.dapbi import DAPBI
+from coding_schemes.syndrome_based.syndrome_based_encoder import SyndromeBasedEncoder, COSET_LEADER, MIN_TRANSITIONS
+
+
+NUM_SCALAR_WORDS = 5000
+NUM_BATCH_WORDS = 500000
+K = 32
+SEED = 42
+
+
+def scheme_cases():
+    """
+    Implements: The sequential schemes covered by the kernel backends, each with its M parameter.
+
+    Args:
+        None
+
+    Returns:
+        list[tuple[str, callable, int]]: (label, scheme factory, M) per case.
+    """
+    return [
+        ("M-bit Bus-Invert (M=1)", MbitBI, 1),
+        ("M-bit Bus-Invert (M=4)", MbitBI, 4),
+        ("DAPBI", DAPBI, None),
+        ("Offset-XOR", Offset_XOR, None),
+        ("Syndrome-based (coset leader)", lambda: SyndromeBasedEncoder(COSET_LEADER), None),
+        ("Syndrome-based (min-transition)", lambda: SyndromeBasedEncoder(MIN_TRANSITIONS), None),
+    ]
+
+
+def scalar_reference(make_scheme, words, M):
+    """
+    Implements: Word-by-word encoding (and decoding, which carries the Offset-XOR state) as the
+                reference for the batch kernels.
+
+    Args:
+        make_scheme (callable): Scheme factory
+        words (np.ndarray): Bit matrix of input words
+        M (int): Scheme-specific parameter
+
+    Returns:
+        np.ndarray: Bit matrix of codewords.
+    """
+    scheme = make_scheme()
+    n = scheme.get_bus_size(words.shape[1], M)
+    c_prev = [0] * n
+    C = []
+    for s in words.tolist():
+        c = scheme.encode(s, c_prev, M)
+        scheme.decode(c, M)
+        C.append(c)
+        c_prev = c
+    return np.array(C, dtype=np.uint8)
+
+
+def batch_encode(make_scheme, words, M, backend):
+    """
+    Implements: Timed batch encoding and decoding with one kernel backend.
+
+    Args:
+        make_scheme (callable): Scheme factory
+        words (np.ndarray): Bit matrix of input words
+        M (int): Scheme-specific parameter
+        backend (str): kernels.NUMBA or kernels.PYTHON
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, float]: Codewords, decoded words and encoded words/sec.
+    """
+    kernels.set_backend(backend)
+    n = make_scheme().get_bus_size(words.shape[1], M)
+
+    # Warm-up run, so that compilation is not timed
+    make_scheme().encode_batch(words[:16], [0] * n, M)
+
+    scheme = make_scheme()
+    start = time.perf_counter()
+    C = scheme.encode_batch(words, [0] * n, M)
+    rate = len(words) / (time.perf_counter() - start)
+    return C, scheme.decode_batch(C, M), rate
+
+
+def check_fused_syndrome_kernel(words):
+    """
+    Implements: Bit-for-bit check of the fused Δ-syndrome kernel body (run uncompiled) against
+                the vectorized NumPy path, so the kernel logic is verified without Numba too.
+
+    Args:
+        words (np.ndarray): Bit matrix of input words
+
+    Returns:
+        bool: True if both paths agree in every selection mode and simulation mode.
+    """
+    for selection in (COSET_LEADER, MIN_TRANSITIONS):
+        encoder = SyndromeBasedEncoder(selection)
+        deltas = encoder.min_transition_deltas if selection == MIN_TRANSITIONS else encoder.leader_words
+        for mode in (1, 3):
+            encoder.syndrome_prev = 5
+            kernels.set_backend(kernels.PYTHON)
+            expected = encoder.encode_batch(words, [0] * encoder.n, mode=mode)
+            s_prev = 0 if selection == MIN_TRANSITIONS else 5
+            v, _ = kernels._delta_syndrome_run(pack_rows(words), encoder.info_tables.astype(np.int64),
+                                               deltas, np.uint64(0), s_prev, mode == 3)
+            if not np.array_equal(pack_rows(expected[:, encoder.k:]), v):
+                return False
+    return True
+
+
+def main():
+    """Cross-check the kernel backends bit-for-bit and report their throughput."""
+    rng = np.random.default_rng(SEED)
+    words = rng.integers(0, 2, size=(NUM_BATCH_WORDS, K), dtype=np.uint8)
+    backends = [kernels.PYTHON] + ([kernels.NUMBA] if kernels.numba is not None else [])
+
+    print("SEQUENTIAL KERNEL BACKENDS")
+    print("=" * 60)
+    print(f"Available backends: {', '.join(backends)} (default: {kernels.BACKEND})")
+
+    failures = 0
+    for label, make_scheme, M in scheme_cases():
+        reference = scalar_reference(make_scheme, words[:NUM_SCALAR_WORDS], M)
+        results = {backend: batch_encode(make_scheme, words, M, backend) for backend in backends}
+
+        print(f"\n{label}:")
+        for backend, (C, S, rate) in results.items():
+            matches = np.array_equal(C[:NUM_SCALAR_WORDS], reference) and np.array_equal(S, words)
+            matches = matches and np.array_equal(C, results[kernels.PYTHON][0])
+            failures += not matches
+            print(f"    - {backend:6s}: {rate:>12,.0f} words/sec  {'✓' if matches else '✗'} bit-exact")
+
+    fused_ok = check_fused_syndrome_kernel(words[:NUM_SCALAR_WORDS])
+    failures += not fused_ok
+    print(f"\nFused Δ-syndrome kernel body vs NumPy path: {'✓' if fused_ok else '✗'}")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""
+======================================================
+    Power Efficient Error Correction Encoding for
+            On-Chip Interconnection Links
+
+            Shlomit Lenefsky & Omri Triki
+                        06.2025
+======================================================
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add python_simulation to path for imports
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from config.simulation_config import SCHEMES
+from core.link import Transmitter, Receiver, transmit
+
+
+NUM_WORDS = 200000
+K = 32
+M = 1
+SEED = 42
+
+# Schemes without a batch encoder (per-word fallback) run on fewer words
+NUM_WORDS_SCALAR = 20000
+SCALAR_SCHEMES = (1, 2)
+
+
+def loopback(coding_scheme, words):
+    """
+    Implements: Reference link in a single process: separate endpoints, run one after the other.
+
+    Args:
+        coding_scheme: The coding scheme object
+        words (np.ndarray): Bit matrix of input words
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, float]: Transitions per bus word, decoded words and words/sec.
+    """
+    start = time.perf_counter()
+    transmitter = Transmitter(coding_scheme, words.shape[1], M)
+    receiver = Receiver(coding_scheme, M)
+    bus_prev = np.asarray(transmitter.c_prev, dtype=np.uint8)
+    C = transmitter.send_batch(words)
+    decoded = receiver.receive_batch(C)
+    rate = len(words) / (time.perf_counter() - start)
+    return np.count_nonzero(C != np.vstack((bus_prev, C[:-1])), axis=1), decoded, rate
+
+
+def main():
+    """Check the two-process link against the single-process loopback and report throughput."""
+    rng = np.random.default_rng(SEED)
+    words = rng.integers(0, 2, size=(NUM_WORDS, K), dtype=np.uint8)
+
+    print("SHARED-MEMORY LINK PIPELINE")
+    print("=" * 60)
+
+    failures = 0
+    for key, coding_scheme in SCHEMES.items():
+        block = words[:NUM_WORDS_SCALAR] if key in SCALAR_SCHEMES else words
+        # Warm-up run, so that kernel compilation is not timed
+        loopback(coding_scheme, block[:16])
+
+        coding_scheme.reset_state()
+        ref_transitions, ref_decoded, loop_rate = loopback(coding_scheme, block)
+
+        start = time.perf_counter()
+        transitions, decoded = transmit(coding_scheme, block, M)
+        pipe_rate = len(block) / (time.perf_counter() - start)
+
+        matches = np.array_equal(transitions, ref_transitions) and np.array_equal(decoded, ref_decoded)
+        matches = matches and np.array_equal(decoded, block)
+        failures += not matches
+        print(f"\n{coding_scheme.name}:")
+        print(f"    - Loopback:  {loop_rate:>12,.0f} words/sec")
+        print(f"    - Pipelined: {pipe_rate:>12,.0f} words/sec  {'✓' if matches else '✗'} bit-exact")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
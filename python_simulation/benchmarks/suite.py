@@ -0,0 +1,359 @@
+"""
+======================================================
+    Power Efficient Error Correction Encoding for
+            On-Chip Interconnection Links
+
+            Shlomit Lenefsky & Omri Triki
+                        06.2025
+======================================================
+"""
+
+import argparse
+import copy
+import json
+import platform
+import random
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+# Add python_simulation to path for imports
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from coding_schemes import kernels
+from coding_schemes.base_coding_scheme import CodingScheme
+from coding_schemes.syndrome_based.matrix_generation.hv_greedy_algorithm import generate_hv_matrix_entry_point
+from coding_schemes.syndrome_based.matrix_generation.hu_generator import generate_hu_entry_point
+from coding_schemes.syndrome_based.matrix_generation.generate_lut import precompute_coset_leaders, leaders_to_table
+from config.simulation_config import SCHEMES
+from core import generator, lfsr, simulator, transition_count
+
+
+K = 32
+M = 1
+SEED = 42
+REPEATS = 3  # Best of REPEATS timed runs, after one untimed warm-up run
+
+NUM_SCALAR_WORDS = 5000
+NUM_BATCH_WORDS = 200000
+NUM_SIMULATED_WORDS = 5000
+
+# Syndrome length of the generated matrices (the k = 32 code)
+MATRIX_SYNDROME_BITS = 6
+
+DEFAULT_OUTPUT = Path("benchmark_results.json")
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+REGRESSION_THRESHOLD = 0.10  # Flag benchmarks more than 10% slower than the baseline
+
+
+def measure(function, items, repeats=REPEATS) -> dict:
+    """
+    Implements: Timing of a benchmark body: one warm-up run (kernel compilation, caches), then the
+                best of several timed runs, reported as throughput.
+
+    Args:
+        function (callable): Benchmark body, called without arguments
+        items (int): Number of items (words, matrices) processed per call
+        repeats (int): Number of timed runs (default: REPEATS)
+
+    Returns:
+        dict: Items per call, best time in seconds and items/sec.
+    """
+    function()
+    seconds = min(_timed(function) for _ in range(repeats))
+    return {"items": items, "seconds": seconds, "rate": items / seconds}
+
+
+def _timed(function) -> float:
+    """Wall-clock time of one call"""
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def fresh_scheme(key):
+    """
+    Implements: A private copy of a scheme in SCHEMES with power-on state, so that benchmarks
+                neither share nor leak encoder/decoder state.
+
+    Args:
+        key (int): Key of the scheme in SCHEMES
+
+    Returns:
+        CodingScheme: The copy.
+    """
+    scheme = copy.deepcopy(SCHEMES[key])
+    scheme.reset_state()
+    return scheme
+
+
+def has_batch_path(scheme) -> bool:
+    """Whether the scheme overrides the generic per-word encode_batch fallback"""
+    return type(scheme).encode_batch is not CodingScheme.encode_batch
+
+
+def codec_benchmarks(words) -> dict:
+    """
+    Implements: Encode and decode throughput of every scheme, per word (scalar) and per block
+                (batch). Schemes without a vectorized path run their batch fallback on the
+                scalar word count.
+
+    Args:
+        words (np.ndarray): Bit matrix of input words, one K-bit word per row
+
+    Returns:
+        dict: Results by benchmark name.
+    """
+    results = {}
+    scalar_words = words[:NUM_SCALAR_WORDS].tolist()
+
+    for key, scheme in SCHEMES.items():
+        n = scheme.get_bus_size(K, M)
+        codewords = fresh_scheme(key).encode_batch(words[:NUM_SCALAR_WORDS], [0] * n, M).tolist()
+
+        def encode_scalar():
+            encoder, c_prev = fresh_scheme(key), [0] * n
+            for s in scalar_words:
+                c_prev = encoder.encode(s, c_prev, M)
+
+        def decode_scalar():
+            decoder = fresh_scheme(key)
+            for c in codewords:
+                decoder.decode(c, M)
+
+        block = words if has_batch_path(scheme) else words[:NUM_SCALAR_WORDS]
+        C = fresh_scheme(key).encode_batch(block, [0] * n, M)
+
+        results[f"encode/scalar/{scheme.name}"] = measure(encode_scalar, len(scalar_words))
+        results[f"decode/scalar/{scheme.name}"] = measure(decode_scalar, len(codewords))
+        results[f"encode/batch/{scheme.name}"] = measure(
+            lambda: fresh_scheme(key).encode_batch(block, [0] * n, M), len(block))
+        results[f"decode/batch/{scheme.name}"] = measure(lambda: fresh_scheme(key).decode_batch(C, M), len(C))
+    return results
+
+
+def generator_benchmarks() -> dict:
+    """
+    Implements: Word generation throughput of the random, LFSR and exhaustive generators.
+
+    Args:
+        None
+
+    Returns:
+        dict: Results by benchmark name.
+    """
+    results = {}
+    for mode, label in [(1, "random"), (2, "lfsr"), (3, "exhaustive")]:
+        def generate_words():
+            for i in range(NUM_SCALAR_WORDS):
+                generator.generate(K, mode=mode, i=i)
+        results[f"generator/{label}"] = measure(generate_words, NUM_SCALAR_WORDS)
+    return results
+
+
+def transition_count_benchmarks(words) -> dict:
+    """
+    Implements: Throughput of the running transition counter on consecutive bus words.
+
+    Args:
+        words (np.ndarray): Bit matrix of bus words
+
+    Returns:
+        dict: Results by benchmark name.
+    """
+    bus_words = words[:NUM_SCALAR_WORDS].tolist()
+
+    def count_transitions():
+        c_prev = [0] * K
+        transition_count.transition_count(c_prev, c_prev, RESET=True)
+        for c in bus_words:
+            transition_count.transition_count(c, c_prev)
+
+    return {"transition_count": measure(count_transitions, len(bus_words))}
+
+
+def matrix_benchmarks() -> dict:
+    """
+    Implements: Generation time of the syndrome-based code for k = K: greedy H_V, H_U in the span
+                of H_V, and the coset-leader table, reported as matrices per second.
+
+    Args:
+        None
+
+    Returns:
+        dict: Results by benchmark name.
+    """
+    H_V = generate_hv_matrix_entry_point(seed=SEED, verbose=False, m=MATRIX_SYNDROME_BITS)[0]
+    return {
+        "matrix/hv_greedy": measure(
+            lambda: generate_hv_matrix_entry_point(seed=SEED, verbose=False, m=MATRIX_SYNDROME_BITS), 1),
+        "matrix/hu": measure(lambda: generate_hu_entry_point(H_V, hu_cols=K, seed=SEED, verbose=False), 1),
+        "matrix/coset_leaders": measure(lambda: leaders_to_table(precompute_coset_leaders(H_V, verbose=False)), 1),
+    }
+
+
+def simulation_benchmarks() -> dict:
+    """
+    Implements: End-to-end simulate() throughput of every scheme on random and LFSR words,
+                without channel errors, with the per-stage breakdown of the timed run.
+
+    Args:
+        None
+
+    Returns:
+        dict: Results by benchmark name.
+    """
+    results = {}
+    for key, scheme in SCHEMES.items():
+        for mode, label in [(1, "random"), (2, "lfsr")]:
+            def run():
+                random.seed(SEED)
+                lfsr.set_registers(None)
+                simulator.simulate(scheme, K, NUM_SIMULATED_WORDS, 0.0, M=M, mode=mode)
+            result = measure(run, NUM_SIMULATED_WORDS, repeats=1)
+            result["stages"] = simulator.run_statistics['profile'].to_dict()["stages"]
+            results[f"simulate/{label}/{scheme.name}"] = result
+    return results
+
+
+SUITES = {
+    "codec": lambda words: codec_benchmarks(words),
+    "generator": lambda words: generator_benchmarks(),
+    "transition_count": lambda words: transition_count_benchmarks(words),
+    "matrix": lambda words: matrix_benchmarks(),
+    "simulate": lambda words: simulation_benchmarks(),
+}
+
+
+def run(suites=None) -> dict:
+    """
+    Implements: Run of the selected benchmark suites, with the environment they ran in.
+
+    Args:
+        suites (list[str]): Names of the suites in SUITES (default: None, all of them)
+
+    Returns:
+        dict: Metadata and results by benchmark name.
+    """
+    rng = np.random.default_rng(SEED)
+    words = rng.integers(0, 2, size=(NUM_BATCH_WORDS, K), dtype=np.uint8)
+
+    results = {}
+    for name in suites or SUITES:
+        print(f"Running {name} benchmarks...", flush=True)
+        results.update(SUITES[name](words))
+
+    return {
+        "metadata": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "numba": getattr(kernels.numba, "__version__", None),
+            "kernel_backend": kernels.BACKEND,
+            "k": K,
+            "M": M,
+        },
+        "results": results,
+    }
+
+
+def compare(baseline, current, threshold=REGRESSION_THRESHOLD) -> list:
+    """
+    Implements: Comparison of two benchmark runs: the throughput ratio of every benchmark present
+                in both, flagged as a regression when it dropped by more than the threshold.
+
+    Args:
+        baseline (dict): Stored run
+        current (dict): New run
+        threshold (float): Tolerated relative throughput drop (default: REGRESSION_THRESHOLD)
+
+    Returns:
+        list[tuple[str, float, float, float, bool]]: (name, baseline rate, current rate, ratio,
+                                                     regression) per common benchmark.
+    """
+    rows = []
+    for name, result in current["results"].items():
+        if name not in baseline["results"]:
+            continue
+        base_rate = baseline["results"][name]["rate"]
+        ratio = result["rate"] / base_rate
+        rows.append((name, base_rate, result["rate"], ratio, ratio < 1 - threshold))
+    return rows
+
+
+def print_results(report) -> None:
+    """Print the throughput of every benchmark of a run"""
+    print(f"\n{'Benchmark':<60} {'Throughput':>16}")
+    print("-" * 77)
+    for name, result in report["results"].items():
+        print(f"{name:<60} {result['rate']:>12,.1f} /sec")
+
+
+def print_comparison(rows, baseline, current) -> None:
+    """Print a comparison table, regressions marked with ✗"""
+    print(f"\n{'Benchmark':<60} {'Baseline':>14} {'Current':>14} {'Ratio':>7}")
+    print("-" * 98)
+    for name, base_rate, rate, ratio, regression in rows:
+        print(f"{name:<60} {base_rate:>14,.1f} {rate:>14,.1f} {ratio:>6.2f}x {'✗' if regression else ''}")
+
+    missing = sorted(set(baseline["results"]) - set(current["results"]))
+    added = sorted(set(current["results"]) - set(baseline["results"]))
+    if missing:
+        print(f"\n{len(missing)} baseline benchmarks not in the current run")
+    if added:
+        print(f"\nNot in the baseline: {', '.join(added)}")
+
+
+def main():
+    """Run the benchmark suite or compare a run against a baseline."""
+    parser = argparse.ArgumentParser(description="Simulator benchmark suite")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmarks and write the results as JSON")
+    run_parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    run_parser.add_argument("--suite", action="append", choices=list(SUITES),
+                            help="suite to run (repeatable, default: all)")
+    run_parser.add_argument("--save-baseline", type=Path, nargs="?", const=DEFAULT_BASELINE, metavar="PATH",
+                            help="also store the results as the baseline (default path: benchmarks/baseline.json)")
+
+    compare_parser = commands.add_parser("compare", help="flag throughput regressions against a baseline")
+    compare_parser.add_argument("current", type=Path, nargs="?", default=DEFAULT_OUTPUT)
+    compare_parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    compare_parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        report = run(args.suite)
+        args.output.write_text(json.dumps(report, indent=2))
+        print_results(report)
+        print(f"\nResults written to {args.output}")
+        if args.save_baseline:
+            args.save_baseline.write_text(json.dumps(report, indent=2))
+            print(f"Baseline written to {args.save_baseline}")
+        return 0
+
+    missing = [(path, fix) for path, fix in ((args.baseline, "run --save-baseline"), (args.current, "run"))
+               if not path.is_file()]
+    for path, fix in missing:
+        print(f"Error: {path} does not exist (create it with: python benchmarks/suite.py {fix})", file=sys.stderr)
+    if missing:
+        return 2
+
+    baseline = json.loads(args.baseline.read_text())
+    current = json.loads(args.current.read_text())
+    rows = compare(baseline, current, args.threshold)
+    print_comparison(rows, baseline, current)
+
+    regressions = [row for row in rows if row[-1]]
+    print(f"\n{len(regressions)} of {len(rows)} benchmarks regressed by more than {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
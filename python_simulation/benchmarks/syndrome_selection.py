@@ -0,0 +1,95 @@
+"""
+======================================================
+    Power Efficient Error Correction Encoding for
+            On-Chip Interconnection Links
+
+            Shlomit Lenefsky & Omri Triki
+                        06.2025
+======================================================
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add python_simulation to path for imports
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from coding_schemes.bit_ops import pack_rows, popcount
+from coding_schemes.syndrome_based.syndrome_based_encoder import SyndromeBasedEncoder, COSET_LEADER, MIN_TRANSITIONS
+
+
+NUM_SCALAR_WORDS = 20000
+NUM_BATCH_WORDS = 1000000
+SEED = 42
+
+
+def benchmark_selection(selection, words):
+    """
+    Implements: Throughput and transition measurement of one redundancy selection mode
+                on a random word stream, for the scalar and batch encoders.
+
+    Args:
+        selection (str): Redundancy selection mode (COSET_LEADER or MIN_TRANSITIONS)
+        words (np.ndarray): Bit matrix of input words, one 32-bit word per row
+
+    Returns:
+        dict: Words/sec for both paths, average bus and redundancy transitions per word,
+              and the number of invalid codewords produced when the bus restarts from zero.
+    """
+    # Scalar path
+    encoder = SyndromeBasedEncoder(selection)
+    encoder.syndrome_prev = 0
+    c_prev = [0] * encoder.n
+    start = time.perf_counter()
+    for u in words[:NUM_SCALAR_WORDS].tolist():
+        c_prev = encoder.encode(u, c_prev)
+    scalar_rate = NUM_SCALAR_WORDS / (time.perf_counter() - start)
+
+    # Batch path
+    encoder = SyndromeBasedEncoder(selection)
+    encoder.syndrome_prev = 0
+    start = time.perf_counter()
+    C = encoder.encode_batch(words, [0] * encoder.n)
+    batch_rate = len(words) / (time.perf_counter() - start)
+
+    packed = pack_rows(C)
+    transitions = popcount(packed ^ np.concatenate(([np.uint64(0)], packed[:-1])))
+    redundancy_mask = np.uint64((1 << encoder.n_V) - 1)
+    redundancy_transitions = popcount((packed ^ np.concatenate(([np.uint64(0)], packed[:-1]))) & redundancy_mask)
+
+    # Restart from an all-zero bus while the stored syndrome state is left from the stream
+    restarted = encoder.encode_batch(words[:NUM_SCALAR_WORDS], [0] * encoder.n, mode=3)
+    invalid = int(np.count_nonzero(encoder.codeword_syndromes(pack_rows(restarted))))
+
+    return {
+        "scalar_words_per_sec": scalar_rate,
+        "batch_words_per_sec": batch_rate,
+        "avg_transitions": float(transitions.mean()),
+        "avg_redundancy_transitions": float(redundancy_transitions.mean()),
+        "invalid_after_restart": invalid,
+    }
+
+
+def main():
+    """Compare the coset-leader and minimum-transition selection modes."""
+    rng = np.random.default_rng(SEED)
+    words = rng.integers(0, 2, size=(NUM_BATCH_WORDS, 32), dtype=np.uint8)
+
+    print("SYNDROME-BASED REDUNDANCY SELECTION BENCHMARK")
+    print("=" * 60)
+    for selection in (COSET_LEADER, MIN_TRANSITIONS):
+        result = benchmark_selection(selection, words)
+        print(f"\n{selection}:")
+        print(f"    - Scalar encode: {result['scalar_words_per_sec']:,.0f} words/sec")
+        print(f"    - Batch encode:  {result['batch_words_per_sec']:,.0f} words/sec")
+        print(f"    - Average transitions: {result['avg_transitions']:.4f}")
+        print(f"    - Average redundancy transitions: {result['avg_redundancy_transitions']:.4f}")
+        print(f"    - Invalid codewords after bus restart: {result['invalid_after_restart']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,6 +9,59 @@
 """
 
 from abc import ABC, abstractmethod
+from typing import NamedTuple
+import copy
+import numpy as np
+
+
+# Sides of a link, for the per-side state accessors
+ENCODER = "encoder"
+DECODER = "decoder"
+
+
+class CodecState(NamedTuple):
+    """
+    Implements: Snapshot of the hidden state a coding scheme carries between consecutive words,
+                holding plain Python values only so it can be pickled to worker processes or
+                stored as JSON. Cutting a long run into segments and handing every segment the
+                state the previous one ended with reproduces the unsegmented run.
+
+    Args:
+        scheme (str): Name of the coding scheme the state belongs to
+        values (dict): State attribute name -> value (None, int or list[int])
+
+    Returns:
+        None (class definition)
+    """
+    scheme: str
+    values: dict
+
+
+    def to_dict(self) -> dict:
+        """
+        Implements: Conversion to a JSON-serializable dictionary.
+
+        Args:
+            None
+
+        Returns:
+            dict: {"scheme": ..., "values": {...}}.
+        """
+        return {"scheme": self.scheme, "values": copy.deepcopy(self.values)}
+
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Implements: Construction from a dictionary produced by to_dict.
+
+        Args:
+            data (dict): Serialized state
+
+        Returns:
+            CodecState: The restored state.
+        """
+        return cls(data["scheme"], {name: _plain(value) for name, value in data["values"].items()})
 
 
 class CodingScheme(ABC):
@@ -26,9 +79,16 @@ class CodingScheme(ABC):
     name: str
     supports_errors: bool = False  
 
+    # Attributes carrying state from one word to the next (see get_state). Encoder state is
+    # written only by encode and decoder state only by decode, so that the two sides can run
+    # as separate endpoints that share nothing but the bus words.
+    encoder_state_fields: tuple = ("s_in_prev",)
+    decoder_state_fields: tuple = ("s_prev", "c_prev")
+
     def __init__(self):
-        self.s_prev = None  
-        self.c_prev = None
+        self.s_in_prev = None  # Encoder: previous input word
+        self.s_prev = None     # Decoder: previous decoded word
+        self.c_prev = None     # Decoder: previous bus word
     
 
     @abstractmethod
@@ -97,4 +157,148 @@ class CodingScheme(ABC):
         if len(codeword) != len(error_vector):
             raise ValueError("Codeword and error vector must have the same length")
             
-        return [c ^ e for c, e in zip(codeword, error_vector)]
\ No newline at end of file
+        return [c ^ e for c, e in zip(codeword, error_vector)]
+
+
+    def observe_bus(self, c) -> None:
+        """
+        Implements: Receiver-side notification of a bus word driven without a data word (the
+                    bus reset between words in exhaustive mode). Schemes whose decoder tracks
+                    the bus override this; the default ignores it.
+
+        Args:
+            c (list[int]): Bus word
+
+        Returns:
+            None
+        """
+        pass
+
+
+    def state_fields(self, side=None) -> tuple:
+        """
+        Implements: Names of the attributes carrying state between words on one side of the link.
+
+        Args:
+            side (str): ENCODER, DECODER or None for both (default: None)
+
+        Returns:
+            tuple[str]: Attribute names.
+        """
+        if side == ENCODER:
+            return self.encoder_state_fields
+        if side == DECODER:
+            return self.decoder_state_fields
+        if side is None:
+            return self.encoder_state_fields + self.decoder_state_fields
+        raise ValueError(f"Unknown link side: {side}")
+
+
+    def get_state(self, side=None) -> CodecState:
+        """
+        Implements: Snapshot of the encoder and/or decoder state carried between words,
+                    independent of later changes to the scheme.
+
+        Args:
+            side (str): ENCODER, DECODER or None for both (default: None)
+
+        Returns:
+            CodecState: Current state of the scheme.
+        """
+        return CodecState(self.name, {name: _plain(getattr(self, name)) for name in self.state_fields(side)})
+
+
+    def set_state(self, state) -> None:
+        """
+        Implements: Restoring state from a snapshot taken by get_state, possibly on another
+                    instance or in another process. Only the fields in the snapshot are set.
+
+        Args:
+            state (CodecState | dict): State snapshot, or its to_dict form
+
+        Returns:
+            None
+        """
+        if isinstance(state, dict):
+            state = CodecState.from_dict(state)
+        if state.scheme != self.name:
+            raise ValueError(f"State of {state.scheme} cannot be loaded into {self.name}")
+        unknown = set(state.values) - set(self.state_fields())
+        if unknown:
+            raise ValueError(f"{self.name} has no state fields: {', '.join(sorted(unknown))}")
+        for name, value in state.values.items():
+            setattr(self, name, _plain(value))
+
+
+    def reset_state(self, side=None) -> None:
+        """
+        Implements: Return of the encoder and/or decoder state to its power-on value
+                    (all-zero history).
+
+        Args:
+            side (str): ENCODER, DECODER or None for both (default: None)
+
+        Returns:
+            None
+        """
+        for name in self.state_fields(side):
+            setattr(self, name, None)
+
+
+    def encode_batch(self, S, c_prev, M=None) -> np.ndarray:
+        """
+        Implements: Encoding of a block of consecutive input words, where every word is encoded
+                    against the codeword of the word before it. Schemes with a vectorized
+                    implementation override this generic per-word fallback.
+
+        Args:
+            S (np.ndarray): Bit matrix of shape (N, k), one input word per row
+            c_prev (list[int]): Codeword on the bus before the first word of the block
+            M (int): Scheme-specific parameter (default: None)
+
+        Returns:
+            np.ndarray: Bit matrix of shape (N, n), one codeword per row.
+        """
+        S = np.asarray(S, dtype=np.uint8)
+        if len(S) == 0:
+            return np.empty((0, self.get_bus_size(S.shape[1], M)), dtype=np.uint8)
+        C = []
+        c_prev = list(c_prev)
+        for s in S:
+            c = self.encode(s.tolist(), c_prev, M)
+            C.append(c)
+            c_prev = c
+        return np.array(C, dtype=np.uint8)
+
+
+    def decode_batch(self, C, M=None) -> np.ndarray:
+        """
+        Implements: Decoding of a block of consecutive received codewords. Schemes with a
+                    vectorized implementation override this generic per-word fallback.
+
+        Args:
+            C (np.ndarray): Bit matrix of shape (N, n), one received codeword per row
+            M (int): Scheme-specific parameter (default: None)
+
+        Returns:
+            np.ndarray: Bit matrix of shape (N, k), one decoded word per row.
+        """
+        return np.array([self.decode(c.tolist(), M) for c in np.asarray(C)], dtype=np.uint8)
+
+
+def _plain(value):
+    """
+    Implements: Copy of a state value as plain Python data (ints and lists of ints), so that
+                NumPy scalars and arrays do not leak into serialized states.
+
+    Args:
+        value: None, an integer or a sequence of bits
+
+    Returns:
+        None | int | list[int]: The converted copy.
+    """
+    if value is None:
+        return None
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    return [int(bit) for bit in value]
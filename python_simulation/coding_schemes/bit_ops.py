@@ -0,0 +1,159 @@
+"""
+======================================================
+    Power Efficient Error Correction Encoding for
+            On-Chip Interconnection Links
+
+            Shlomit Lenefsky & Omri Triki
+                        06.2025
+======================================================
+"""
+
+import numpy as np
+
+
+# Byte -> 16-bit word with every bit j moved to position 2j (bit interleave table)
+SPREAD_TABLE = np.array(
+    [sum(((b >> j) & 1) << (2 * j) for j in range(8)) for b in range(256)],
+    dtype=np.uint64
+)
+
+# Byte -> number of set bits, used when np.bitwise_count is unavailable (numpy < 2.0)
+_POPCOUNT_TABLE = np.array([bin(b).count("1") for b in range(256)], dtype=np.uint8)
+
+
+def bits_to_int(bits) -> int:
+    """
+    Implements: Packing of a binary word into an integer, first bit is the most significant.
+
+    Args:
+        bits (list[int]): Binary word as a list of 0/1 digits
+
+    Returns:
+        int: Packed integer value of the word.
+    """
+    value = 0
+    for bit in bits:
+        value = (value << 1) | int(bit)
+    return value
+
+
+def int_to_bits(value, width) -> list[int]:
+    """
+    Implements: Unpacking of an integer into a binary word, first bit is the most significant.
+
+    Args:
+        value (int): Packed integer value
+        width (int): Number of bits in the word
+
+    Returns:
+        list[int]: Binary word as a list of 0/1 digits.
+    """
+    return [(int(value) >> (width - 1 - i)) & 1 for i in range(width)]
+
+
+def int_popcount(value) -> int:
+    """
+    Implements: Population count (number of set bits) of a packed Python integer.
+
+    Args:
+        value (int): Packed integer value
+
+    Returns:
+        int: Number of set bits.
+    """
+    return bin(value).count("1")
+
+
+def pack_rows(bits) -> np.ndarray:
+    """
+    Implements: Vectorized packing of a block of binary words (one word per row, up to
+                64 bits wide) into unsigned 64-bit integers, first column is the MSB.
+
+    Args:
+        bits (np.ndarray): Bit matrix of shape (N, width) with 0/1 entries
+
+    Returns:
+        np.ndarray: Packed words as a uint64 array of shape (N,).
+    """
+    bits = np.asarray(bits, dtype=np.uint8)
+    if bits.ndim == 1:
+        bits = bits.reshape(1, -1)
+    width = bits.shape[1]
+    if width > 64:
+        raise ValueError(f"Cannot pack {width}-bit rows into uint64 words")
+
+    padded = np.zeros((bits.shape[0], 64), dtype=np.uint8)
+    padded[:, 64 - width:] = bits
+    return np.packbits(padded, axis=1).view('>u8').ravel().astype(np.uint64)
+
+
+def unpack_rows(words, width) -> np.ndarray:
+    """
+    Implements: Vectorized unpacking of unsigned 64-bit packed words into a bit matrix,
+                inverse of pack_rows.
+
+    Args:
+        words (np.ndarray): Packed words (uint64) of shape (N,)
+        width (int): Number of bits per word (at most 64)
+
+    Returns:
+        np.ndarray: Bit matrix of shape (N, width) as uint8.
+    """
+    if width > 64:
+        raise ValueError(f"Cannot unpack {width}-bit rows from uint64 words")
+    words = np.ascontiguousarray(np.asarray(words, dtype=np.uint64).reshape(-1), dtype='>u8')
+    bits = np.unpackbits(words.view(np.uint8).reshape(-1, 8), axis=1)
+    return bits[:, 64 - width:]
+
+
+def popcount(words) -> np.ndarray:
+    """
+    Implements: Vectorized population count (number of set bits) of packed words.
+
+    Args:
+        words (np.ndarray): Packed words (uint64)
+
+    Returns:
+        np.ndarray: Number of set bits per word.
+    """
+    words = np.asarray(words, dtype=np.uint64)
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words)
+
+    as_bytes = np.ascontiguousarray(words).view(np.uint8).reshape(words.shape + (8,))
+    return _POPCOUNT_TABLE[as_bytes].sum(axis=-1, dtype=np.uint8)
+
+
+def parity(words) -> np.ndarray:
+    """
+    Implements: Vectorized XOR of all bits of packed words (even/odd parity).
+
+    Args:
+        words (np.ndarray): Packed words (uint64)
+
+    Returns:
+        np.ndarray: Parity bit per word as uint8.
+    """
+    return (popcount(words) & 1).astype(np.uint8)
+
+
+def spread_bits(words, width) -> np.ndarray:
+    """
+    Implements: Bit interleave of packed words through SPREAD_TABLE, moving bit j to
+                position 2j so that (spread * 3) duplicates every bit in place.
+
+    Args:
+        words (np.ndarray): Packed words (uint64), at most 32 bits wide
+        width (int): Number of bits per word
+
+    Returns:
+        np.ndarray: Spread words (uint64) holding 2 * width bits.
+    """
+    if width > 32:
+        raise ValueError(f"Cannot spread {width}-bit words into uint64 words")
+    words = np.asarray(words, dtype=np.uint64)
+    spread = np.zeros_like(words)
+    for byte_idx in range((width + 7) // 8):
+        byte = (words >> np.uint64(8 * byte_idx)) & np.uint64(0xFF)
+        spread |= SPREAD_TABLE[byte] << np.uint64(16 * byte_idx)
+    return spread
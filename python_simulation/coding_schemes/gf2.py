@@ -0,0 +1,306 @@
+"""
+======================================================
+    Power Efficient Error Correction Encoding for
+            On-Chip Interconnection Links
+
+            Shlomit Lenefsky & Omri Triki
+                        06.2025
+======================================================
+"""
+
+import numpy as np
+from coding_schemes.bit_ops import bits_to_int, int_to_bits, int_popcount, pack_rows, popcount, parity
+
+
+class GF2Matrix:
+    """
+    Implements: Binary matrix over GF(2) with bit-packed rows. Every row is stored both as
+                unsigned 64-bit limbs (most significant limb first, column 0 as the MSB, so a
+                single limb equals pack_rows) for vectorized products, and as a Python int for
+                scalar products and Gaussian elimination.
+
+    Args:
+        bits (np.ndarray): Matrix of shape (m, n) with 0/1 entries
+
+    Returns:
+        None (class definition)
+    """
+
+    def __init__(self, bits):
+        bits = np.asarray(bits, dtype=np.uint8) & 1
+        if bits.ndim == 1:
+            bits = bits.reshape(1, -1)
+        self.shape = bits.shape
+        self.rows = _pack_limbs(bits)
+        self.row_ints = [bits_to_int(row) for row in bits.tolist()]
+        # Column j packed with the first row as the MSB (the syndrome of a single 1 at position j)
+        self.column_ints = [bits_to_int(col) for col in bits.T.tolist()]
+
+
+    @classmethod
+    def from_row_ints(cls, row_ints, n_cols):
+        """
+        Implements: Construction from rows packed as Python ints (column 0 as the MSB).
+
+        Args:
+            row_ints (list[int]): Packed rows
+            n_cols (int): Number of columns
+
+        Returns:
+            GF2Matrix: Matrix with the given rows.
+        """
+        bits = np.array([int_to_bits(row, n_cols) for row in row_ints], dtype=np.uint8)
+        return cls(bits.reshape(len(row_ints), n_cols))
+
+
+    def to_bits(self) -> np.ndarray:
+        """
+        Implements: Unpacking of the matrix into 0/1 entries.
+
+        Args:
+            None
+
+        Returns:
+            np.ndarray: Matrix of shape (m, n) as uint8.
+        """
+        m, n = self.shape
+        return np.array([int_to_bits(row, n) for row in self.row_ints], dtype=np.uint8).reshape(m, n)
+
+
+    def mul_int(self, x: int) -> int:
+        """
+        Implements: Matrix-vector product A @ x on packed Python ints, one AND and popcount per row.
+
+        Args:
+            x (int): Vector packed with its first entry as the MSB
+
+        Returns:
+            int: Packed product (first row of A in the MSB).
+        """
+        y = 0
+        for row in self.row_ints:
+            y = (y << 1) | (int_popcount(row & x) & 1)
+        return y
+
+
+    def mul_vec(self, x) -> np.ndarray:
+        """
+        Implements: Matrix-vector product A @ x over GF(2) on 0/1 vectors.
+
+        Args:
+            x (np.ndarray): Vector of n entries with 0/1 values
+
+        Returns:
+            np.ndarray: Product vector of m entries as uint8.
+        """
+        return np.array(int_to_bits(self.mul_int(bits_to_int(x)), self.shape[0]), dtype=np.uint8)
+
+
+    def mul_batch(self, X) -> np.ndarray:
+        """
+        Implements: Vectorized products A @ x for a block of vectors: the vectors are packed into
+                    64-bit limbs, and every product bit is the parity of the popcount of one row
+                    ANDed with the vector.
+
+        Args:
+            X (np.ndarray): Bit matrix of shape (N, n), one vector per row
+
+        Returns:
+            np.ndarray: Bit matrix of shape (N, m), one product per row.
+        """
+        X = np.asarray(X, dtype=np.uint8)
+        limbs = _pack_limbs(X)
+        Y = np.empty((X.shape[0], self.shape[0]), dtype=np.uint8)
+        for i in range(self.shape[0]):
+            Y[:, i] = popcount(limbs & self.rows[i]).sum(axis=1) & 1
+        return Y
+
+
+    def mul_packed(self, words) -> np.ndarray:
+        """
+        Implements: Vectorized products A @ x for a block of vectors packed into uint64 words
+                    (n at most 64), returned packed and usable as table indices.
+
+        Args:
+            words (np.ndarray): Packed vectors (uint64), first entry as the MSB
+
+        Returns:
+            np.ndarray: Packed products (intp), first row of A in the MSB.
+        """
+        if self.shape[1] > 64:
+            raise ValueError(f"Cannot multiply {self.shape[1]}-column rows with uint64 words")
+        words = np.asarray(words, dtype=np.uint64)
+        y = np.zeros(words.shape, dtype=np.intp)
+        for i in range(self.shape[0]):
+            y = (y << 1) | parity(words & self.rows[i, 0])
+        return y
+
+
+    def row_reduce(self) -> tuple:
+        """
+        Implements: Gaussian elimination to reduced row echelon form on the packed rows.
+
+        Args:
+            None
+
+        Returns:
+            tuple[list[int], list[int]]: The nonzero rows of the reduced form (packed) and
+                                         the pivot column of each of them.
+        """
+        return _reduce_rows(self.row_ints, self.shape[1])
+
+
+    def rank(self) -> int:
+        """
+        Implements: Rank over GF(2) (not the real-valued rank of np.linalg.matrix_rank).
+
+        Args:
+            None
+
+        Returns:
+            int: Rank of the matrix.
+        """
+        return len(_reduce_rows(self.row_ints, self.shape[1])[0])
+
+
+    def nullspace(self) -> "GF2Matrix":
+        """
+        Implements: Basis of the null space {x : A @ x = 0}, one basis vector per free column
+                    of the reduced row echelon form.
+
+        Args:
+            None
+
+        Returns:
+            GF2Matrix: Matrix of shape (n - rank, n) whose rows span the null space.
+        """
+        n = self.shape[1]
+        rows, pivots = _reduce_rows(self.row_ints, n)
+        basis = []
+        for free in sorted(set(range(n)) - set(pivots)):
+            free_bit = 1 << (n - 1 - free)
+            x = free_bit
+            for row, pivot in zip(rows, pivots):
+                if row & free_bit:
+                    x |= 1 << (n - 1 - pivot)
+            basis.append(x)
+        return GF2Matrix.from_row_ints(basis, n)
+
+
+    def in_column_span(self, vector) -> bool:
+        """
+        Implements: Exact GF(2) test whether a vector is a sum of columns of the matrix,
+                    by reducing it against an XOR basis of the columns.
+
+        Args:
+            vector (np.ndarray | int): Vector of m entries, or packed with its first entry as the MSB
+
+        Returns:
+            bool: True if the vector lies in the column span.
+        """
+        v = vector if isinstance(vector, int) else bits_to_int(vector)
+        return _reduce_vector(v, _xor_basis(self.column_ints)) == 0
+
+
+    def column_space(self) -> list:
+        """
+        Implements: Enumeration of the column span, by a Gray-code walk over an XOR basis of the
+                    columns: every step XORs one basis vector, so each of the 2^rank vectors is
+                    produced exactly once.
+
+        Args:
+            None
+
+        Returns:
+            list[int]: Every vector of the column span, packed with the first row as the MSB,
+                       starting with the zero vector.
+        """
+        basis = _xor_basis(self.column_ints)
+        vectors = [0]
+        v = 0
+        for i in range(1, 1 << len(basis)):
+            v ^= basis[(i & -i).bit_length() - 1]
+            vectors.append(v)
+        return vectors
+
+
+def _pack_limbs(bits) -> np.ndarray:
+    """
+    Implements: Packing of a bit matrix into 64-bit limbs per row, most significant limb first
+                and right aligned (a single limb equals pack_rows).
+
+    Args:
+        bits (np.ndarray): Bit matrix of shape (N, n)
+
+    Returns:
+        np.ndarray: Packed rows as uint64 of shape (N, ceil(n / 64)).
+    """
+    n = bits.shape[1]
+    if n <= 64:
+        return pack_rows(bits).reshape(-1, 1)
+    num_limbs = (n + 63) // 64
+    padded = np.zeros((bits.shape[0], 64 * num_limbs), dtype=np.uint8)
+    padded[:, 64 * num_limbs - n:] = bits
+    return np.packbits(padded, axis=1).view('>u8').astype(np.uint64)
+
+
+def _reduce_rows(row_ints, n_cols) -> tuple:
+    """
+    Implements: Gauss-Jordan elimination on packed rows, pivots taken from the MSB (column 0) down.
+
+    Args:
+        row_ints (list[int]): Packed rows
+        n_cols (int): Number of columns
+
+    Returns:
+        tuple[list[int], list[int]]: Nonzero reduced rows and their pivot columns.
+    """
+    rows = list(row_ints)
+    pivots = []
+    for col in range(n_cols):
+        bit = 1 << (n_cols - 1 - col)
+        pivot = next((i for i in range(len(pivots), len(rows)) if rows[i] & bit), None)
+        if pivot is None:
+            continue
+        rank = len(pivots)
+        rows[rank], rows[pivot] = rows[pivot], rows[rank]
+        for i in range(len(rows)):
+            if i != rank and rows[i] & bit:
+                rows[i] ^= rows[rank]
+        pivots.append(col)
+    return rows[:len(pivots)], pivots
+
+
+def _xor_basis(vectors) -> list:
+    """
+    Implements: XOR basis of packed vectors, each basis vector with a distinct leading bit.
+
+    Args:
+        vectors (list[int]): Packed vectors
+
+    Returns:
+        list[int]: Basis vectors sorted by decreasing leading bit.
+    """
+    basis = []
+    for v in vectors:
+        v = _reduce_vector(v, basis)
+        if v:
+            basis.append(v)
+            basis.sort(reverse=True)
+    return basis
+
+
+def _reduce_vector(v, basis) -> int:
+    """
+    Implements: Reduction of a packed vector against an XOR basis (sorted by decreasing leading bit).
+
+    Args:
+        v (int): Packed vector
+        basis (list[int]): XOR basis from _xor_basis
+
+    Returns:
+        int: Remainder, zero if and only if v lies in the span of the basis.
+    """
+    for b in basis:
+        v = min(v, v ^ b)
+    return v
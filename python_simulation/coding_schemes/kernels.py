@@ -0,0 +1,132 @@
+"""
+======================================================
+    Power Efficient Error Correction Encoding for
+            On-Chip Interconnection Links
+
+            Shlomit Lenefsky & Omri Triki
+                        06.2025
+======================================================
+"""
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # Optional dependency: the pure-Python kernels are used without it
+    numba = None
+
+
+# Kernel backends
+NUMBA = "numba"
+PYTHON = "python"
+
+# Selected automatically: compiled kernels whenever Numba is installed
+BACKEND = NUMBA if numba is not None else PYTHON
+
+
+def set_backend(backend) -> None:
+    """
+    Implements: Selection of the backend used by the sequential kernels of every scheme.
+
+    Args:
+        backend (str): NUMBA or PYTHON
+
+    Returns:
+        None
+    """
+    global BACKEND
+    if backend not in (NUMBA, PYTHON):
+        raise ValueError(f"Unknown kernel backend: {backend}")
+    if backend == NUMBA and numba is None:
+        raise ImportError("The numba backend requires the numba package")
+    BACKEND = backend
+
+
+def bus_invert_decisions(diffs, tie_xor, width, inv_prev, backend=None) -> np.ndarray:
+    """
+    Implements: Sequential bus-invert decisions of one lane over a block of words. With d bits
+                differing from the previous un-inverted word, the bus sees d transitions if the
+                previous word was sent as is and width - d if it was inverted; ties invert when
+                the tie bit (tie_xor XOR previous INV bit) is set.
+
+    Args:
+        diffs (np.ndarray): Differing bits between every word and the un-inverted word before it
+        tie_xor (np.ndarray): Per-word value XORed with the previous INV bit to form the tie bit
+                              (zeros for a tie broken by the previous INV bit itself)
+        width (int): Number of data bits in the lane
+        inv_prev (int): INV bit of the codeword before the block
+        backend (str): NUMBA or PYTHON (default: the selected BACKEND)
+
+    Returns:
+        np.ndarray: INV bit chosen for every word (uint8).
+    """
+    if (backend or BACKEND) == NUMBA:
+        return _bus_invert_run_compiled(np.ascontiguousarray(diffs, dtype=np.int64),
+                                        np.ascontiguousarray(tie_xor, dtype=np.int64),
+                                        int(width), int(inv_prev))
+    return _bus_invert_run(np.asarray(diffs).tolist(), np.asarray(tie_xor).tolist(), int(width), int(inv_prev))
+
+
+def delta_syndrome_run(words, info_tables, deltas, v_prev, s_prev, independent) -> tuple:
+    """
+    Implements: Fused Δ-syndrome encoding loop for the compiled backend: byte-sliced syndrome
+                of every packed information word, redundancy change lookup and running XOR,
+                in one pass without intermediate arrays.
+
+    Args:
+        words (np.ndarray): Packed information words (uint64, at most 64 bits)
+        info_tables (np.ndarray): Byte-sliced syndrome tables of H_U
+        deltas (np.ndarray): Packed redundancy change (uint64) per packed Δ-syndrome
+        v_prev (int): Packed redundancy word on the bus before the block
+        s_prev (int): Syndrome the first word is measured against
+        independent (bool): Encode every word against v_prev and s_prev (simulation mode 3)
+
+    Returns:
+        tuple[np.ndarray, int]: Packed redundancy words (uint64) and the syndrome of the last word.
+    """
+    return _delta_syndrome_run_compiled(np.ascontiguousarray(words, dtype=np.uint64),
+                                        np.ascontiguousarray(info_tables, dtype=np.int64),
+                                        np.ascontiguousarray(deltas, dtype=np.uint64),
+                                        np.uint64(v_prev), int(s_prev), bool(independent))
+
+
+def _bus_invert_run(diffs, tie_xor, width, inv_prev):
+    """Bus-invert recurrence of bus_invert_decisions (kernel body, Numba-compatible)"""
+    half = width // 2
+    inv = np.empty(len(diffs), dtype=np.uint8)
+    prev = inv_prev
+    for i in range(len(diffs)):
+        transitions = width - diffs[i] if prev == 1 else diffs[i]
+        tie_bit = tie_xor[i] ^ prev
+        prev = 1 if transitions > half or (transitions == half and tie_bit == 1) else 0
+        inv[i] = prev
+    return inv
+
+
+def _delta_syndrome_run(words, info_tables, deltas, v_prev, s_prev, independent):
+    """Δ-syndrome loop of delta_syndrome_run (kernel body, Numba-compatible)"""
+    v = np.empty(words.shape[0], dtype=np.uint64)
+    v_curr = v_prev
+    for i in range(words.shape[0]):
+        word = words[i]
+        s = 0
+        for byte_idx in range(info_tables.shape[0]):
+            s ^= info_tables[byte_idx, (word >> np.uint64(8 * byte_idx)) & np.uint64(0xFF)]
+        if independent:
+            v[i] = v_prev ^ deltas[s_prev ^ s]
+        else:
+            v_curr = v_curr ^ deltas[s_prev ^ s]
+            v[i] = v_curr
+            s_prev = s
+    return v, s_prev
+
+
+def _compile(kernel):
+    """Numba-compiled version of a kernel body, or the body itself without Numba"""
+    if numba is None:
+        return kernel
+    return numba.njit(cache=True, nogil=True)(kernel)
+
+
+_bus_invert_run_compiled = _compile(_bus_invert_run)
+_delta_syndrome_run_compiled = _compile(_delta_syndrome_run)
@@ -9,8 +9,11 @@
 """
 
 from coding_schemes.base_coding_scheme import CodingScheme
+from coding_schemes.bit_ops import pack_rows, unpack_rows, popcount
+from coding_schemes.kernels import bus_invert_decisions
 from math import comb
 import logging
+import numpy as np
 
 
 class MbitBI(CodingScheme):
@@ -25,6 +28,8 @@ class MbitBI(CodingScheme):
         None (class definition)
     """
     name = "M-bit Bus-Invert"
+    encoder_state_fields = ()
+    decoder_state_fields = ()
 
 
     def get_bus_size(self, k, M) -> int:
@@ -113,6 +118,82 @@ class MbitBI(CodingScheme):
         return s
 
 
+    def encode_batch(self, S, c_prev, M) -> np.ndarray:
+        """
+        Implements: Batch M-bit Bus Invert encoding on packed segments. Transitions of every
+                    segment against the same segment of the previous word are counted by popcount
+                    for the whole block, leaving only the per-segment inversion decision sequential
+                    (compiled kernel when Numba is available).
+
+        Args:
+            S (np.ndarray): Bit matrix of shape (N, k), one input word per row
+            c_prev (list[int]): Codeword on the bus before the first word of the block
+            M (int): Number of segments for bus inversion
+
+        Returns:
+            np.ndarray: Bit matrix of shape (N, k + M), one codeword per row.
+        """
+        S = np.asarray(S, dtype=np.uint8)
+        c_prev = np.asarray(c_prev, dtype=np.uint8)
+        N, k = S.shape
+        n = k + M
+        if N == 0:
+            return np.empty((0, n), dtype=np.uint8)
+        segments = [n // M] * (n % M) + [n // M - 1] * (M - n % M)
+        if max(segments) > 64:
+            return super().encode_batch(S, c_prev.tolist(), M)
+
+        C = np.empty((N, n), dtype=np.uint8)
+        start_s = 0
+        start_c = 0
+        for seg_len in segments:
+            mask = np.uint64((1 << seg_len) - 1)
+            words = pack_rows(S[:, start_s:start_s + seg_len])
+
+            # Un-inverted segment preceding every segment of the block
+            inv_prev = int(c_prev[start_c + seg_len])
+            raw_prev = np.empty_like(words)
+            raw_prev[0] = pack_rows(c_prev[start_c:start_c + seg_len])[0] ^ (mask if inv_prev else np.uint64(0))
+            raw_prev[1:] = words[:-1]
+
+            # Ties are broken by the INV bit of the previous segment (tie_xor = 0)
+            inv = bus_invert_decisions(popcount(words ^ raw_prev), np.zeros(N, dtype=np.int64), seg_len, inv_prev)
+
+            C[:, start_c:start_c + seg_len] = unpack_rows(words ^ (inv.astype(np.uint64) * mask), seg_len)
+            C[:, start_c + seg_len] = inv
+
+            start_s += seg_len
+            start_c += seg_len + 1
+
+        return C
+
+
+    def decode_batch(self, C, M) -> np.ndarray:
+        """
+        Implements: Vectorized M-bit Bus Invert decoding of a block of codewords, XORing every
+                    segment with its inversion flag.
+
+        Args:
+            C (np.ndarray): Bit matrix of shape (N, k + M), one received codeword per row
+            M (int): Number of segments used in encoding
+
+        Returns:
+            np.ndarray: Bit matrix of shape (N, k), one decoded word per row.
+        """
+        C = np.asarray(C, dtype=np.uint8)
+        k = C.shape[1] - M
+        segments = [k // M + 1] * (k % M) + [k // M] * (M - k % M)
+
+        S = np.empty((C.shape[0], k), dtype=np.uint8)
+        start_s = 0
+        start_c = 0
+        for seg_len in segments:
+            S[:, start_s:start_s + seg_len] = C[:, start_c:start_c + seg_len] ^ C[:, start_c + seg_len:start_c + seg_len + 1]
+            start_s += seg_len
+            start_c += seg_len + 1
+        return S
+
+
     def _check_invert(self, s, c_prev):
         """
         Implements: Segment inversion decision logic that compares transition count with
@@ -25,6 +25,7 @@ class Offset(CodingScheme):
     """
     name = "Offset"
     supports_errors = False
+    decoder_state_fields = ("s_prev",)
     
 
     def get_bus_size(self, k, M=None) -> int:
@@ -55,13 +56,13 @@ class Offset(CodingScheme):
         Returns:
             list[int]: Encoded difference word (s_current - s_previous) in two's complement.
         """
-        # Initialize with zeros on first decode
-        if self.s_prev is None:
-            self.s_prev = [0] * len(s_in)  
+        # Initialize with zeros on first encode
+        if self.s_in_prev is None:
+            self.s_in_prev = [0] * len(s_in)  
 
         # Convert binary lists to integers for two's complement arithmetic
         s_curr = int(''.join(map(str, s_in)), 2)
-        s_previous = int(''.join(map(str, self.s_prev)), 2)
+        s_previous = int(''.join(map(str, self.s_in_prev)), 2)
         
         # Calculate difference in two's complement
         diff = (s_curr - s_previous) % (2 ** len(s_in))
@@ -69,6 +70,9 @@ class Offset(CodingScheme):
         # Convert back to binary list
         c = [int(x) for x in format(diff, f'0{len(s_in)}b')]
 
+        # Store current input as previous for next encode
+        self.s_in_prev = list(s_in)
+
         logging.debug(f"Offset encoded word:                    {c}")
 
         return c
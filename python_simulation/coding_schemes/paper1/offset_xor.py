@@ -9,7 +9,9 @@
 """
 
 from coding_schemes.base_coding_scheme import CodingScheme
+from coding_schemes.bit_ops import bits_to_int, int_to_bits, pack_rows, unpack_rows
 import logging
+import numpy as np
 
 
 class Offset_XOR(CodingScheme):
@@ -25,6 +27,7 @@ class Offset_XOR(CodingScheme):
     """
     name = "Offset-XOR"
     supports_errors = False
+    decoder_state_fields = ("s_prev", "c_prev")
     
 
     def get_bus_size(self, k, M=None) -> int:
@@ -55,14 +58,12 @@ class Offset_XOR(CodingScheme):
         Returns:
             list[int]: Encoded word as c_prev XOR (s_current - s_previous).
         """
-        if self.s_prev is None:
-            self.s_prev = [0] * len(s_in)  
+        if self.s_in_prev is None:
+            self.s_in_prev = [0] * len(s_in)  
 
         # c = c_prev xor (s - s_prev)
-
-        self.c_prev = c_prev[:]
         
-        s_previous = int(''.join(map(str, self.s_prev)), 2)
+        s_previous = int(''.join(map(str, self.s_in_prev)), 2)
         s_new = int(''.join(map(str, s_in)), 2)
         
         sub = (s_new - s_previous) % (2 ** len(s_in))
@@ -71,6 +72,8 @@ class Offset_XOR(CodingScheme):
         
         c = [a ^ b for a, b in zip(c_prev, offset_binary)]
 
+        self.s_in_prev = list(s_in)
+
         logging.debug(f"Offset-XOR encoded word:                {c}")
 
         return c
@@ -90,6 +93,8 @@ class Offset_XOR(CodingScheme):
         """
         if self.s_prev is None:
             self.s_prev = [0] * len(c)  
+        if self.c_prev is None:
+            self.c_prev = [0] * len(c)
             
         # s = (c_prev xor c) + s_prev
 
@@ -101,7 +106,135 @@ class Offset_XOR(CodingScheme):
         s = [int(x) for x in format(s_out_int, f'0{len(c)}b')]
         
         self.s_prev = s[:]
+        self.c_prev = list(c)
         
         logging.debug(f"Offset-XOR decoded word:                {s}")
 
         return s
+
+
+    def observe_bus(self, c) -> None:
+        """
+        Implements: Tracking of a bus word driven without a data word, which the next decode
+                    XORs against like any other previous bus word.
+
+        Args:
+            c (list[int]): Bus word
+
+        Returns:
+            None
+        """
+        self.c_prev = list(c)
+
+
+    def encode_batch(self, S, c_prev, M=None) -> np.ndarray:
+        """
+        Implements: Vectorized Offset-XOR encoding of a block of words. Offsets between consecutive
+                    words are computed by one wrapping subtraction, and since every codeword is the
+                    previous one XOR its offset, the codewords are a running XOR of the offsets.
+
+        Args:
+            S (np.ndarray): Bit matrix of shape (N, k), one input word per row
+            c_prev (list[int]): Codeword on the bus before the first word of the block
+            M (int): Unused parameter for compatibility (default: None)
+
+        Returns:
+            np.ndarray: Bit matrix of shape (N, k), one codeword per row.
+        """
+        S = np.asarray(S, dtype=np.uint8)
+        k = S.shape[1]
+        if len(S) == 0:
+            return np.empty((0, k), dtype=np.uint8)
+        if self.s_in_prev is None:
+            self.s_in_prev = [0] * k
+
+        mask = _word_mask(k)
+        words = _pack_words(S)
+        prev_words = np.concatenate((_pack_words([self.s_in_prev]), words[:-1]))
+        self.s_in_prev = S[-1].tolist()
+
+        # (s - s_prev) mod 2^k: uint64 arithmetic wraps mod 2^64, a multiple of 2^k
+        offsets = (words - prev_words) & mask
+        return _unpack_words(_pack_words([c_prev])[0] ^ np.bitwise_xor.accumulate(offsets), k)
+
+
+    def decode_batch(self, C, M=None) -> np.ndarray:
+        """
+        Implements: Vectorized Offset-XOR decoding of a block of codewords: every word is the
+                    previous one plus the XOR of consecutive codewords, so the words are a running
+                    sum (mod 2^k) of those XORs.
+
+        Args:
+            C (np.ndarray): Bit matrix of shape (N, k), one received codeword per row
+            M (int): Unused parameter for compatibility (default: None)
+
+        Returns:
+            np.ndarray: Bit matrix of shape (N, k), one decoded word per row.
+        """
+        C = np.asarray(C, dtype=np.uint8)
+        k = C.shape[1]
+        if len(C) == 0:
+            return np.empty((0, k), dtype=np.uint8)
+        if self.s_prev is None:
+            self.s_prev = [0] * k
+        if self.c_prev is None:
+            self.c_prev = [0] * k
+
+        mask = _word_mask(k)
+        codewords = _pack_words(C)
+        prev_codewords = np.concatenate((_pack_words([self.c_prev]), codewords[:-1]))
+
+        xors = codewords ^ prev_codewords
+        words = (_pack_words([self.s_prev])[0] + np.cumsum(xors, dtype=xors.dtype)) & mask
+        S = _unpack_words(words, k)
+
+        # Same state as after decoding the block word by word
+        self.s_prev = S[-1].tolist()
+        self.c_prev = C[-1].tolist()
+        return S
+
+
+def _word_mask(k):
+    """
+    Implements: Mask of k bits in the representation used by _pack_words.
+
+    Args:
+        k (int): Word width
+
+    Returns:
+        np.uint64 | int: (2^k - 1) as uint64 up to 64 bits, as a Python int beyond.
+    """
+    return np.uint64((1 << k) - 1) if k <= 64 else (1 << k) - 1
+
+
+def _pack_words(bits) -> np.ndarray:
+    """
+    Implements: Packing of words for the batch prefix scans: uint64 up to 64 bits, and
+                arbitrary-precision Python ints (object array) for wider buses.
+
+    Args:
+        bits (np.ndarray | list[list[int]]): Bit matrix of shape (N, k)
+
+    Returns:
+        np.ndarray: Packed words, first bit as the MSB.
+    """
+    bits = np.asarray(bits, dtype=np.uint8)
+    if bits.shape[1] <= 64:
+        return pack_rows(bits)
+    return np.array([bits_to_int(row) for row in bits.tolist()], dtype=object)
+
+
+def _unpack_words(words, k) -> np.ndarray:
+    """
+    Implements: Inverse of _pack_words.
+
+    Args:
+        words (np.ndarray): Packed words
+        k (int): Word width
+
+    Returns:
+        np.ndarray: Bit matrix of shape (N, k).
+    """
+    if k <= 64:
+        return unpack_rows(words, k)
+    return np.array([int_to_bits(int(w), k) for w in words], dtype=np.uint8).reshape(len(words), k)
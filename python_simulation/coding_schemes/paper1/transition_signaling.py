@@ -25,6 +25,7 @@ class Transition_Signaling(CodingScheme):
     """
     name = "Transition Signaling"
     supports_errors = False
+    decoder_state_fields = ("s_prev",)
     
 
     def get_bus_size(self, k, M=None) -> int:
@@ -55,14 +56,17 @@ class Transition_Signaling(CodingScheme):
         Returns:
             list[int]: Encoded transition word where 1=change, 0=no change from previous.
         """
-        # Initialize with zeros on first decode
-        if self.s_prev is None:
-            self.s_prev = [0] * len(s_in)  
+        # Initialize with zeros on first encode
+        if self.s_in_prev is None:
+            self.s_in_prev = [0] * len(s_in)  
 
         s_copy = s_in[:] 
 
-        # c = s_in ^ c_prev
-        c = [int(s_copy[i]) ^ int(self.s_prev[i]) for i in range(len(s_copy))]
+        # c = s_in ^ s_in_prev
+        c = [int(s_copy[i]) ^ int(self.s_in_prev[i]) for i in range(len(s_copy))]
+
+        # Store current input as previous for next encode
+        self.s_in_prev = s_copy
 
         logging.debug(f"Transtion Signaling encoded word:       {c}")
         return c
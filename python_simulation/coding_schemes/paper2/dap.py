@@ -9,8 +9,11 @@
 """
 
 from coding_schemes.base_coding_scheme import CodingScheme
+from coding_schemes.bit_ops import bits_to_int, pack_rows, unpack_rows, spread_bits
+from coding_schemes.gf2 import GF2Matrix
+from functools import lru_cache
 import logging
-from functools import reduce
+import numpy as np
 
 
 class DAP(CodingScheme):
@@ -26,6 +29,8 @@ class DAP(CodingScheme):
     """
     name = "Duplicate Add-Parity"
     supports_errors = True  
+    encoder_state_fields = ()
+    decoder_state_fields = ()
 
 
     def get_bus_size(self, k, M=None) -> int:
@@ -66,7 +71,7 @@ class DAP(CodingScheme):
             c.append(bit)
 
         # Calculate parity bit using XOR of the input
-        parity = reduce(lambda x, y: x ^ y, s_in)  
+        parity = _parity_check(len(s_in)).mul_int(bits_to_int(s_in))
 
         # Append the parity bit to the codeword
         c.append(parity)
@@ -92,7 +97,7 @@ class DAP(CodingScheme):
         c = c[:-1]
 
         # XOR all even bits to calculate parity
-        calculated_parity = reduce(lambda x, y: x ^ y, c[::2])
+        calculated_parity = _parity_check(len(c) // 2).mul_int(bits_to_int(c[::2]))
 
         # XOR the calculated parity with the received parity
         error = calculated_parity ^ parity
@@ -107,3 +112,71 @@ class DAP(CodingScheme):
 
         logging.debug(f"DAP decoded word:                       {s_out}")
         return s_out
+
+
+    def encode_batch(self, S, c_prev=None, M=None) -> np.ndarray:
+        """
+        Implements: Vectorized DAP encoding of a block of words on packed integers, duplicating
+                    bits through the spread (bit interleave) table and computing parity as a
+                    packed GF(2) parity-check product.
+
+        Args:
+            S (np.ndarray): Bit matrix of shape (N, k), one input word per row
+            c_prev (list[int]): Previous encoded codeword (unused in this scheme)
+            M (int): Unused parameter for compatibility (default: None)
+
+        Returns:
+            np.ndarray: Bit matrix of shape (N, 2k + 1), one codeword per row.
+        """
+        S = np.asarray(S, dtype=np.uint8)
+        k = S.shape[1]
+        if k > 64:
+            return super().encode_batch(S, c_prev, M)
+        words = pack_rows(S)
+
+        # Bit j moves to positions 2j and 2j+1: [s0,s0,s1,s1,...]
+        C = np.empty((S.shape[0], 2 * k + 1), dtype=np.uint8)
+        if k <= 32:
+            spread = spread_bits(words, k)
+            C[:, :-1] = unpack_rows(spread | (spread << np.uint64(1)), 2 * k)
+        else:
+            C[:, :-1] = np.repeat(S, 2, axis=1)
+        C[:, -1] = _parity_check(k).mul_packed(words)
+        return C
+
+
+    def decode_batch(self, C, M=None) -> np.ndarray:
+        """
+        Implements: Vectorized DAP decoding of a block of codewords, checking parity of the even
+                    lanes with a packed GF(2) parity-check product and selecting the odd lanes
+                    for words with a parity mismatch.
+
+        Args:
+            C (np.ndarray): Bit matrix of shape (N, 2k + 1), one received codeword per row
+            M (int): Unused parameter for compatibility (default: None)
+
+        Returns:
+            np.ndarray: Bit matrix of shape (N, k), one decoded word per row.
+        """
+        C = np.asarray(C, dtype=np.uint8)
+        even = C[:, :-1:2]
+        odd = C[:, 1:-1:2]
+        if even.shape[1] > 64:
+            return super().decode_batch(C, M)
+
+        error = _parity_check(even.shape[1]).mul_packed(pack_rows(even)) ^ C[:, -1]
+        return np.where(error[:, None] == 1, odd, even)
+
+
+@lru_cache(maxsize=64)
+def _parity_check(k) -> GF2Matrix:
+    """
+    Implements: Single-row GF(2) parity-check matrix of k data bits (all ones), cached per k.
+
+    Args:
+        k (int): Number of data bits
+
+    Returns:
+        GF2Matrix: The 1 × k all-ones matrix.
+    """
+    return GF2Matrix(np.ones((1, k), dtype=np.uint8))
@@ -9,8 +9,12 @@
 """
 
 from coding_schemes.base_coding_scheme import CodingScheme
+from coding_schemes.bit_ops import bits_to_int, int_to_bits, pack_rows, unpack_rows
+from coding_schemes.gf2 import GF2Matrix
+from functools import lru_cache
+from typing import NamedTuple
 import logging
-import math
+import numpy as np
 
 
 class HammingX(CodingScheme):
@@ -26,7 +30,8 @@ class HammingX(CodingScheme):
     """
     name = "HammingX"
     supports_errors = True
-    r = 0
+    encoder_state_fields = ()
+    decoder_state_fields = ()
 
 
     def get_bus_size(self, k, M=None) -> int:
@@ -41,12 +46,8 @@ class HammingX(CodingScheme):
         Returns:
             int: Total bus width required (k + r + (r-1) bits where r is number of parity bits).
         """
-        for i in range(k):
-            if(2**i >= k + i + 1):
-                self.r = i
-                break
-        n = k + self.r + (self.r - 1)
-        return n
+        tables = _hamming_tables(k)
+        return tables.n + tables.r - 1
 
 
     def encode(self, s_in: list[int], c_prev: list[int], M: int = None) -> list[int]:
@@ -62,17 +63,19 @@ class HammingX(CodingScheme):
         Returns:
             list[int]: Encoded codeword with data bits, calculated parity bits, and shielding bits.
         """
-        
-        # Get positions with redundant bits
-        pos = self._posRedundantBits(s_in)
+        tables = _hamming_tables(len(s_in))
 
-        # Calculate parity bits
-        c = self._calcParityBits(pos)
+        # Place data bits around the parity positions, then set the parity bits: each parity
+        # position is covered by its own check only, so the syndrome holds all of them at once
+        h = _place_data(bits_to_int(s_in), tables)
+        syndrome = tables.check.mul_int(h)
+        for i in range(tables.r):
+            if (syndrome >> i) & 1:
+                h |= 1 << ((1 << i) - 1)
 
         # Add shielding bits (in the end for convenience)
-        for i in range(self.r - 1):
-            c.append(0)
-            
+        c = int_to_bits(h, tables.n) + [0] * (tables.r - 1)
+
         logging.debug(f"HammingX encoded word:                  {c}")
 
         return c
@@ -90,91 +93,203 @@ class HammingX(CodingScheme):
         Returns:
             list[int]: Decoded binary word with single error correction applied.
         """
-        res = 0
+        tables = _hamming_tables(_data_bits_for_bus_size(len(c)))
 
         # Remove r - 1 shielding bits
-        c = c[:-1 * (self.r - 1)]
-        n = len(c)
+        h = bits_to_int(c[:tables.n])
 
-        # Calculate parity bits again
-        for i in range(self.r):
-            val = 0
-            for j in range(1, n + 1):
-                if(j & (2**i) == (2**i)):
-                    val = val ^ int(c[-1 * j])
+        # Syndrome equals the position of a single-bit error
+        syndrome = tables.check.mul_int(h)
 
-            res = res + val*(10**i)
-            err = int(str(res), 2)
-
-        if err != 0:
+        flip = tables.flip_masks[syndrome]
+        if flip:
             # If error is detected, correct the bit
-            c[-1 * err] = 1 - c[-1 * err]
+            logging.debug(f"Error detected and corrected at position {syndrome}")
+            h ^= flip
 
-        # Remove redundant bits and convert to list of integers
-        s_out = []
-        for i in range(1, n + 1):
-            if(i != 2**int(math.log2(i))):
-                s_out.append(int(c[-1 * i]))
+        s_out = int_to_bits(_extract_data(h, tables), tables.k)
 
-        # Reverse the list to get the original order
-        s_out = s_out[::-1]
-        
         logging.debug(f"HammingX decoded word:                  {s_out}")
         return s_out
 
 
-    def _posRedundantBits(self, s) -> list[int]:
+    def encode_batch(self, S, c_prev=None, M=None) -> np.ndarray:
         """
-        Implements: Positioning of data bits and parity bit placeholders according to Hamming code
-                    structure where parity bits occupy positions that are powers of 2.
+        Implements: Vectorized HammingX encoding of a block of words on packed integers, with
+                    parity bits taken from the packed GF(2) parity-check product. Codewords
+                    longer than 64 bits (k > 57) use the per-word fallback.
 
         Args:
-            s (list[int]): Input data bits to position
+            S (np.ndarray): Bit matrix of shape (N, k), one input word per row
+            c_prev (list[int]): Previous encoded codeword (unused in this scheme)
+            M (int): Unused parameter for compatibility (default: None)
 
         Returns:
-            list[int]: Data bits positioned with parity bit placeholders in correct locations.
+            np.ndarray: Bit matrix of shape (N, k + 2r - 1), one codeword per row.
         """
-        j = 0
-        t = 1
-        k = len(s)
-        res = []
+        S = np.asarray(S, dtype=np.uint8)
+        tables = _hamming_tables(S.shape[1])
+        if tables.n > 64:
+            c_prev = [0] * (tables.n + tables.r - 1) if c_prev is None else c_prev
+            return super().encode_batch(S, c_prev, M)
 
-        # If position is power of 2 then insert 0, else append the data
-        for i in range(1, k + self.r + 1):
-            if(i == 2**j):
-                res.append(0)
-                j += 1
-            else:
-                res.append(s[-1 * t])
-                t += 1
+        h = _place_data(pack_rows(S), tables)
+        syndrome = tables.check.mul_packed(h).astype(np.uint64)
+        for i in range(tables.r):
+            h |= ((syndrome >> np.uint64(i)) & np.uint64(1)) << np.uint64((1 << i) - 1)
 
-        # The result is reversed since positions are counted backwards
-        return res[::-1]
+        C = np.zeros((S.shape[0], tables.n + tables.r - 1), dtype=np.uint8)
+        C[:, :tables.n] = unpack_rows(h, tables.n)
+        return C
 
 
-    def _calcParityBits(self, s) -> list[int]:
+    def decode_batch(self, C, M=None) -> np.ndarray:
         """
-        Implements: Calculation of parity bits using XOR operations on specific bit positions
-                    according to Hamming code parity check matrix.
+        Implements: Vectorized HammingX decoding of a block of codewords, correcting single-bit
+                    errors through one gather from the syndrome-to-error-position table.
+                    Codewords longer than 64 bits (k > 57) use the per-word fallback.
 
         Args:
-            s (list[int]): Data bits with parity bit placeholders
+            C (np.ndarray): Bit matrix of shape (N, k + 2r - 1), one received codeword per row
+            M (int): Unused parameter for compatibility (default: None)
 
         Returns:
-            list[int]: Complete codeword with calculated parity bits in correct positions.
+            np.ndarray: Bit matrix of shape (N, k), one decoded word per row.
         """
-        k = len(s)
+        C = np.asarray(C, dtype=np.uint8)
+        tables = _hamming_tables(_data_bits_for_bus_size(C.shape[1]))
+        if tables.n > 64:
+            return super().decode_batch(C, M)
+
+        h = pack_rows(C[:, :tables.n])
+        syndrome = tables.check.mul_packed(h)
+
+        h ^= np.asarray(tables.flip_masks, dtype=np.uint64)[syndrome]
+        return unpack_rows(_extract_data(h, tables), tables.k)
+
+
+class _HammingTables(NamedTuple):
+    """
+    Implements: Precomputed generator and parity-check structure of the Hamming code for one k.
+                Bit p-1 of a packed codeword (shielding bits excluded) holds Hamming position p.
+
+    Args:
+        k (int): Number of data bits
+        r (int): Number of parity bits
+        n (int): Hamming codeword length (k + r)
+        runs (tuple): (data_shift, code_shift, mask) for each run of consecutive data positions
+        check (GF2Matrix): Parity-check matrix, row i (from the bottom) covers the positions
+                           with bit i set, so the packed syndrome of a single error is its position
+        flip_masks (tuple): Syndrome -> packed single-bit correction mask (0 if none)
+
+    Returns:
+        None (container definition)
+    """
+    k: int
+    r: int
+    n: int
+    runs: tuple
+    check: GF2Matrix
+    flip_masks: tuple
+
+
+@lru_cache(maxsize=64)
+def _hamming_tables(k) -> _HammingTables:
+    """
+    Implements: Construction of the Hamming code tables for k data bits, cached per k.
+
+    Args:
+        k (int): Number of data bits
+
+    Returns:
+        _HammingTables: Precomputed tables for encoding and decoding.
+    """
+    r = 0
+    while 2 ** r < k + r + 1:
+        r += 1
+    n = k + r
 
-        # For finding r-th parity bit, iterate [0,r-1]
-        for i in range(self.r):
-            val = 0
-            for j in range(1, k + 1):
+    # Data bits fill the positions between consecutive powers of two, LSB first
+    runs = []
+    data_shift = 0
+    for i in range(1, r):
+        first = (1 << i) + 1
+        last = min((1 << (i + 1)) - 1, n)
+        width = last - first + 1
+        if width > 0:
+            runs.append((data_shift, first - 1, (1 << width) - 1))
+            data_shift += width
 
-                # If position has 1 in i-th significant pos - Bitwise OR the value
-                if (j & (2**i) == (2**i)):
-                    val = val ^ int(s[-1 * j])
-                    # -1 * j is given since array is reversed
+    # Column j is bit n-1-j of a packed codeword, i.e. Hamming position n-j
+    check = GF2Matrix([[((n - j) >> (r - 1 - row)) & 1 for j in range(n)] for row in range(r)])
 
-            s[k - (2**i)] = val
+    # Syndrome of a single-bit error is its position; larger syndromes are uncorrectable
+    flip_masks = tuple((1 << (s - 1)) if 0 < s <= n else 0 for s in range(1 << r))
 
-        return s
\ No newline at end of file
+    return _HammingTables(k, r, n, tuple(runs), check, flip_masks)
+
+
+@lru_cache(maxsize=64)
+def _data_bits_for_bus_size(n_bus) -> int:
+    """
+    Implements: Recovery of the number of data bits k from a HammingX bus width k + 2r - 1.
+
+    Args:
+        n_bus (int): HammingX bus width
+
+    Returns:
+        int: Number of data bits k.
+    """
+    for k in range(1, n_bus + 1):
+        tables = _hamming_tables(k)
+        if tables.n + tables.r - 1 == n_bus:
+            return k
+    raise ValueError(f"No HammingX code has a bus width of {n_bus} bits")
+
+
+def _place_data(data, tables):
+    """
+    Implements: Placement of packed data bits into the non-power-of-two Hamming positions,
+                for a Python int or a uint64 NumPy array.
+
+    Args:
+        data (int | np.ndarray): Packed data word(s)
+        tables (_HammingTables): Hamming code tables
+
+    Returns:
+        int | np.ndarray: Packed codeword(s) with zero parity bits.
+    """
+    if isinstance(data, np.ndarray):
+        h = np.zeros_like(data)
+        for data_shift, code_shift, mask in tables.runs:
+            h |= ((data >> np.uint64(data_shift)) & np.uint64(mask)) << np.uint64(code_shift)
+        return h
+
+    h = 0
+    for data_shift, code_shift, mask in tables.runs:
+        h |= ((data >> data_shift) & mask) << code_shift
+    return h
+
+
+def _extract_data(h, tables):
+    """
+    Implements: Extraction of the packed data bits from packed Hamming codeword(s),
+                inverse of _place_data.
+
+    Args:
+        h (int | np.ndarray): Packed codeword(s)
+        tables (_HammingTables): Hamming code tables
+
+    Returns:
+        int | np.ndarray: Packed data word(s).
+    """
+    if isinstance(h, np.ndarray):
+        data = np.zeros_like(h)
+        for data_shift, code_shift, mask in tables.runs:
+            data |= ((h >> np.uint64(code_shift)) & np.uint64(mask)) << np.uint64(data_shift)
+        return data
+
+    data = 0
+    for data_shift, code_shift, mask in tables.runs:
+        data |= ((h >> code_shift) & mask) << data_shift
+    return data
@@ -10,7 +10,6 @@
 
 
 import numpy as np
-import pandas as pd
 
 def return_H_V() -> np.ndarray:
     """Return the generated H_V matrix (6×13)"""
@@ -37,6 +36,8 @@ def return_H_U() -> np.ndarray:
 
 def display_H_matrix(H_matrix: np.ndarray) -> None:
     """Display the H matrix in a formatted way using pandas"""
+    import pandas as pd  # Only needed for display, kept off the import path of the encoder
+    
     print("H Matrix:")
     print("=" * 80)
     
@@ -0,0 +1,288 @@
+"""
+======================================================
+    Power Efficient Error Correction Encoding for
+            On-Chip Interconnection Links
+
+            Shlomit Lenefsky & Omri Triki
+                        06.2025
+======================================================
+"""
+
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+import numpy as np
+from .matrix_generation.hv_greedy_algorithm import generate_hv_matrix_entry_point
+from .matrix_generation.hv_search import minimal_hv
+from .matrix_generation.hu_generator import generate_hu_entry_point
+from .matrix_generation.generate_lut import precompute_coset_leaders, leaders_to_table
+
+# Generated matrices and coset-leader tables, one artifact directory of .npy files per parameter set
+CACHE_DIR = Path(__file__).parent / "matrix_generation" / "cache"
+DEFAULT_SEED = 42         # Seed used by matrix_generation/main.py
+MAX_SYNDROME_BITS = 12    # Largest syndrome length tried when r is chosen automatically
+ARTIFACT_VERSION = 2      # Part of every artifact key; bump when a generation algorithm changes its output
+
+
+def load_code(k, r=None, n_V=None, seed=DEFAULT_SEED, cache_dir=CACHE_DIR, hv_search_time=None) -> tuple:
+    """
+    Implements: Construction of a syndrome-based code H = [H_U | H_V] for k information bits
+                with the matrix_generation algorithms (greedy H_V, H_U in the span of H_V,
+                coset leaders of H_V). Each parameter set is generated once and then loaded
+                from the on-disk cache.
+
+    Args:
+        k (int): Number of information bits (columns of H_U)
+        r (int): Syndrome length (rows of H); if None, the smallest r whose syndrome space
+                 leaves room for k distinct H_U columns
+        n_V (int): Number of redundancy bits (columns of H_V); if None, as many as the greedy
+                   algorithm needs to express every syndrome as a sum of at most 2 columns
+        seed (int): Random seed of the generation algorithms
+        cache_dir (Path): Directory of the cached artifacts (one directory of .npy files each)
+        hv_search_time (float): With n_V None, seconds of branch-and-bound search for an H_V with
+                                fewer columns than the greedy one (default: None, greedy only)
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: H_U (r × k), H_V (r × n_V) and the coset-leader
+                                                   table (2^r × n_V) indexed by packed syndrome.
+    """
+    if r is None:
+        r = _smallest_syndrome_length(k, n_V, seed, cache_dir, hv_search_time)
+
+    params = code_params(k, r, n_V, seed, hv_search_time)
+    data = load_artifact(params, cache_dir)
+    if data is not None:
+        return data["H_U"], data["H_V"], data["coset_leader_table"]
+
+    H_V = load_hv(r, n_V, seed, cache_dir, hv_search_time)
+    capacity = (1 << r) - 1 - H_V.shape[1]
+    if capacity < k:
+        raise ValueError(f"A {r}-bit syndrome with {H_V.shape[1]} redundancy bits leaves room for "
+                         f"{capacity} information bits, {k} were requested")
+
+    logging.info(f"Generating syndrome-based code for k={k}, r={r}, n_V={H_V.shape[1]} (seed {seed})")
+    H_U = generate_hu_entry_point(H_V, hu_cols=k, seed=seed, verbose=False)
+    if H_U is None:
+        raise RuntimeError(f"H_U generation failed for k={k}, r={r}, n_V={H_V.shape[1]}")
+    leader_table = leaders_to_table(precompute_coset_leaders(H_V, verbose=False))
+
+    path = save_artifact(params, cache_dir, H_U=H_U, H_V=H_V, coset_leader_table=leader_table)
+    logging.info(f"Cached syndrome-based code to {path}")
+    return H_U, H_V, leader_table
+
+
+def load_hv(r, n_V=None, seed=DEFAULT_SEED, cache_dir=CACHE_DIR, hv_search_time=None) -> np.ndarray:
+    """
+    Implements: Greedy generation of H_V = [I_r | H_extra], cached on disk per (r, n_V, seed).
+                With n_V None and a search time, the greedy H_V is the starting point of a
+                branch-and-bound search for fewer columns, and the best H_V found is cached.
+
+    Args:
+        r (int): Syndrome length (rows of H_V)
+        n_V (int): Number of columns of H_V, or None for as many as the greedy algorithm needs
+        seed (int): Random seed of the greedy algorithm
+        cache_dir (Path): Directory of the cached artifacts (one directory of .npy files each)
+        hv_search_time (float): Seconds of minimal H_V search (default: None, greedy only)
+
+    Returns:
+        np.ndarray: H_V matrix (r × n_V).
+    """
+    if n_V is not None and not r <= n_V < (1 << r):
+        raise ValueError(f"H_V with r={r} rows needs between {r} and {(1 << r) - 1} distinct columns, {n_V} were requested")
+
+    params = hv_params(r, n_V, seed, hv_search_time)
+    data = load_artifact(params, cache_dir)
+    if data is not None:
+        return data["H_V"]
+
+    if n_V is None and hv_search_time:
+        logging.info(f"Searching for a minimal H_V for r={r} ({hv_search_time} s)")
+        result = minimal_hv(r, time_limit=hv_search_time, seed=seed)
+        logging.info(f"H_V for r={r}: {result.H_V.shape[1]} columns"
+                     + (" (minimal)" if result.proven_optimal else f" (at least {result.lower_bound} needed)"))
+        save_artifact(params, cache_dir, H_V=result.H_V)
+        return result.H_V
+
+    logging.info(f"Generating H_V for r={r}, n_V={_width_key(n_V)} (seed {seed})")
+    num_extra = None if n_V is None else n_V - r
+    result = generate_hv_matrix_entry_point(seed=seed, verbose=False, m=r, num_extra=num_extra)
+    if result is None:
+        raise ValueError(f"No H_V with r={r} and n_V={n_V} expresses every syndrome as a sum of at most 2 columns")
+    H_V = result[0]
+
+    save_artifact(params, cache_dir, H_V=H_V)
+    return H_V
+
+
+def code_params(k, r, n_V=None, seed=DEFAULT_SEED, hv_search_time=None) -> dict:
+    """
+    Implements: Generation parameters of a complete code, the content address of its artifact.
+
+    Args:
+        k (int): Number of information bits
+        r (int): Syndrome length
+        n_V (int): Number of redundancy bits, or None for the greedy minimum
+        seed (int): Random seed of the generation algorithms
+        hv_search_time (float): Seconds of minimal H_V search (default: None, greedy only)
+
+    Returns:
+        dict: Parameters as stored with the artifact.
+    """
+    return {**hv_params(r, n_V, seed, hv_search_time), "kind": "code", "k": k}
+
+
+def hv_params(r, n_V=None, seed=DEFAULT_SEED, hv_search_time=None) -> dict:
+    """
+    Implements: Generation parameters of an H_V matrix, the content address of its artifact.
+
+    Args:
+        r (int): Syndrome length
+        n_V (int): Number of redundancy bits, or None for the greedy minimum
+        seed (int): Random seed of the greedy algorithm
+        hv_search_time (float): Seconds of minimal H_V search (default: None, greedy only)
+
+    Returns:
+        dict: Parameters as stored with the artifact.
+    """
+    params = {"kind": "hv", "r": r, "n_V": _width_key(n_V, hv_search_time), "seed": seed}
+    if n_V is None and hv_search_time:
+        params["hv_search_time"] = hv_search_time
+    return params
+
+
+def annealed_hu_params(H_V, k, workload) -> dict:
+    """
+    Implements: Parameters of an H_U optimized for a workload (see hu_annealing), the content
+                address of its artifact. The code is identified by its H_V itself, since the same
+                H_V can come from several generation parameter sets (or from H_matrix.py).
+
+    Args:
+        H_V (np.ndarray): H_V the H_U was optimized with
+        k (int): Number of information bits
+        workload (str): Workload identifier, e.g. array_digest of the trace
+
+    Returns:
+        dict: Parameters as stored with the artifact.
+    """
+    return {"kind": "hu_annealed", "H_V": array_digest(H_V), "k": k, "workload": workload}
+
+
+def load_annealed_hu(H_V, k, workload, cache_dir=CACHE_DIR) -> np.ndarray:
+    """
+    Implements: Lookup of a cached workload-optimized H_U, to be passed to SyndromeBasedEncoder(H_U=...).
+
+    Args:
+        H_V (np.ndarray): H_V of the code
+        k (int): Number of information bits
+        workload (str): Workload identifier the H_U was stored under
+        cache_dir (Path): Directory of the cached artifacts (one directory of .npy files each)
+
+    Returns:
+        np.ndarray: H_U (r × k), or None if none was stored.
+    """
+    artifact = load_artifact(annealed_hu_params(H_V, k, workload), cache_dir)
+    return None if artifact is None else artifact["H_U"]
+
+
+def array_digest(array) -> str:
+    """Short content hash of an array's shape and bits, used as an artifact key"""
+    array = np.ascontiguousarray(array, dtype=np.uint8)
+    return hashlib.sha256(repr(array.shape).encode() + array.tobytes()).hexdigest()[:16]
+
+
+def artifact_path(params, cache_dir=CACHE_DIR) -> Path:
+    """
+    Implements: Content-addressed location of an artifact: the artifact kind followed by a hash of
+                its generation parameters and ARTIFACT_VERSION.
+
+    Args:
+        params (dict): Generation parameters, including "kind"
+        cache_dir (Path): Directory of the cached artifacts (one directory of .npy files each)
+
+    Returns:
+        Path: Artifact directory.
+    """
+    key = json.dumps({**params, "version": ARTIFACT_VERSION}, sort_keys=True)
+    return Path(cache_dir) / f"{params['kind']}_{hashlib.sha256(key.encode()).hexdigest()[:16]}"
+
+
+def load_artifact(params, cache_dir=CACHE_DIR) -> dict:
+    """
+    Implements: Lazy loading of a cached artifact: every array is memory-mapped read-only, so only
+                the pages that are used are read from disk.
+
+    Args:
+        params (dict): Generation parameters, including "kind"
+        cache_dir (Path): Directory of the cached artifacts (one directory of .npy files each)
+
+    Returns:
+        dict: Arrays by name, or None if no matching artifact exists.
+    """
+    path = artifact_path(params, cache_dir)
+    if not path.is_dir():
+        return None
+    return {file.stem: np.load(file, mmap_mode="r") for file in path.glob("*.npy")}
+
+
+def save_artifact(params, cache_dir=CACHE_DIR, **arrays) -> Path:
+    """
+    Implements: Storage of an artifact as one .npy file per array plus its parameters as JSON,
+                written to a temporary directory and renamed into place, so that concurrent
+                writers and readers never see a partial artifact.
+
+    Args:
+        params (dict): Generation parameters, including "kind"
+        cache_dir (Path): Directory of the cached artifacts (one directory of .npy files each)
+        **arrays (np.ndarray): Arrays to store, by name
+
+    Returns:
+        Path: Artifact directory.
+    """
+    path = artifact_path(params, cache_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=f".{path.name}.", dir=path.parent))
+    staging.chmod(0o755)  # mkdtemp creates a private directory
+    for name, array in arrays.items():
+        np.save(staging / f"{name}.npy", np.ascontiguousarray(array))
+    (staging / "params.json").write_text(json.dumps({**params, "version": ARTIFACT_VERSION}, indent=2))
+    try:
+        os.rename(staging, path)
+    except OSError:
+        # Another process stored the same artifact first
+        shutil.rmtree(staging, ignore_errors=True)
+    return path
+
+
+def _smallest_syndrome_length(k, n_V, seed, cache_dir, hv_search_time=None) -> int:
+    """
+    Implements: Selection of the smallest syndrome length r for which H_V leaves at least k
+                nonzero syndromes free for distinct H_U columns (r = 6 for k = 32).
+
+    Args:
+        k (int): Number of information bits
+        n_V (int): Number of redundancy bits, or None for the greedy minimum
+        seed (int): Random seed of the greedy algorithm
+        cache_dir (Path): Directory of the cached artifacts (one directory of .npy files each)
+        hv_search_time (float): Seconds of minimal H_V search per r (default: None, greedy only)
+
+    Returns:
+        int: Syndrome length r.
+    """
+    for r in range(2, MAX_SYNDROME_BITS + 1):
+        if n_V is not None and not r <= n_V < (1 << r) - k:
+            continue
+        if (1 << r) - 1 - load_hv(r, n_V, seed, cache_dir, hv_search_time).shape[1] >= k:
+            return r
+    raise ValueError(f"No syndrome length up to {MAX_SYNDROME_BITS} bits fits k={k} with n_V={n_V}")
+
+
+def _width_key(n_V, hv_search_time=None) -> str:
+    """Artifact parameter of the redundancy width ("min" for the greedy minimum, "search" for the searched one)"""
+    if n_V is None:
+        return "search" if hv_search_time else "min"
+    return str(n_V)
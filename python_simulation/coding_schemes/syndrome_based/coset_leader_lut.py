@@ -10,78 +10,116 @@
 
 
 # Coset Leaders Lookup Table
-# Format: {syndrome_tuple: np.array(v_bits)}
+# Format: COSET_LEADER_TABLE[packed_syndrome] = v_bits (first syndrome bit is the MSB)
+
+import functools
 
 import numpy as np
 
-COSET_LEADERS = {
-    (np.int64(0), np.int64(0), np.int64(0), np.int64(0), np.int64(0), np.int64(0)): np.array([0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]), # (0,0,0,0,0,0) → [0,0,0,0,0,0,0,0,0,0,0,0,0]
-    (np.int64(0), np.int64(0), np.int64(0), np.int64(0), np.int64(0), np.int64(1)): np.array([0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0]), # (0,0,0,0,0,1) → [0,0,0,0,0,1,0,0,0,0,0,0,0]
-    (np.int64(0), np.int64(0), np.int64(0), np.int64(0), np.int64(1), np.int64(0)): np.array([0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0]), # (0,0,0,0,1,0) → [0,0,0,0,1,0,0,0,0,0,0,0,0]
-    (np.int64(0), np.int64(0), np.int64(0), np.int64(0), np.int64(1), np.int64(1)): np.array([0, 0, 0, 0, 1, 1, 0, 0, 0, 0, 0, 0, 0]), # (0,0,0,0,1,1) → [0,0,0,0,1,1,0,0,0,0,0,0,0]
-    (np.int64(0), np.int64(0), np.int64(0), np.int64(1), np.int64(0), np.int64(0)): np.array([0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0]), # (0,0,0,1,0,0) → [0,0,0,1,0,0,0,0,0,0,0,0,0]
-    (np.int64(0), np.int64(0), np.int64(0), np.int64(1), np.int64(0), np.int64(1)): np.array([0, 0, 0, 1, 0, 1, 0, 0, 0, 0, 0, 0, 0]), # (0,0,0,1,0,1) → [0,0,0,1,0,1,0,0,0,0,0,0,0]
-    (np.int64(0), np.int64(0), np.int64(0), np.int64(1), np.int64(1), np.int64(0)): np.array([0, 0, 0, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0]), # (0,0,0,1,1,0) → [0,0,0,1,1,0,0,0,0,0,0,0,0]
-    (np.int64(0), np.int64(0), np.int64(0), np.int64(1), np.int64(1), np.int64(1)): np.array([0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0]), # (0,0,0,1,1,1) → [0,0,1,0,0,0,1,0,0,0,0,0,0]
-    (np.int64(0), np.int64(0), np.int64(1), np.int64(0), np.int64(0), np.int64(0)): np.array([0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]), # (0,0,1,0,0,0) → [0,0,1,0,0,0,0,0,0,0,0,0,0]
-    (np.int64(0), np.int64(0), np.int64(1), np.int64(0), np.int64(0), np.int64(1)): np.array([0, 0, 1, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0]), # (0,0,1,0,0,1) → [0,0,1,0,0,1,0,0,0,0,0,0,0]
-    (np.int64(0), np.int64(0), np.int64(1), np.int64(0), np.int64(1), np.int64(0)): np.array([0, 0, 1, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0]), # (0,0,1,0,1,0) → [0,0,1,0,1,0,0,0,0,0,0,0,0]
-    (np.int64(0), np.int64(0), np.int64(1), np.int64(0), np.int64(1), np.int64(1)): np.array([0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0, 0, 0]), # (0,0,1,0,1,1) → [0,0,0,1,0,0,1,0,0,0,0,0,0]
-    (np.int64(0), np.int64(0), np.int64(1), np.int64(1), np.int64(0), np.int64(0)): np.array([0, 0, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0]), # (0,0,1,1,0,0) → [0,0,1,1,0,0,0,0,0,0,0,0,0]
-    (np.int64(0), np.int64(0), np.int64(1), np.int64(1), np.int64(0), np.int64(1)): np.array([0, 0, 0, 0, 1, 0, 1, 0, 0, 0, 0, 0, 0]), # (0,0,1,1,0,1) → [0,0,0,0,1,0,1,0,0,0,0,0,0]
-    (np.int64(0), np.int64(0), np.int64(1), np.int64(1), np.int64(1), np.int64(0)): np.array([0, 0, 0, 0, 0, 1, 1, 0, 0, 0, 0, 0, 0]), # (0,0,1,1,1,0) → [0,0,0,0,0,1,1,0,0,0,0,0,0]
-    (np.int64(0), np.int64(0), np.int64(1), np.int64(1), np.int64(1), np.int64(1)): np.array([0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0]), # (0,0,1,1,1,1) → [0,0,0,0,0,0,1,0,0,0,0,0,0]
-    (np.int64(0), np.int64(1), np.int64(0), np.int64(0), np.int64(0), np.int64(0)): np.array([0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]), # (0,1,0,0,0,0) → [0,1,0,0,0,0,0,0,0,0,0,0,0]
-    (np.int64(0), np.int64(1), np.int64(0), np.int64(0), np.int64(0), np.int64(1)): np.array([0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0]), # (0,1,0,0,0,1) → [0,1,0,0,0,1,0,0,0,0,0,0,0]
-    (np.int64(0), np.int64(1), np.int64(0), np.int64(0), np.int64(1), np.int64(0)): np.array([0, 1, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0]), # (0,1,0,0,1,0) → [0,1,0,0,1,0,0,0,0,0,0,0,0]
-    (np.int64(0), np.int64(1), np.int64(0), np.int64(0), np.int64(1), np.int64(1)): np.array([1, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0]), # (0,1,0,0,1,1) → [1,0,0,0,0,0,0,1,0,0,0,0,0]
-    (np.int64(0), np.int64(1), np.int64(0), np.int64(1), np.int64(0), np.int64(0)): np.array([0, 1, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0]), # (0,1,0,1,0,0) → [0,1,0,1,0,0,0,0,0,0,0,0,0]
-    (np.int64(0), np.int64(1), np.int64(0), np.int64(1), np.int64(0), np.int64(1)): np.array([0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0]), # (0,1,0,1,0,1) → [0,0,0,0,0,0,0,0,1,0,0,0,0]
-    (np.int64(0), np.int64(1), np.int64(0), np.int64(1), np.int64(1), np.int64(0)): np.array([0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0]), # (0,1,0,1,1,0) → [0,0,1,0,0,0,0,0,0,0,1,0,0]
-    (np.int64(0), np.int64(1), np.int64(0), np.int64(1), np.int64(1), np.int64(1)): np.array([0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0]), # (0,1,0,1,1,1) → [0,0,0,0,1,0,0,0,1,0,0,0,0]
-    (np.int64(0), np.int64(1), np.int64(1), np.int64(0), np.int64(0), np.int64(0)): np.array([0, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]), # (0,1,1,0,0,0) → [0,1,1,0,0,0,0,0,0,0,0,0,0]
-    (np.int64(0), np.int64(1), np.int64(1), np.int64(0), np.int64(0), np.int64(1)): np.array([0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 0, 0, 0]), # (0,1,1,0,0,1) → [0,0,0,0,0,0,0,1,0,1,0,0,0]
-    (np.int64(0), np.int64(1), np.int64(1), np.int64(0), np.int64(1), np.int64(0)): np.array([0, 0, 0, 0, 0, 0, 1, 0, 1, 0, 0, 0, 0]), # (0,1,1,0,1,0) → [0,0,0,0,0,0,1,0,1,0,0,0,0]
-    (np.int64(0), np.int64(1), np.int64(1), np.int64(0), np.int64(1), np.int64(1)): np.array([0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1]), # (0,1,1,0,1,1) → [0,0,0,0,0,0,0,0,0,0,0,0,1]
-    (np.int64(0), np.int64(1), np.int64(1), np.int64(1), np.int64(0), np.int64(0)): np.array([0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 1, 0, 0]), # (0,1,1,1,0,0) → [0,0,0,0,1,0,0,0,0,0,1,0,0]
-    (np.int64(0), np.int64(1), np.int64(1), np.int64(1), np.int64(0), np.int64(1)): np.array([0, 0, 1, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0]), # (0,1,1,1,0,1) → [0,0,1,0,0,0,0,0,1,0,0,0,0]
-    (np.int64(0), np.int64(1), np.int64(1), np.int64(1), np.int64(1), np.int64(0)): np.array([0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0]), # (0,1,1,1,1,0) → [0,0,0,0,0,0,0,0,0,0,1,0,0]
-    (np.int64(0), np.int64(1), np.int64(1), np.int64(1), np.int64(1), np.int64(1)): np.array([0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0]), # (0,1,1,1,1,1) → [0,1,0,0,0,0,1,0,0,0,0,0,0]
-    (np.int64(1), np.int64(0), np.int64(0), np.int64(0), np.int64(0), np.int64(0)): np.array([1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]), # (1,0,0,0,0,0) → [1,0,0,0,0,0,0,0,0,0,0,0,0]
-    (np.int64(1), np.int64(0), np.int64(0), np.int64(0), np.int64(0), np.int64(1)): np.array([1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0]), # (1,0,0,0,0,1) → [1,0,0,0,0,1,0,0,0,0,0,0,0]
-    (np.int64(1), np.int64(0), np.int64(0), np.int64(0), np.int64(1), np.int64(0)): np.array([1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0]), # (1,0,0,0,1,0) → [1,0,0,0,1,0,0,0,0,0,0,0,0]
-    (np.int64(1), np.int64(0), np.int64(0), np.int64(0), np.int64(1), np.int64(1)): np.array([0, 1, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0]), # (1,0,0,0,1,1) → [0,1,0,0,0,0,0,1,0,0,0,0,0]
-    (np.int64(1), np.int64(0), np.int64(0), np.int64(1), np.int64(0), np.int64(0)): np.array([1, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0]), # (1,0,0,1,0,0) → [1,0,0,1,0,0,0,0,0,0,0,0,0]
-    (np.int64(1), np.int64(0), np.int64(0), np.int64(1), np.int64(0), np.int64(1)): np.array([0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0]), # (1,0,0,1,0,1) → [0,0,0,0,0,0,1,0,0,1,0,0,0]
-    (np.int64(1), np.int64(0), np.int64(0), np.int64(1), np.int64(1), np.int64(0)): np.array([0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0, 0]), # (1,0,0,1,1,0) → [0,0,0,0,0,0,0,1,1,0,0,0,0]
-    (np.int64(1), np.int64(0), np.int64(0), np.int64(1), np.int64(1), np.int64(1)): np.array([0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0]), # (1,0,0,1,1,1) → [0,0,0,0,0,0,0,0,0,0,1,1,0]
-    (np.int64(1), np.int64(0), np.int64(1), np.int64(0), np.int64(0), np.int64(0)): np.array([1, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]), # (1,0,1,0,0,0) → [1,0,1,0,0,0,0,0,0,0,0,0,0]
-    (np.int64(1), np.int64(0), np.int64(1), np.int64(0), np.int64(0), np.int64(1)): np.array([0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0]), # (1,0,1,0,0,1) → [0,1,0,0,0,0,0,0,0,0,0,1,0]
-    (np.int64(1), np.int64(0), np.int64(1), np.int64(0), np.int64(1), np.int64(0)): np.array([0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0]), # (1,0,1,0,1,0) → [0,0,0,0,0,0,0,0,0,1,0,0,0]
-    (np.int64(1), np.int64(0), np.int64(1), np.int64(0), np.int64(1), np.int64(1)): np.array([0, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0]), # (1,0,1,0,1,1) → [0,0,0,0,0,1,0,0,0,1,0,0,0]
-    (np.int64(1), np.int64(0), np.int64(1), np.int64(1), np.int64(0), np.int64(0)): np.array([0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 0]), # (1,0,1,1,0,0) → [0,0,0,0,0,0,0,0,1,0,0,1,0]
-    (np.int64(1), np.int64(0), np.int64(1), np.int64(1), np.int64(0), np.int64(1)): np.array([0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 0, 0]), # (1,0,1,1,0,1) → [0,0,0,0,0,0,0,1,0,0,1,0,0]
-    (np.int64(1), np.int64(0), np.int64(1), np.int64(1), np.int64(1), np.int64(0)): np.array([0, 0, 0, 1, 0, 0, 0, 0, 0, 1, 0, 0, 0]), # (1,0,1,1,1,0) → [0,0,0,1,0,0,0,0,0,1,0,0,0]
-    (np.int64(1), np.int64(0), np.int64(1), np.int64(1), np.int64(1), np.int64(1)): np.array([1, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0]), # (1,0,1,1,1,1) → [1,0,0,0,0,0,1,0,0,0,0,0,0]
-    (np.int64(1), np.int64(1), np.int64(0), np.int64(0), np.int64(0), np.int64(0)): np.array([1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]), # (1,1,0,0,0,0) → [1,1,0,0,0,0,0,0,0,0,0,0,0]
-    (np.int64(1), np.int64(1), np.int64(0), np.int64(0), np.int64(0), np.int64(1)): np.array([0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0, 0]), # (1,1,0,0,0,1) → [0,0,0,0,1,0,0,1,0,0,0,0,0]
-    (np.int64(1), np.int64(1), np.int64(0), np.int64(0), np.int64(1), np.int64(0)): np.array([0, 0, 0, 0, 0, 1, 0, 1, 0, 0, 0, 0, 0]), # (1,1,0,0,1,0) → [0,0,0,0,0,1,0,1,0,0,0,0,0]
-    (np.int64(1), np.int64(1), np.int64(0), np.int64(0), np.int64(1), np.int64(1)): np.array([0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0]), # (1,1,0,0,1,1) → [0,0,0,0,0,0,0,1,0,0,0,0,0]
-    (np.int64(1), np.int64(1), np.int64(0), np.int64(1), np.int64(0), np.int64(0)): np.array([0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0]), # (1,1,0,1,0,0) → [0,0,0,0,0,0,0,0,0,1,1,0,0]
-    (np.int64(1), np.int64(1), np.int64(0), np.int64(1), np.int64(0), np.int64(1)): np.array([1, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0]), # (1,1,0,1,0,1) → [1,0,0,0,0,0,0,0,1,0,0,0,0]
-    (np.int64(1), np.int64(1), np.int64(0), np.int64(1), np.int64(1), np.int64(0)): np.array([0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0]), # (1,1,0,1,1,0) → [0,0,0,0,0,0,1,0,0,0,0,1,0]
-    (np.int64(1), np.int64(1), np.int64(0), np.int64(1), np.int64(1), np.int64(1)): np.array([0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0]), # (1,1,0,1,1,1) → [0,0,0,1,0,0,0,1,0,0,0,0,0]
-    (np.int64(1), np.int64(1), np.int64(1), np.int64(0), np.int64(0), np.int64(0)): np.array([0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 1, 0]), # (1,1,1,0,0,0) → [0,0,0,0,0,1,0,0,0,0,0,1,0]
-    (np.int64(1), np.int64(1), np.int64(1), np.int64(0), np.int64(0), np.int64(1)): np.array([0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0]), # (1,1,1,0,0,1) → [0,0,0,0,0,0,0,0,0,0,0,1,0]
-    (np.int64(1), np.int64(1), np.int64(1), np.int64(0), np.int64(1), np.int64(0)): np.array([0, 1, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0]), # (1,1,1,0,1,0) → [0,1,0,0,0,0,0,0,0,1,0,0,0]
-    (np.int64(1), np.int64(1), np.int64(1), np.int64(0), np.int64(1), np.int64(1)): np.array([0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0]), # (1,1,1,0,1,1) → [0,0,1,0,0,0,0,1,0,0,0,0,0]
-    (np.int64(1), np.int64(1), np.int64(1), np.int64(1), np.int64(0), np.int64(0)): np.array([0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0, 0, 0]), # (1,1,1,1,0,0) → [0,0,0,0,0,0,1,1,0,0,0,0,0]
-    (np.int64(1), np.int64(1), np.int64(1), np.int64(1), np.int64(0), np.int64(1)): np.array([0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1, 0]), # (1,1,1,1,0,1) → [0,0,0,1,0,0,0,0,0,0,0,1,0]
-    (np.int64(1), np.int64(1), np.int64(1), np.int64(1), np.int64(1), np.int64(0)): np.array([1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0]), # (1,1,1,1,1,0) → [1,0,0,0,0,0,0,0,0,0,1,0,0]
-    (np.int64(1), np.int64(1), np.int64(1), np.int64(1), np.int64(1), np.int64(1)): np.array([0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0]), # (1,1,1,1,1,1) → [0,0,0,0,0,0,0,0,1,1,0,0,0]
-}
+COSET_LEADER_TABLE = np.array([
+    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],  # 000000
+    [0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0],  # 000001
+    [0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0],  # 000010
+    [0, 0, 0, 0, 1, 1, 0, 0, 0, 0, 0, 0, 0],  # 000011
+    [0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0],  # 000100
+    [0, 0, 0, 1, 0, 1, 0, 0, 0, 0, 0, 0, 0],  # 000101
+    [0, 0, 0, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0],  # 000110
+    [0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0],  # 000111
+    [0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],  # 001000
+    [0, 0, 1, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0],  # 001001
+    [0, 0, 1, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0],  # 001010
+    [0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0, 0, 0],  # 001011
+    [0, 0, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0],  # 001100
+    [0, 0, 0, 0, 1, 0, 1, 0, 0, 0, 0, 0, 0],  # 001101
+    [0, 0, 0, 0, 0, 1, 1, 0, 0, 0, 0, 0, 0],  # 001110
+    [0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0],  # 001111
+    [0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],  # 010000
+    [0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0],  # 010001
+    [0, 1, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0],  # 010010
+    [1, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0],  # 010011
+    [0, 1, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0],  # 010100
+    [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0],  # 010101
+    [0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0],  # 010110
+    [0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0],  # 010111
+    [0, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],  # 011000
+    [0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 0, 0, 0],  # 011001
+    [0, 0, 0, 0, 0, 0, 1, 0, 1, 0, 0, 0, 0],  # 011010
+    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1],  # 011011
+    [0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 1, 0, 0],  # 011100
+    [0, 0, 1, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0],  # 011101
+    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0],  # 011110
+    [0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0],  # 011111
+    [1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],  # 100000
+    [1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0],  # 100001
+    [1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0],  # 100010
+    [0, 1, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0],  # 100011
+    [1, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0],  # 100100
+    [0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0],  # 100101
+    [0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0, 0],  # 100110
+    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0],  # 100111
+    [1, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],  # 101000
+    [0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0],  # 101001
+    [0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0],  # 101010
+    [0, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0],  # 101011
+    [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 0],  # 101100
+    [0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 0, 0],  # 101101
+    [0, 0, 0, 1, 0, 0, 0, 0, 0, 1, 0, 0, 0],  # 101110
+    [1, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0],  # 101111
+    [1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],  # 110000
+    [0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0, 0],  # 110001
+    [0, 0, 0, 0, 0, 1, 0, 1, 0, 0, 0, 0, 0],  # 110010
+    [0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0],  # 110011
+    [0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0],  # 110100
+    [1, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0],  # 110101
+    [0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0],  # 110110
+    [0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0],  # 110111
+    [0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 1, 0],  # 111000
+    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0],  # 111001
+    [0, 1, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0],  # 111010
+    [0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0],  # 111011
+    [0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0, 0, 0],  # 111100
+    [0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1, 0],  # 111101
+    [1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0],  # 111110
+    [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0],  # 111111
+], dtype=np.uint8)
+
+COSET_LEADER_TABLE.setflags(write=False)
+
+SYNDROME_BITS = COSET_LEADER_TABLE.shape[0].bit_length() - 1
+REDUNDANCY_BITS = COSET_LEADER_TABLE.shape[1]
+
+# Coset leaders packed into integers, first bit of v as the MSB
+COSET_LEADER_WORDS = (
+    COSET_LEADER_TABLE.astype(np.uint64) << np.arange(REDUNDANCY_BITS - 1, -1, -1, dtype=np.uint64)
+).sum(axis=1, dtype=np.uint64)
+COSET_LEADER_WORDS.setflags(write=False)
+
+@functools.cache
+def _coset_leaders() -> dict:
+    """Compatibility view {syndrome_tuple: np.array(v_bits)}, built on first use"""
+    return {
+        tuple(np.int64((s >> (SYNDROME_BITS - 1 - i)) & 1) for i in range(SYNDROME_BITS)): COSET_LEADER_TABLE[s]
+        for s in range(COSET_LEADER_TABLE.shape[0])
+    }
+
+
+def __getattr__(name):
+    """Build COSET_LEADERS lazily on first access"""
+    if name == "COSET_LEADERS":
+        return _coset_leaders()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def get_leader(s_key: tuple):
     """Get coset leader for given syndrome"""
-    return COSET_LEADERS.get(s_key, None)
+    return _coset_leaders().get(s_key, None)
+
+
+def get_leader_packed(syndrome: int) -> int:
+    """Get packed coset leader for given packed syndrome"""
+    return int(COSET_LEADER_WORDS[syndrome])
+
 
+def get_leaders(syndromes: np.ndarray) -> np.ndarray:
+    """Get packed coset leaders for a block of packed syndromes (one gather)"""
+    return COSET_LEADER_WORDS[syndromes]
@@ -3,7 +3,8 @@ Generate Syndrome Lookup Table (LUT)
 ====================================
 
 This module generates a coset leaders lookup table for syndrome-based encoding.
-The LUT maps each possible syndrome to a minimum-weight coset leader.
+The LUT maps each possible syndrome to a minimum-weight coset leader, found by a
+search over v in increasing weight that stops once every syndrome is covered.
 
 Usage:
     python generate_lut.py [H_V_file] [output_file]
@@ -14,43 +15,37 @@ Usage:
 import numpy as np
 from typing import Dict, Tuple
 from pathlib import Path
+from coding_schemes.bit_ops import int_to_bits
+from coding_schemes.gf2 import GF2Matrix
 
 
-def precompute_coset_leaders(H_V: np.ndarray, output_file: str = None) -> Dict[Tuple, np.ndarray]:
+def precompute_coset_leaders(H_V: np.ndarray, output_file: str = None, verbose: bool = True) -> Dict[Tuple, np.ndarray]:
     """
     Precompute coset leaders: minimum-weight v for each syndrome s = H_V * v^T
     
     Args:
         H_V: Redundancy matrix (6×13)
         output_file: Path to output file (optional)
+        verbose: Whether to print progress information
         
     Returns:
         Dictionary mapping syndrome tuples to coset leader vectors
     """
-    n_V = H_V.shape[1]  # Number of columns in H_V (13)
+    r, n_V = H_V.shape  # Number of columns in H_V (13)
     
+    if verbose:
+        print(f"Generating coset leaders for H_V matrix of shape {H_V.shape}")    
     leaders = {}
-    
-    print(f"Generating coset leaders for H_V matrix of shape {H_V.shape}")    
-    # Iterate all possible v masks (2^13 combinations)
-    for i in range(1 << n_V):            
-        # Convert integer to binary mask
+    for s, i in enumerate(leader_indices(H_V)):
+        if i < 0:
+            continue
+        # Mask bit j is v[j]
         v_bits = np.array([(i >> j) & 1 for j in range(n_V)])
-        
-        # Compute syndrome s = H_V * v^T
-        s = (H_V @ v_bits) % 2
-        
-        # Convert syndrome to tuple key
-        s_key = tuple(s)
-        
-        # Calculate weight of v
-        weight = np.sum(v_bits)
-        
-        # Store minimum-weight v for this syndrome (tie-break by smaller index)
-        if s_key not in leaders or weight < leaders[s_key][1] or (weight == leaders[s_key][1] and i < leaders[s_key][2]):
-            leaders[s_key] = (v_bits, weight, i)
+        s_key = tuple(np.array(int_to_bits(s, r), dtype=np.uint8))
+        leaders[s_key] = (v_bits, int(v_bits.sum()), i)
     
-    print(f"Generated {len(leaders)} unique syndromes")
+    if verbose:
+        print(f"Generated {len(leaders)} unique syndromes")
     
     # Write coset leaders to file if specified
     if output_file:
@@ -59,29 +54,138 @@ def precompute_coset_leaders(H_V: np.ndarray, output_file: str = None) -> Dict[T
     return leaders
 
 
+def leader_indices(H_V: np.ndarray) -> list:
+    """
+    Coset leader of every packed syndrome by a breadth-first search over the weight of v:
+    the masks of weight 0, 1, 2, ... are visited in increasing order (Gosper's hack), and
+    each syndrome keeps the first mask that reaches it, i.e. the minimum-weight v with the
+    smallest mask. The search stops once every syndrome of the column space is covered,
+    after weight 2 for an Hv that expresses every syndrome with at most 2 columns.
+    
+    Args:
+        H_V: Redundancy matrix (r × n_V)
+        
+    Returns:
+        List of 2^r masks (bit j is v[j]) indexed by packed syndrome, -1 where unreachable
+    """
+    r, n_V = H_V.shape
+    packed_H_V = GF2Matrix(H_V)
+    columns = packed_H_V.column_ints
+    reachable = 1 << packed_H_V.rank()
+    
+    indices = [-1] * (1 << r)  # Python ints, as masks may exceed 64 bits
+    found = 0
+    for weight in range(n_V + 1):
+        mask = (1 << weight) - 1
+        while mask < 1 << n_V and found < reachable:
+            s, rest = 0, mask
+            while rest:
+                low = rest & -rest
+                s ^= columns[low.bit_length() - 1]
+                rest ^= low
+            if indices[s] < 0:
+                indices[s] = mask
+                found += 1
+            if mask == 0:
+                break
+            # Next mask with the same weight
+            low = mask & -mask
+            ripple = mask + low
+            mask = (((ripple ^ mask) >> 2) // low) | ripple
+        if found == reachable:
+            break
+    return indices
+
+
+def leaders_to_table(leaders: Dict[Tuple, np.ndarray]) -> np.ndarray:
+    """
+    Convert coset leaders to a dense table indexed by the packed syndrome
+    (first syndrome bit is the most significant)
+    
+    Args:
+        leaders: Dictionary of coset leaders
+        
+    Returns:
+        Array of shape (2^r, n_V) holding the coset leader of every syndrome
+    """
+    r = len(next(iter(leaders)))
+    n_V = len(next(iter(leaders.values()))[0])
+    
+    table = np.zeros((1 << r, n_V), dtype=np.uint8)
+    for s_key, (v_bits, _, _) in leaders.items():
+        packed = int("".join(str(int(bit)) for bit in s_key), 2)
+        table[packed] = v_bits
+    
+    return table
+
+
+# Accessors shared by coset_leader_lut.py and every generated LUT module
+LUT_ACCESSORS = '''COSET_LEADER_TABLE.setflags(write=False)
+
+SYNDROME_BITS = COSET_LEADER_TABLE.shape[0].bit_length() - 1
+REDUNDANCY_BITS = COSET_LEADER_TABLE.shape[1]
+
+# Coset leaders packed into integers, first bit of v as the MSB
+COSET_LEADER_WORDS = (
+    COSET_LEADER_TABLE.astype(np.uint64) << np.arange(REDUNDANCY_BITS - 1, -1, -1, dtype=np.uint64)
+).sum(axis=1, dtype=np.uint64)
+COSET_LEADER_WORDS.setflags(write=False)
+
+@functools.cache
+def _coset_leaders() -> dict:
+    """Compatibility view {syndrome_tuple: np.array(v_bits)}, built on first use"""
+    return {
+        tuple(np.int64((s >> (SYNDROME_BITS - 1 - i)) & 1) for i in range(SYNDROME_BITS)): COSET_LEADER_TABLE[s]
+        for s in range(COSET_LEADER_TABLE.shape[0])
+    }
+
+
+def __getattr__(name):
+    """Build COSET_LEADERS lazily on first access"""
+    if name == "COSET_LEADERS":
+        return _coset_leaders()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_leader(s_key: tuple):
+    """Get coset leader for given syndrome"""
+    return _coset_leaders().get(s_key, None)
+
+
+def get_leader_packed(syndrome: int) -> int:
+    """Get packed coset leader for given packed syndrome"""
+    return int(COSET_LEADER_WORDS[syndrome])
+
+
+def get_leaders(syndromes: np.ndarray) -> np.ndarray:
+    """Get packed coset leaders for a block of packed syndromes (one gather)"""
+    return COSET_LEADER_WORDS[syndromes]
+'''
+
+
 def write_lut_to_file(leaders: Dict[Tuple, np.ndarray], output_file: str) -> None:
     """
-    Write coset leaders to a Python file
+    Write coset leaders to a Python file as a dense array indexed by packed syndrome
     
     Args:
         leaders: Dictionary of coset leaders
         output_file: Path to output file
     """    
+    table = leaders_to_table(leaders)
+    r = table.shape[0].bit_length() - 1
+    
     with open(output_file, 'w') as f:
         f.write("# Coset Leaders Lookup Table\n")
         f.write("# This file is generated by generate_lut.py\n")
-        f.write("# Format: {syndrome_tuple: np.array(v_bits)}\n\n")
-        f.write("import numpy as np\n\n")
-        f.write("COSET_LEADERS = {\n")
+        f.write("# Format: COSET_LEADER_TABLE[packed_syndrome] = v_bits (first syndrome bit is the MSB)\n\n")
+        f.write("import functools\n\nimport numpy as np\n\n")
+        f.write("COSET_LEADER_TABLE = np.array([\n")
         
-        for s_key, (v_bits, _, _) in leaders.items():
-            v_bits_str = f"np.array({v_bits.tolist()})"
-            f.write(f"    {s_key}: {v_bits_str},\n")
+        for packed, v_bits in enumerate(table):
+            f.write(f"    {v_bits.tolist()},  # {packed:0{r}b}\n")
         
-        f.write("}\n\n")
-        f.write("def get_leader(s_key: tuple):\n")
-        f.write("    \"\"\"Get coset leader for given syndrome\"\"\"\n")
-        f.write("    return COSET_LEADERS.get(s_key, None)\n")
+        f.write("], dtype=np.uint8)\n\n")
+        f.write(LUT_ACCESSORS)
     
     print(f"Successfully wrote LUT to {output_file}")
 
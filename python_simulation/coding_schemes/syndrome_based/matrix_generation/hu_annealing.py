@@ -0,0 +1,225 @@
+"""
+Hu Annealing
+============
+
+This module optimizes the Hu columns of a syndrome-based code for a workload.
+With Δ-syndrome encoding the redundancy wires toggle by the weight of the coset
+leader of Δs = Hu (u_t XOR u_(t-1)), so the cost of Hu is the mean coset-leader
+weight over the data changes of a trace (or sampled from per-bit toggle rates).
+The minimum-transition selection picks a coset member of the same weight, so
+the cost applies to both selection modes.
+
+- Moves: exchange two Hu columns (a new assignment of columns to bit positions)
+  or replace one with an unused vector of the span of Hv (a new selection).
+- Incremental cost: a move only changes the Δ-syndromes of the data changes that
+  toggle the moved bits, so only those are re-evaluated.
+- Multi-start: independent annealing runs with different seeds on a process
+  pool; the best Hu is kept.
+
+Usage (from python_simulation):
+    python -m coding_schemes.syndrome_based.matrix_generation.hu_annealing [k] [trace.npy]
+
+    The trace is a bit matrix with one k-bit word per row. Without a trace, the
+    words of the exhaustive generator mode (a counter) are used. The best Hu is
+    stored in the code cache under the digest of the trace, and the encoder uses it
+    with SyndromeBasedEncoder(k=k, H_U=load_annealed_hu(H_V, k, workload)).
+"""
+
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+import numpy as np
+
+from coding_schemes.bit_ops import int_to_bits
+from coding_schemes.gf2 import GF2Matrix
+
+
+class HuAnnealingResult(NamedTuple):
+    """Outcome of a Hu optimization"""
+    H_U: np.ndarray         # Best Hu found, r × k
+    cost: float             # Expected redundancy transitions per word with the best Hu
+    initial_cost: float     # The same with the initial Hu
+    start_costs: list       # Best cost of every annealing start
+
+
+def trace_deltas(S):
+    """
+    Data changes of a word trace, starting from the all-zero word (the encoder's power-on
+    state), merged into distinct changes with their counts.
+
+    Returns:
+        tuple: (distinct changes as a bit matrix, count of each)
+    """
+    S = np.asarray(S, dtype=np.uint8)
+    D = S ^ np.vstack((np.zeros((1, S.shape[1]), dtype=np.uint8), S[:-1]))
+    return np.unique(D, axis=0, return_counts=True)
+
+
+def sampled_deltas(toggle_rates, num_samples=100000, seed=42):
+    """
+    Data changes with every bit toggling independently at its own rate, merged into
+    distinct changes with their counts.
+
+    Returns:
+        tuple: (distinct changes as a bit matrix, count of each)
+    """
+    rng = np.random.default_rng(seed)
+    rates = np.asarray(toggle_rates, dtype=float)
+    D = (rng.random((num_samples, rates.size)) < rates).astype(np.uint8)
+    return np.unique(D, axis=0, return_counts=True)
+
+
+def leader_weights(leader_table):
+    """Coset-leader weight of every packed Δ-syndrome"""
+    return np.asarray(leader_table, dtype=np.intp).sum(axis=1)
+
+
+def expected_transitions(H_U, weights, D, counts):
+    """Mean redundancy-wire transitions per data change with Hu"""
+    syndromes = _syndromes(GF2Matrix(H_U).column_ints, np.asarray(D, dtype=bool).T)
+    return float((counts * weights[syndromes]).sum() / counts.sum())
+
+
+def _syndromes(columns, toggles):
+    """Packed Δ-syndrome of every data change, one XOR per toggled bit"""
+    syndromes = np.zeros(toggles.shape[1], dtype=np.intp)
+    for column, toggled in zip(columns, toggles):
+        syndromes[toggled] ^= column
+    return syndromes
+
+
+def anneal(columns, spare, weights, toggles, counts, steps, seed):
+    """
+    One simulated-annealing run over packed Hu columns.
+
+    Args:
+        columns (list[int]): Initial Hu columns, packed (first row as the MSB)
+        spare (list[int]): Unused vectors of the span of Hv that may replace a column
+        weights (np.ndarray): Coset-leader weight per packed Δ-syndrome
+        toggles (np.ndarray): Boolean matrix k × N, row j marks the data changes toggling bit j
+        counts (np.ndarray): Count of each data change
+        steps (int): Number of proposed moves
+        seed (int): Seed of the move proposals
+
+    Returns:
+        tuple: (best columns, best total cost)
+    """
+    rng = np.random.default_rng(seed)
+    columns, spare = list(columns), list(spare)
+    k = len(columns)
+    syndromes = _syndromes(columns, toggles)
+    cost = int((counts * weights[syndromes]).sum())
+    best_columns, best_cost = list(columns), cost
+
+    def propose():
+        if spare and (k < 2 or rng.random() < 0.5):
+            j, c = int(rng.integers(k)), int(rng.integers(len(spare)))
+            return ("replace", j, c), np.flatnonzero(toggles[j]), columns[j] ^ spare[c]
+        i, j = (int(x) for x in rng.choice(k, size=2, replace=False))
+        return ("swap", i, j), np.flatnonzero(toggles[i] != toggles[j]), columns[i] ^ columns[j]
+
+    def cost_change(affected, x):
+        s = syndromes[affected]
+        return int((counts[affected] * (weights[s ^ x] - weights[s])).sum())
+
+    if k < 2 and not spare:
+        return best_columns, best_cost
+
+    # Initial temperature: the mean cost increase of random moves, accepted with probability 1/e
+    increases = [change for change in (cost_change(*propose()[1:]) for _ in range(100)) if change > 0]
+    if not increases:
+        return best_columns, best_cost
+    t_start = float(np.mean(increases))
+    t_end = t_start * 1e-3
+
+    for step in range(steps):
+        temperature = t_start * (t_end / t_start) ** (step / steps)
+        (move, a, b), affected, x = propose()
+        change = cost_change(affected, x)
+        if change > 0 and rng.random() >= math.exp(-change / temperature):
+            continue
+
+        syndromes[affected] ^= x
+        cost += change
+        if move == "swap":
+            columns[a], columns[b] = columns[b], columns[a]
+        else:
+            columns[a], spare[b] = spare[b], columns[a]
+        if cost < best_cost:
+            best_columns, best_cost = list(columns), cost
+
+    return best_columns, best_cost
+
+
+def _run_start(args):
+    """Worker entry point of anneal"""
+    return anneal(*args)
+
+
+def optimize_hu(H_U, H_V, leader_table, D, counts=None, steps=20000, starts=None, seed=42, max_workers=None):
+    """
+    Optimize the Hu columns (their selection from the span of Hv and their bit positions) for
+    the fewest expected redundancy-wire transitions over a workload.
+
+    Args:
+        H_U (np.ndarray): Initial Hu (r × k)
+        H_V (np.ndarray): Hv (r × n_V), unchanged
+        leader_table (np.ndarray): Coset leader (2^r × n_V) per packed Δ-syndrome
+        D (np.ndarray): Data changes, one k-bit change per row (see trace_deltas)
+        counts (np.ndarray, optional): Count of each data change (default: 1 each)
+        steps (int): Proposed moves per annealing start
+        starts (int, optional): Number of annealing starts (default: one per CPU)
+        seed (int): Base seed of the starts
+        max_workers (int, optional): Number of worker processes (default: one per CPU)
+
+    Returns:
+        HuAnnealingResult: Best Hu, its cost, the initial cost and the cost of every start
+    """
+    D = np.asarray(D, dtype=np.uint8)
+    counts = np.ones(D.shape[0], dtype=np.int64) if counts is None else np.asarray(counts, dtype=np.int64)
+    weights = leader_weights(leader_table)
+    toggles = np.ascontiguousarray(D.T, dtype=bool)
+    r = H_V.shape[0]
+
+    hu = GF2Matrix(H_U)
+    hv = GF2Matrix(H_V)
+    spare = sorted(set(hv.column_space()) - set(hv.column_ints) - set(hu.column_ints) - {0})
+    starts = starts or os.cpu_count() or 1
+
+    tasks = [(hu.column_ints, spare, weights, toggles, counts, steps, [seed, start]) for start in range(starts)]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        runs = list(executor.map(_run_start, tasks))
+
+    best_columns, best_cost = min(runs, key=lambda run: run[1])
+    total = counts.sum()
+    H_U_best = np.array([int_to_bits(column, r) for column in best_columns], dtype=int).reshape(-1, r).T
+    return HuAnnealingResult(H_U_best, float(best_cost / total), expected_transitions(H_U, weights, D, counts),
+                             [float(cost / total) for _, cost in runs])
+
+
+if __name__ == "__main__":
+    import time
+    from coding_schemes.bit_ops import unpack_rows
+    from coding_schemes.syndrome_based.code_cache import annealed_hu_params, array_digest, save_artifact
+    from coding_schemes.syndrome_based.syndrome_based_encoder import SyndromeBasedEncoder
+
+    k = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    if len(sys.argv) > 2:
+        S = np.load(sys.argv[2])
+    else:
+        S = unpack_rows(np.arange(1 << 16, dtype=np.uint64), k)
+
+    encoder = SyndromeBasedEncoder(k=k)
+    leader_table = unpack_rows(encoder.leader_words, encoder.n_V)
+    D, counts = trace_deltas(S)
+
+    start = time.perf_counter()
+    result = optimize_hu(encoder.H_U, encoder.H_V, leader_table, D, counts)
+    print(f"Expected redundancy transitions per word: {result.initial_cost:.4f} -> {result.cost:.4f} "
+          f"({len(result.start_costs)} starts, {time.perf_counter() - start:.1f} s)")
+    workload = array_digest(S)
+    path = save_artifact(annealed_hu_params(encoder.H_V, k, workload), H_U=result.H_U)
+    print(f"Hu ({result.H_U.shape[0]}x{result.H_U.shape[1]}) for workload {workload} stored in {path}")
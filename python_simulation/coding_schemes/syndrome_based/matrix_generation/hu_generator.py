@@ -7,6 +7,8 @@ This module generates Hu matrix from Hv matrix with the property:
 - Every column of Hu lies in the span of the columns of Hv
 
 This means each column of Hu can be expressed as a linear combination of Hv columns.
+The column space of Hv is enumerated exactly over GF(2), and the Hu columns are drawn
+from its non-zero vectors that are not Hv columns, distinct and without retries.
 
 Usage:
     python hu_generator.py
@@ -15,6 +17,8 @@ Usage:
 
 import numpy as np
 import sys
+from coding_schemes.bit_ops import int_to_bits
+from coding_schemes.gf2 import GF2Matrix
 
 
 def is_in_span(vector, basis_matrix):
@@ -31,14 +35,8 @@ def is_in_span(vector, basis_matrix):
     if basis_matrix.size == 0:
         return False
     
-    # Try to solve: basis_matrix * x = vector
-    try:
-        solution = np.linalg.lstsq(basis_matrix, vector, rcond=None)[0]
-        # Check if the solution is exact (within numerical precision)
-        reconstructed = basis_matrix @ solution
-        return np.allclose(reconstructed, vector, atol=1e-10)
-    except np.linalg.LinAlgError:
-        return False
+    # Exact test over GF(2): reduce the vector against an XOR basis of the columns
+    return GF2Matrix(basis_matrix).in_column_span(vector)
 
 
 def generate_linear_combination(basis_matrix, target_vector=None):
@@ -53,19 +51,19 @@ def generate_linear_combination(basis_matrix, target_vector=None):
         np.ndarray: Vector in the span of basis_matrix
     """
     if basis_matrix.size == 0:
-        return np.zeros(6, dtype=int)
+        return np.zeros(basis_matrix.shape[0], dtype=int)
     
     # Generate random coefficients for linear combination
     n_cols = basis_matrix.shape[1]
     coeffs = np.random.randint(0, 2, n_cols)
     
-    # Compute linear combination
-    result = (basis_matrix @ coeffs) % 2
+    # Compute linear combination over GF(2)
+    result = GF2Matrix(basis_matrix).mul_vec(coeffs).astype(int)
     
     return result
 
 
-def generate_hu_from_hv(Hv, hu_cols=32, seed=None):
+def generate_hu_from_hv(Hv, hu_cols=32, seed=None, verbose=True):
     """
     Generate Hu matrix from Hv matrix.
     
@@ -75,6 +73,7 @@ def generate_hu_from_hv(Hv, hu_cols=32, seed=None):
         Hv: Hv matrix (6x13)
         hu_cols: Number of columns for Hu matrix (default: 6)
         seed: Random seed for reproducibility
+        verbose: Whether to print progress information
         
     Returns:
         tuple: (Hu, success) where Hu is the generated matrix and success is bool
@@ -82,93 +81,78 @@ def generate_hu_from_hv(Hv, hu_cols=32, seed=None):
     if seed is not None:
         np.random.seed(seed)
     
-    print(f"Generating Hu matrix ({Hv.shape[0]}x{hu_cols}) from Hv matrix ({Hv.shape[0]}x{Hv.shape[1]})...")
-    print("Property: Every column of Hu lies in the span of Hv columns")
-    
-    # Initialize Hu matrix
-    Hu = np.zeros((Hv.shape[0], hu_cols), dtype=int)
-    
-    for col_idx in range(hu_cols):        
-        max_attempts = 1000
-        for attempt in range(max_attempts):
-            # Generate a vector in the span of Hv
-            candidate = generate_linear_combination(Hv)
-            
-            # Skip zero vector
-            if np.all(candidate == 0):
-                continue
-            
-            # Check if this vector is already in Hu (avoid duplicates within Hu)
-            is_duplicate_in_hu = False
-            for existing_col in range(col_idx):
-                if np.array_equal(candidate, Hu[:, existing_col]):
-                    is_duplicate_in_hu = True
-                    break
-            
-            # Check if this vector already exists in Hv (avoid duplicates with Hv)
-            is_duplicate_in_hv = False
-            for hv_col in range(Hv.shape[1]):
-                if np.array_equal(candidate, Hv[:, hv_col]):
-                    is_duplicate_in_hv = True
-                    break
-            
-            if not is_duplicate_in_hu and not is_duplicate_in_hv:
-                # Verify it's in the span of Hv
-                if is_in_span(candidate, Hv):
-                    Hu[:, col_idx] = candidate
-                    break
-                else:
-                    print(f"    Warning: Generated vector not in span of Hv")
-        
-        if attempt == max_attempts - 1:
-            print(f"    Failed to generate column {col_idx + 1} after {max_attempts} attempts")
-            return None, False
-    
+    if verbose:
+        print(f"Generating Hu matrix ({Hv.shape[0]}x{hu_cols}) from Hv matrix ({Hv.shape[0]}x{Hv.shape[1]})...")
+    if verbose:
+        print("Property: Every column of Hu lies in the span of Hv columns")
+    
+    # Candidates: non-zero vectors of the column space of Hv, other than the Hv columns
+    hv = GF2Matrix(Hv)
+    used = set(hv.column_ints) | {0}
+    candidates = sorted(set(hv.column_space()) - used)
+    if len(candidates) < hu_cols:
+        print(f"    Failed to generate {hu_cols} columns: the span of Hv has {len(candidates)} free vectors")
+        return None, False
+
+    # Distinct columns drawn without replacement
+    chosen = np.random.choice(len(candidates), size=hu_cols, replace=False)
+    Hu = np.array([int_to_bits(candidates[i], Hv.shape[0]) for i in chosen], dtype=int)
+    Hu = Hu.reshape(hu_cols, Hv.shape[0]).T
+
     return Hu, True
 
 
-def validate_hu_properties(Hu, Hv):
+def validate_hu_properties(Hu, Hv, verbose=True):
     """
     Validate that Hu matrix satisfies all required properties.
     
     Args:
         Hu: Hu matrix to validate
         Hv: Hv matrix for reference
+        verbose: Whether to print the properties that hold
         
     Returns:
         bool: True if all properties satisfied, False otherwise
     """
-    print("\nValidating Hu matrix properties...")
+    if verbose:
+        print("\nValidating Hu matrix properties...")
     
     # Check dimensions
     if Hu.shape[0] != Hv.shape[0]:
         print(f"✗ Row dimension mismatch: Hu has {Hu.shape[0]} rows, Hv has {Hv.shape[0]}")
         return False
-    print(f"✓ Dimensions correct: {Hu.shape}")
+    if verbose:
+        print(f"✓ Dimensions correct: {Hu.shape}")
+    
+    hv = GF2Matrix(Hv)
+    hu_columns = GF2Matrix(Hu).column_ints
     
     # Check that all columns are in span of Hv
+    span = set(hv.column_space())
     all_in_span = True
-    for col_idx in range(Hu.shape[1]):
-        if not is_in_span(Hu[:, col_idx], Hv):
+    for col_idx, column in enumerate(hu_columns):
+        if column not in span:
             print(f"✗ Column {col_idx + 1} of Hu is not in span of Hv")
             all_in_span = False
     
     if all_in_span:
-        print("✓ All columns of Hu are in span of Hv")
+        if verbose:
+            print("✓ All columns of Hu are in span of Hv")
     else:
         print("✗ Some columns of Hu are not in span of Hv")
         return False
     
     # Check for duplicates between Hu and Hv
+    hv_index = {column: idx for idx, column in enumerate(hv.column_ints)}
     has_duplicates_with_hv = False
-    for hu_col_idx in range(Hu.shape[1]):
-        for hv_col_idx in range(Hv.shape[1]):
-            if np.array_equal(Hu[:, hu_col_idx], Hv[:, hv_col_idx]):
-                print(f"✗ Column {hu_col_idx + 1} of Hu is identical to column {hv_col_idx + 1} of Hv")
-                has_duplicates_with_hv = True
+    for hu_col_idx, column in enumerate(hu_columns):
+        if column in hv_index:
+            print(f"✗ Column {hu_col_idx + 1} of Hu is identical to column {hv_index[column] + 1} of Hv")
+            has_duplicates_with_hv = True
     
     if not has_duplicates_with_hv:
-        print("✓ No duplicate columns between Hu and Hv")
+        if verbose:
+            print("✓ No duplicate columns between Hu and Hv")
     else:
         print("✗ Found duplicate columns between Hu and Hv")
         return False
@@ -197,11 +181,11 @@ def generate_hu_entry_point(Hv, hu_cols=32, seed=None, output_dir=None, verbose=
     
     try:
         # Generate Hu matrix
-        Hu, success = generate_hu_from_hv(Hv, hu_cols=hu_cols, seed=seed)
+        Hu, success = generate_hu_from_hv(Hv, hu_cols=hu_cols, seed=seed, verbose=verbose)
         
         if success and Hu is not None:
             # Validate properties
-            if validate_hu_properties(Hu, Hv):
+            if validate_hu_properties(Hu, Hv, verbose=verbose):
                 if verbose:
                     print("\n" + "="*50)
                     print("GENERATED HU MATRIX")
@@ -209,7 +193,7 @@ def generate_hu_entry_point(Hv, hu_cols=32, seed=None, output_dir=None, verbose=
                     print(f"Hu matrix ({Hu.shape[0]}x{Hu.shape[1]}):")
                     print(Hu)
                     print(f"\nMatrix properties:")
-                    print(f"- Rank of Hu: {np.linalg.matrix_rank(Hu)}")
+                    print(f"- Rank of Hu: {GF2Matrix(Hu).rank()}")
                     print(f"- All columns in span of Hv: ✓")
                 
                 return Hu
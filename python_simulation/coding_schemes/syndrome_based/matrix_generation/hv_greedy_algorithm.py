@@ -1,6 +1,7 @@
 import numpy as np
-from itertools import product
 import random
+from coding_schemes.bit_ops import bits_to_int, int_to_bits, int_popcount
+from coding_schemes.gf2 import GF2Matrix
 
 # Matrix dimensions
 M = 6  # number of rows (syndrome length)
@@ -16,9 +17,9 @@ def is_linearly_independent(matrix, new_column):
     if matrix.size == 0:
         return True
     
-    # Create augmented matrix
+    # Create augmented matrix (rank over GF(2))
     augmented = np.column_stack([matrix, new_column])
-    return np.linalg.matrix_rank(augmented) == matrix.shape[1] + 1
+    return GF2Matrix(augmented).rank() == matrix.shape[1] + 1
 
 def can_express_as_sum_of_at_most_2(target_vector, matrix):
     """
@@ -26,35 +27,53 @@ def can_express_as_sum_of_at_most_2(target_vector, matrix):
     In GF(2), this means: v = u1 + u2 or v = u1 or v = 0
     """
     # Check if target_vector is zero vector
-    if np.all(target_vector == 0):
+    target = bits_to_int(target_vector)
+    if target == 0:
         return True
     
-    # Check if target_vector is equal to any single column
-    for i in range(matrix.shape[1]):
-        if np.array_equal(target_vector, matrix[:, i]):
-            return True
-    
-    # Check if target_vector is sum of any two columns
-    for i in range(matrix.shape[1]):
-        for j in range(i + 1, matrix.shape[1]):
-            sum_vectors = (matrix[:, i] + matrix[:, j]) % 2
-            if np.array_equal(target_vector, sum_vectors):
-                return True
+    # Check if target_vector is equal to any single column (columns packed as integers)
+    columns = set(GF2Matrix(matrix).column_ints)
+    if target in columns:
+        return True
     
-    return False
+    # Check if target_vector is sum of any two columns: target XOR column is another column
+    return any((target ^ column) in columns for column in columns)
+
+def add_to_reachable(reachable, columns, new_column):
+    """
+    Update a reachability bitmask when new_column is added to columns (columns packed as integers).
+    Bit v of the mask is set if the m-vector packed as v is 0, a column, or the sum of two columns,
+    so adding a column sets its own bit and the bit of its sum with every existing column.
+    """
+    reachable |= 1 << new_column
+    for column in columns:
+        reachable |= 1 << (column ^ new_column)
+    return reachable
+
+def reachable_mask(columns):
+    """
+    Reachability bitmask (2^m bits) of the vectors expressible as sum of at most 2 of the columns
+    """
+    reachable = 1  # Zero vector
+    for i, column in enumerate(columns):
+        reachable = add_to_reachable(reachable, columns[:i], column)
+    return reachable
+
+def missing_ints(reachable, m):
+    """
+    Non-zero m-vectors (packed as integers, in increasing order) missing from a reachability bitmask
+    """
+    return [vector for vector in range(1, 1 << m) if not (reachable >> vector) & 1]
 
 def check_all_vectors_expressible(matrix):
     """
-    Check if all 2^6 = 64 possible 6-vectors can be expressed as sum of at most 2 vectors from matrix
+    Check if all 2^m possible m-vectors (m = number of rows, 64 for m = 6) can be expressed as sum of at most 2 vectors from matrix
     Note: Zero vector doesn't need to be expressible as it's naturally available (sum of 0 vectors)
     """
-    for vector in product([0, 1], repeat=6):
-        target_vector = np.array(vector)
-        # Skip zero vector - it doesn't need to be expressible
-        if np.all(target_vector == 0):
-            continue
-        if not can_express_as_sum_of_at_most_2(target_vector, matrix):
-            return False, target_vector
+    m = matrix.shape[0]
+    missing = missing_ints(reachable_mask(GF2Matrix(matrix).column_ints), m)
+    if missing:
+        return False, np.array(int_to_bits(missing[0], m))
     return True, None
 
 def find_missing_vectors(matrix):
@@ -62,186 +81,170 @@ def find_missing_vectors(matrix):
     Find vectors that cannot be expressed as sum of at most 2 vectors from matrix
     Note: Zero vector doesn't need to be expressible as it's naturally available (sum of 0 vectors)
     """
-    missing = []
-    for vector in product([0, 1], repeat=6):
-        target_vector = np.array(vector)
-        # Skip zero vector - it doesn't need to be expressible
-        if np.all(target_vector == 0):
+    m = matrix.shape[0]
+    return [np.array(int_to_bits(vector, m)) for vector in missing_ints(reachable_mask(GF2Matrix(matrix).column_ints), m)]
+
+def best_candidate(candidates, reachable, columns, full):
+    """
+    Score candidate columns (packed as integers) by the number of vectors expressible once the
+    candidate is added (a popcount of the updated reachability bitmask, zero vector included).
+    Zero and existing columns are skipped; the first best candidate wins and the search stops
+    as soon as a candidate reaches full.
+    
+    Returns:
+        tuple: (best candidate or None, its expressible count)
+    """
+    existing = set(columns)
+    best_vector = None
+    best_improvement = 0
+    for candidate in candidates:
+        if candidate == 0 or candidate in existing:
             continue
-        if not can_express_as_sum_of_at_most_2(target_vector, matrix):
-            missing.append(target_vector)
-    return missing
+        expressible_count = int_popcount(add_to_reachable(reachable, columns, candidate))
+        if expressible_count > best_improvement:
+            best_improvement = expressible_count
+            best_vector = candidate
+            if expressible_count == full:
+                break
+    return best_vector, best_improvement
 
-def generate_extra_vectors(seed=None):
+def generate_extra_vectors(seed=None, m=M, num_extra=R, verbose=True):
     """
-    Greedily generate 7 extra vectors to add to the 6x6 identity matrix
-    Goal: Every 6-vector should be expressible as sum of at most 2 vectors from the final matrix
+    Greedily generate extra vectors to add to the m x m identity matrix (7 extra vectors for m = 6)
+    Goal: Every m-vector should be expressible as sum of at most 2 vectors from the final matrix
+    
+    Columns are packed as integers and coverage is kept as a 2^m-bit reachability bitmask,
+    updated incrementally as columns are added.
+    
+    Args:
+        seed (int, optional): Random seed for reproducibility
+        m (int): Number of rows (syndrome length)
+        num_extra (int, optional): Number of extra vectors; if None, add vectors until every
+                                   m-vector is expressible
+        verbose (bool): Whether to print progress information
     """
     if seed is not None:
         random.seed(seed)
         np.random.seed(seed)
     
-    # Start with identity matrix
-    identity_matrix = np.eye(M, dtype=int)
-    current_matrix = identity_matrix.copy()
+    # Start with identity matrix (column i has bit i set, the first row as the MSB)
+    columns = [1 << (m - 1 - i) for i in range(m)]
+    reachable = reachable_mask(columns)
     
     extra_vectors = []
+    full = (1 << m) - 1  # Number of non-zero m-vectors
     
     vec_idx = 0
-    max_vectors = 7  # We need exactly 7 extra vectors
-    while vec_idx < max_vectors:  # We need exactly 7 extra vectors        
+    max_vectors = num_extra if num_extra is not None else full  # 7 extra vectors for m = 6
+    while vec_idx < max_vectors:
         # Find missing vectors
-        missing_vectors = find_missing_vectors(current_matrix)
+        missing_vectors = missing_ints(reachable, m)
         
         if len(missing_vectors) == 0:
-            break
-        
-        best_vector = None
-        best_improvement = 0
+            if num_extra is None:
+                break
+            # Every vector is already expressible: pad up to num_extra with distinct random vectors
+            candidate = np.random.randint(0, 2, m)
+            candidate_int = bits_to_int(candidate)
+            if candidate_int != 0 and candidate_int not in columns:
+                extra_vectors.append(candidate)
+                reachable = add_to_reachable(reachable, columns, candidate_int)
+                columns.append(candidate_int)
+                if verbose:
+                    print(f"  Added vector {vec_idx + 1}: {candidate} (padding)")
+                vec_idx += 1
+            continue
         
         # Try to find a vector that helps express the missing vectors
         # First, try adding missing vectors directly
-        for missing_vec in missing_vectors:
-            candidate = missing_vec.copy()
-            if (not np.all(candidate == 0) and  # Don't add zero vector
-                not any(np.array_equal(candidate, current_matrix[:, i]) for i in range(current_matrix.shape[1]))):
-                temp_matrix = np.column_stack([current_matrix, candidate])
-                expressible_count = 0
-                for vector in product([0, 1], repeat=6):
-                    target_vector = np.array(vector)
-                    if can_express_as_sum_of_at_most_2(target_vector, temp_matrix):
-                        expressible_count += 1
-                
-                if expressible_count > best_improvement:
-                    best_improvement = expressible_count
-                    best_vector = candidate.copy()
-                    if expressible_count == 63:  # All non-zero vectors expressible
-                        break
+        best_vector, best_improvement = best_candidate(missing_vectors, reachable, columns, full)
         
-        # If no direct missing vector works, try combinations
+        # If no direct missing vector works, try combinations: missing_vec + existing_vector
         if best_vector is None:
-            for missing_vec in missing_vectors:
-                for existing_idx in range(current_matrix.shape[1]):
-                    # Try adding missing_vec + existing_vector
-                    candidate = (missing_vec + current_matrix[:, existing_idx]) % 2
-                    if (not np.all(candidate == 0) and  # Don't add zero vector
-                        not any(np.array_equal(candidate, current_matrix[:, i]) for i in range(current_matrix.shape[1]))):
-                        temp_matrix = np.column_stack([current_matrix, candidate])
-                        expressible_count = 0
-                        for vector in product([0, 1], repeat=6):
-                            target_vector = np.array(vector)
-                            if can_express_as_sum_of_at_most_2(target_vector, temp_matrix):
-                                expressible_count += 1
-                        
-                        if expressible_count > best_improvement:
-                            best_improvement = expressible_count
-                            best_vector = candidate.copy()
-                            if expressible_count == 63:  # All non-zero vectors expressible
-                                break
-                if best_vector is not None and best_improvement == 63:
-                    break
+            best_vector, best_improvement = best_candidate(
+                (missing ^ column for missing in missing_vectors for column in columns), reachable, columns, full)
         
         # If no good vector found from missing vectors, try to find vectors that help with specific missing vectors
         if best_vector is None:
-            print(f"  Trying to find vectors that help with specific missing vectors...")
-            for missing_vec in missing_vectors:
-                # Try all possible combinations of existing vectors + missing_vec
-                for i in range(current_matrix.shape[1]):
-                    for j in range(i + 1, current_matrix.shape[1]):
-                        # Try adding missing_vec + existing_vector_i + existing_vector_j
-                        candidate = (missing_vec + current_matrix[:, i] + current_matrix[:, j]) % 2
-                        if (not np.all(candidate == 0) and  # Don't add zero vector
-                            not any(np.array_equal(candidate, current_matrix[:, k]) for k in range(current_matrix.shape[1]))):
-                            temp_matrix = np.column_stack([current_matrix, candidate])
-                            expressible_count = 0
-                            for vector in product([0, 1], repeat=6):
-                                target_vector = np.array(vector)
-                                if can_express_as_sum_of_at_most_2(target_vector, temp_matrix):
-                                    expressible_count += 1
-                            
-                            if expressible_count > best_improvement:
-                                best_improvement = expressible_count
-                                best_vector = candidate.copy()
-                                if expressible_count == 63:
-                                    break
-                    if best_vector is not None and best_improvement == 63:
-                        break
-                if best_vector is not None and best_improvement == 63:
-                    break
+            if verbose:
+                print(f"  Trying to find vectors that help with specific missing vectors...")
+            # Try adding missing_vec + existing_vector_i + existing_vector_j
+            best_vector, best_improvement = best_candidate(
+                (missing ^ columns[i] ^ columns[j]
+                 for missing in missing_vectors
+                 for i in range(len(columns)) for j in range(i + 1, len(columns))),
+                reachable, columns, full)
             
             # If still no good vector, try random vectors
             if best_vector is None:
-                print(f"  Trying random vectors...")
-                for _ in range(10000):  # More attempts for the harder constraint
-                    candidate = np.random.randint(0, 2, M)
-                    if (not np.all(candidate == 0) and  # Don't add zero vector
-                        not any(np.array_equal(candidate, current_matrix[:, i]) for i in range(current_matrix.shape[1]))):
-                        temp_matrix = np.column_stack([current_matrix, candidate])
-                        expressible_count = 0
-                        for vector in product([0, 1], repeat=6):
-                            target_vector = np.array(vector)
-                            if can_express_as_sum_of_at_most_2(target_vector, temp_matrix):
-                                expressible_count += 1
-                        
-                        if expressible_count > best_improvement:
-                            best_improvement = expressible_count
-                            best_vector = candidate.copy()
-                            if expressible_count == 63:  # All non-zero vectors expressible
-                                break
+                if verbose:
+                    print(f"  Trying random vectors...")
+                best_vector, best_improvement = best_candidate(
+                    (bits_to_int(np.random.randint(0, 2, m)) for _ in range(10000)),  # More attempts for the harder constraint
+                    reachable, columns, full)
         
         if best_vector is not None:
-            extra_vectors.append(best_vector)
-            current_matrix = np.column_stack([current_matrix, best_vector])
-            print(f"  Added vector {vec_idx + 1}: {best_vector}, now {best_improvement}/63 non-zero vectors expressible")
+            best_bits = np.array(int_to_bits(best_vector, m))
+            extra_vectors.append(best_bits)
+            reachable = add_to_reachable(reachable, columns, best_vector)
+            columns.append(best_vector)
+            if verbose:
+                print(f"  Added vector {vec_idx + 1}: {best_bits}, now {best_improvement}/{full} non-zero vectors expressible")
             vec_idx += 1
         else:
             print(f"  Failed to find suitable vector {vec_idx + 1}")
             break
     
-    return np.array(extra_vectors).T if extra_vectors else np.zeros((M, 0), dtype=int)
+    return np.array(extra_vectors).T if extra_vectors else np.zeros((m, 0), dtype=int)
 
-def generate_hv_matrix(seed=None):
+def generate_hv_matrix(seed=None, m=M, num_extra=R, verbose=True):
     """
     Main greedy algorithm to generate Hv matrix
-    Structure: Hv = [I_6 | H_extra] where I_6 is identity matrix and H_extra is 6x7
+    Structure: Hv = [I_m | H_extra] where I_m is identity matrix and H_extra is m x num_extra (6x7 by default)
     """
-    print("Starting with 6x6 identity matrix...")
-    identity_matrix = np.eye(M, dtype=int)
+    if verbose:
+        print(f"Starting with {m}x{m} identity matrix...")
+    identity_matrix = np.eye(m, dtype=int)
     
-    print("Generating 7 extra vectors...")
-    H_extra = generate_extra_vectors(seed)
+    if verbose:
+        print(f"Generating {num_extra if num_extra is not None else 'covering'} extra vectors...")
+    H_extra = generate_extra_vectors(seed, m=m, num_extra=num_extra, verbose=verbose)
     
     # Combine to form Hv
     Hv = np.column_stack([identity_matrix, H_extra])
     
     return Hv, identity_matrix, H_extra
 
-def validate_matrix(Hv, identity_matrix, H_extra):
+def validate_matrix(Hv, identity_matrix, H_extra, num_extra=R, verbose=True):
     """
     Validate that the generated matrix satisfies all required properties
+    (num_extra=None accepts any number of extra vectors)
     """
-    print("\nValidating matrix properties...")
+    if verbose:
+        print("\nValidating matrix properties...")
+    m = Hv.shape[0]
     
     # Check dimensions
-    assert Hv.shape[0] == M, f"Wrong Hv rows: {Hv.shape[0]}, expected {M}"
-    assert identity_matrix.shape == (M, K), f"Wrong identity matrix dimensions: {identity_matrix.shape}"
-    # H_extra should have exactly 7 columns
-    assert H_extra.shape == (M, 7), f"Wrong H_extra dimensions: {H_extra.shape}, expected ({M}, 7)"
+    assert identity_matrix.shape == (m, m), f"Wrong identity matrix dimensions: {identity_matrix.shape}"
+    # H_extra should have exactly num_extra columns (7 for m = 6)
+    if num_extra is not None:
+        assert H_extra.shape == (m, num_extra), f"Wrong H_extra dimensions: {H_extra.shape}, expected ({m}, {num_extra})"
     
     # Check that first part is identity matrix
-    assert np.array_equal(identity_matrix, np.eye(M, dtype=int)), "First part is not identity matrix"
+    assert np.array_equal(identity_matrix, np.eye(m, dtype=int)), "First part is not identity matrix"
     
-    # Check full rank
-    rank = np.linalg.matrix_rank(Hv)
-    assert rank == TARGET_RANK, f"Wrong rank: {rank}, expected {TARGET_RANK}"
+    # Check full rank (over GF(2))
+    rank = GF2Matrix(Hv).rank()
+    assert rank == m, f"Wrong rank: {rank}, expected {m}"
     
-    # Check main requirement: every non-zero 6-vector expressible as sum of at most 2 vectors
+    # Check main requirement: every non-zero m-vector expressible as sum of at most 2 vectors
     all_expressible, counterexample = check_all_vectors_expressible(Hv)
     if not all_expressible:
         print(f"✗ Vector {counterexample} cannot be expressed as sum of at most 2 vectors")
         return False
     
-    print("✓ All properties validated successfully!")
+    if verbose:
+        print("✓ All properties validated successfully!")
     return True
 
 def print_matrix_info(Hv, identity_matrix, H_extra):
@@ -255,19 +258,22 @@ def print_matrix_info(Hv, identity_matrix, H_extra):
     print(f"\nHv matrix ({Hv.shape[0]}x{Hv.shape[1]}):")
     print(Hv)
     
-    print(f"- Rank of Hv: {np.linalg.matrix_rank(Hv)}")
-    print(f"- Null space dimension: {Hv.shape[1] - np.linalg.matrix_rank(Hv)}")
-    print(f"- Syndrome space size: 2^{np.linalg.matrix_rank(Hv)} = {2**np.linalg.matrix_rank(Hv)}")
-    print(f"- All 63 non-zero 6-vectors expressible as sum of ≤2 vectors: ✓")
+    rank = GF2Matrix(Hv).rank()
+    print(f"- Rank of Hv: {rank}")
+    print(f"- Null space dimension: {Hv.shape[1] - rank}")
+    print(f"- Syndrome space size: 2^{rank} = {2**rank}")
+    print(f"- All {(1 << Hv.shape[0]) - 1} non-zero {Hv.shape[0]}-vectors expressible as sum of ≤2 vectors: ✓")
 
 
-def generate_hv_matrix_entry_point(seed=None, verbose=True):
+def generate_hv_matrix_entry_point(seed=None, verbose=True, m=M, num_extra=R):
     """
     Entry point function for Hv matrix generation.
     
     Args:
         seed (int, optional): Random seed for reproducibility
         verbose (bool): Whether to print progress information
+        m (int): Number of rows of Hv (syndrome length)
+        num_extra (int, optional): Number of extra vectors, or None for as many as needed
         
     Returns:
         tuple: (Hv, identity_matrix, H_extra) if successful, None if failed
@@ -275,16 +281,16 @@ def generate_hv_matrix_entry_point(seed=None, verbose=True):
     if verbose:
         print("Greedy Algorithm for Hv Matrix Generation")
         print("="*50)
-        print("Goal: Generate Hv = [I_6 | H_extra] where every 6-vector is expressible")
+        print(f"Goal: Generate Hv = [I_{m} | H_extra] where every {m}-vector is expressible")
         print("as sum of at most 2 vectors from Hv")
         print("="*50)
     
     try:
         # Generate matrix
-        Hv, identity_matrix, H_extra = generate_hv_matrix(seed=seed)
+        Hv, identity_matrix, H_extra = generate_hv_matrix(seed=seed, m=m, num_extra=num_extra, verbose=verbose)
         
         # Validate
-        if validate_matrix(Hv, identity_matrix, H_extra):
+        if validate_matrix(Hv, identity_matrix, H_extra, num_extra=num_extra, verbose=verbose):
             if verbose:
                 print_matrix_info(Hv, identity_matrix, H_extra)
             return Hv, identity_matrix, H_extra
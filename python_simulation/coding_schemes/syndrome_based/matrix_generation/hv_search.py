@@ -0,0 +1,265 @@
+"""
+Minimal Hv Search
+=================
+
+This module searches for Hv matrices with the fewest columns such that every
+non-zero r-vector is a column or the sum of two columns (a covering of GF(2)^r
+by sums of at most 2 columns), for syndrome widths beyond the greedy range.
+
+- Symmetry breaking: any such column set spans GF(2)^r, so a change of basis maps
+  r of its columns to the identity; Hv = [I_r | H_extra] loses no generality.
+  A coordinate permutation then maps a minimum-weight extra column of weight w
+  to the w lowest bits, and no extra column is lighter.
+- Branching: the smallest vector still missing must be added itself, be the sum
+  of an existing column and a new one, or be left to a pair of new columns.
+  Each column set is reached once; columns with the largest gain come first,
+  so that covering sets are found early.
+- Branch-and-bound: coverage is a 2^r-bit reachability bitmask; a branch is cut
+  when the best gains of the columns still allowed, plus the sums among them,
+  cannot cover the vectors still missing.
+- Parallel subtrees: the children of the first extra column split the tree into
+  independent tasks for a process pool. The greedy Hv is the starting upper bound, and the
+  search tightens it one column at a time until a width is proven infeasible or
+  the time limit expires (the best Hv found so far is returned).
+
+Usage (from python_simulation):
+    python -m coding_schemes.syndrome_based.matrix_generation.hv_search [r] [time limit in seconds]
+"""
+
+import heapq
+import logging
+import multiprocessing
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import NamedTuple
+
+import numpy as np
+
+from coding_schemes.bit_ops import bits_to_int, int_to_bits, int_popcount
+from coding_schemes.syndrome_based.matrix_generation.hv_greedy_algorithm import (
+    generate_extra_vectors, add_to_reachable, reachable_mask)
+
+
+# Stop event of the worker processes, set once the current width is settled
+_stop = None
+
+
+class HvSearchResult(NamedTuple):
+    """Outcome of a minimal Hv search"""
+    H_V: np.ndarray         # Best Hv found, r × n_V, as [I_r | H_extra]
+    proven_optimal: bool    # True if no Hv with fewer columns exists
+    lower_bound: int        # Fewest columns not yet ruled out
+    nodes: int              # Search nodes explored
+    elapsed: float          # Seconds
+
+
+def counting_lower_bound(r):
+    """
+    Fewest columns n for which n single columns and n(n-1)/2 pair sums can reach the 2^r - 1
+    non-zero vectors (and at least the r identity columns)
+    """
+    n = r
+    while n + n * (n - 1) // 2 < (1 << r) - 1:
+        n += 1
+    return n
+
+
+def identity_columns(r):
+    """Identity columns packed as integers, the first row as the MSB"""
+    return [1 << (r - 1 - i) for i in range(r)]
+
+
+def to_matrix(columns, r):
+    """Columns packed as integers to an r × len(columns) matrix"""
+    return np.array([int_to_bits(column, r) for column in columns], dtype=int).T
+
+
+def root_nodes(r, num_extra):
+    """
+    Roots of the search for num_extra extra columns, one per weight w of the minimum-weight
+    extra column: that column fixed to the w lowest bits, lighter vectors excluded.
+
+    Returns:
+        list: Search nodes (see expand)
+    """
+    nodes = []
+    for weight in range(2, r + 1):
+        first = (1 << weight) - 1
+        columns = identity_columns(r)
+        reachable = add_to_reachable(reachable_mask(columns), columns, first)
+        excluded = sum(1 << v for v in range(1 << r) if int_popcount(v) < weight) | 1 << first
+        nodes.append((reachable, columns + [first], excluded, 0, num_extra - 1))
+    return nodes
+
+
+def expand(node, r):
+    """
+    Children of a search node (reachable, columns, excluded, pair_required, remaining):
+    coverage bitmask, columns so far, vectors no longer allowed as new columns, missing
+    vectors left to the sum of two new columns, and number of columns still to add.
+
+    The smallest missing vector u that is not left to a pair is either added itself, or is
+    the sum of an existing column and a new one; the k-th child adds the k-th such column and
+    excludes the ones before it. A last child leaves u to a pair of new columns. Every column
+    set is thus reached exactly once. A node is cut when the best gains of the allowed columns,
+    plus the sums among the new columns, cannot cover the missing vectors.
+
+    Returns:
+        list: Child nodes, the most promising first
+    """
+    reachable, columns, excluded, pair_required, remaining = node
+    size = 1 << r
+    missing = size - int_popcount(reachable)
+    pairs = remaining * (remaining - 1) // 2
+    if remaining == 0 or int_popcount(pair_required) > pairs:
+        return []
+
+    extended = {v: add_to_reachable(reachable, columns, v)
+                for v in range(1, size) if not (excluded >> v) & 1}
+    gains = heapq.nlargest(remaining, (int_popcount(mask) - size + missing for mask in extended.values()))
+    if sum(gains) + pairs < missing:
+        return []
+
+    unresolved = ~reachable & ~pair_required & ((1 << size) - 1)
+    if unresolved:
+        u = (unresolved & -unresolved).bit_length() - 1
+        branches = [v for v in dict.fromkeys([u] + [u ^ column for column in columns]) if v in extended]
+    else:
+        u = None
+        branches = list(extended)
+    if remaining == 1:
+        branches = [v for v in branches if int_popcount(extended[v]) == size]
+    branches.sort(key=lambda v: -int_popcount(extended[v]))
+
+    children = []
+    for v in branches:
+        children.append((extended[v], columns + [v], excluded | 1 << v, pair_required & ~extended[v], remaining - 1))
+        excluded |= 1 << v
+    if u is not None and remaining >= 2:
+        children.append((reachable, columns, excluded, pair_required | 1 << u, remaining))
+    return children
+
+
+def search_subtree(r, node, deadline):
+    """
+    Depth-first branch-and-bound below one search node.
+
+    Args:
+        r (int): Syndrome length
+        node (tuple): Search node (see expand)
+        deadline (float): time.monotonic() at which the search gives up
+
+    Returns:
+        tuple: (extra columns of a covering Hv or None, subtree exhausted, nodes explored)
+    """
+    full = (1 << (1 << r)) - 1  # Every vector, zero included
+    nodes = 0
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        nodes += 1
+        if node[0] == full:
+            return node[1][r:], True, nodes
+        if time.monotonic() > deadline or (_stop is not None and _stop.is_set()):
+            return None, False, nodes
+        stack.extend(reversed(expand(node, r)))
+    return None, True, nodes
+
+
+def _init_worker(stop):
+    """Share the stop event with a worker process"""
+    global _stop
+    _stop = stop
+
+
+def _run_task(args):
+    """Worker entry point of search_subtree"""
+    return search_subtree(*args)
+
+
+def search_width(r, num_extra, deadline, executor, stop):
+    """
+    Decide whether some Hv = [I_r | H_extra] with num_extra extra columns covers GF(2)^r.
+
+    Returns:
+        tuple: (extra columns found or None, True if the answer is definite, nodes explored)
+    """
+    stop.clear()
+    tasks = [child for root in root_nodes(r, num_extra) for child in expand(root, r)]
+    pending = {executor.submit(_run_task, (r, task, deadline)) for task in tasks}
+    solution, exhausted, nodes = None, True, 0
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.cancelled():
+                continue
+            extra, finished, task_nodes = future.result()
+            nodes += task_nodes
+            exhausted = exhausted and finished
+            if extra is not None and solution is None:
+                solution = extra
+                stop.set()
+                for other in pending:
+                    other.cancel()
+    if solution is not None:
+        return solution, True, nodes
+    return None, exhausted, nodes
+
+
+def minimal_hv(r, time_limit=60.0, max_workers=None, seed=42):
+    """
+    Search for an Hv with the fewest columns covering GF(2)^r by sums of at most 2 columns.
+
+    Args:
+        r (int): Syndrome length (rows of Hv)
+        time_limit (float): Seconds before the best Hv found so far is returned (None for no limit)
+        max_workers (int, optional): Number of worker processes (default: one per CPU)
+        seed (int): Seed of the greedy starting solution
+
+    Returns:
+        HvSearchResult: Best Hv, whether it is proven minimal, the lower bound, nodes and time
+    """
+    start = time.monotonic()
+    deadline = start + time_limit if time_limit is not None else float("inf")
+    logger = logging.getLogger("HvSearch")
+
+    greedy = generate_extra_vectors(seed=seed, m=r, num_extra=None, verbose=False)
+    columns = identity_columns(r)
+    best_extra = [bits_to_int(column) for column in greedy.T.tolist()]
+    lower_bound = counting_lower_bound(r)
+    logger.info(f"r={r}: greedy Hv with {r + len(best_extra)} columns, counting bound {lower_bound}")
+
+    nodes = 0
+    proven = r + len(best_extra) == lower_bound
+    context = multiprocessing.get_context()
+    stop = context.Event()
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=context,
+                             initializer=_init_worker, initargs=(stop,)) as executor:
+        while not proven and time.monotonic() < deadline:
+            num_extra = len(best_extra) - 1
+            extra, definite, width_nodes = search_width(r, num_extra, deadline, executor, stop)
+            nodes += width_nodes
+            if extra is not None:
+                best_extra = sorted(extra)
+                logger.info(f"r={r}: found Hv with {r + len(best_extra)} columns ({time.monotonic() - start:.1f} s)")
+                proven = r + len(best_extra) == lower_bound
+            elif definite:
+                lower_bound = r + num_extra + 1
+                proven = True
+                logger.info(f"r={r}: no Hv with {r + num_extra} columns, {r + num_extra + 1} is minimal")
+            else:
+                logger.info(f"r={r}: time limit reached, best Hv has {r + len(best_extra)} columns")
+
+    H_V = to_matrix(columns + best_extra, r)
+    return HvSearchResult(H_V, proven, lower_bound if not proven else H_V.shape[1], nodes, time.monotonic() - start)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    r = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+    time_limit = float(sys.argv[2]) if len(sys.argv) > 2 else 60.0
+    result = minimal_hv(r, time_limit=time_limit)
+    status = "minimal" if result.proven_optimal else f"at least {result.lower_bound} columns needed"
+    print(f"\nHv ({r}x{result.H_V.shape[1]}, {status}, {result.nodes} nodes in {result.elapsed:.1f} s):")
+    print(result.H_V)
@@ -11,9 +11,26 @@
 
 import logging
 from coding_schemes.base_coding_scheme import CodingScheme
+from coding_schemes.bit_ops import bits_to_int, int_to_bits, pack_rows, unpack_rows, popcount
+from coding_schemes.gf2 import GF2Matrix
+from coding_schemes import kernels
 import numpy as np  
 from .H_matrix import return_H_U, return_H_V
-from .coset_leader_lut import get_leader
+from .coset_leader_lut import COSET_LEADER_TABLE
+from .code_cache import load_code, DEFAULT_SEED
+
+# Parameters of the hand-coded matrices in H_matrix.py and coset_leader_lut.py
+DEFAULT_INFO_BITS = 32
+DEFAULT_SYNDROME_BITS = 6
+DEFAULT_REDUNDANCY_BITS = 13
+
+# Special entries of the syndrome decoding table
+NO_ERROR = -1
+UNCORRECTABLE = -2
+
+# Redundancy selection modes
+COSET_LEADER = "coset_leader"        # v_prev XOR coset leader of the stored Δ-syndrome
+MIN_TRANSITIONS = "min_transitions"  # valid v with the fewest transitions against c_prev
 
 class SyndromeBasedEncoder(CodingScheme):
     """
@@ -21,63 +38,213 @@ class SyndromeBasedEncoder(CodingScheme):
                 with precomputed coset leaders.
 
     Args:
-        None (inherits from CodingScheme base class)
+        selection (str): Redundancy selection mode (COSET_LEADER or MIN_TRANSITIONS)
+        k (int): Number of information bits (default: 32)
+        r (int): Syndrome length, or None to pick the smallest that fits k
+        n_V (int): Number of redundancy bits, or None for the greedy minimum
+        seed (int): Matrix generation seed; with None and the default sizes the hand-coded
+                    6×45 matrices are used, otherwise the code is generated (and cached on disk)
+        hv_search_time (float): Seconds of branch-and-bound search for fewer redundancy bits than
+                                the greedy minimum, for generated codes (default: None, greedy only)
+        H_U (np.ndarray): Replacement H_U (r × k) for the code's H_V, e.g. a workload-optimized one
+                          from code_cache.load_annealed_hu (default: None, the code's own H_U)
 
     Returns:
         None (class definition)
     """
     name = "Syndrome-based Encoder"
     supports_errors = True
+    encoder_state_fields = ("syndrome_prev",)
+    decoder_state_fields = ()
+
+
+    def __init__(self, selection=COSET_LEADER, k=DEFAULT_INFO_BITS, r=None, n_V=None, seed=None, hv_search_time=None,
+                 H_U=None):
+        super().__init__()
+        self.syndrome_prev = 0  # Packed syndrome, first row of H in the MSB
+        if selection not in (COSET_LEADER, MIN_TRANSITIONS):
+            raise ValueError(f"Unknown redundancy selection mode: {selection}")
+        self.selection = selection
+        if selection == MIN_TRANSITIONS:
+            self.name = "Syndrome-based Encoder (min-transition)"
+
+        self.seed = seed
+        self.hv_search_time = hv_search_time
+        if (seed is None and k == DEFAULT_INFO_BITS and r in (None, DEFAULT_SYNDROME_BITS)
+                and n_V in (None, DEFAULT_REDUNDANCY_BITS) and not hv_search_time):
+            self.H_U, self.H_V, leader_table = return_H_U(), return_H_V(), COSET_LEADER_TABLE
+        else:
+            self.H_U, self.H_V, leader_table = load_code(k, r, n_V, DEFAULT_SEED if seed is None else seed,
+                                                         hv_search_time=hv_search_time)
+        if H_U is not None:
+            H_U = np.asarray(H_U, dtype=self.H_V.dtype)
+            if H_U.shape != self.H_U.shape:
+                raise ValueError(f"H_U must be {self.H_U.shape[0]}×{self.H_U.shape[1]}, got {H_U.shape[0]}×{H_U.shape[1]}")
+            self.H_U = H_U
+        self.H = np.column_stack([self.H_U, self.H_V])
+
+        self.k = self.H_U.shape[1]
+        self.r = self.H.shape[0]
+        self.n = self.H.shape[1]
+        self.n_V = self.H_V.shape[1]
+        if self.n_V > 64:
+            raise ValueError(f"Redundancy words of {self.n_V} bits do not fit in 64-bit packed words")
+
+        # Bit-packed GF(2) views of the parity check matrices
+        packed_H_U, packed_H_V, packed_H = GF2Matrix(self.H_U), GF2Matrix(self.H_V), GF2Matrix(self.H)
+        if packed_H_V.rank() != self.r:
+            raise ValueError("H_V must have full row rank to reach every syndrome")
+        columns = packed_H.column_ints
+        if H_U is not None and (0 in columns or len(set(columns)) != len(columns)):
+            raise ValueError("H_U columns must be nonzero and distinct from each other and from the columns of H_V")
 
-    # Global variable for the class
-    syndrome_prev = np.array([0, 0, 0, 0, 0, 0])
-    H_U = return_H_U()
-    H_V = return_H_V()
-    H = np.column_stack([H_U, H_V])
+        # Coset leader of every packed Δ-syndrome, packed with the first bit of v as the MSB
+        self.leader_words = pack_rows(leader_table)
+        self._leader_list = self.leader_words.tolist()
+        # Byte-sliced syndrome tables: the syndrome is the XOR of one entry per byte of the word
+        self.info_tables = _build_byte_tables(packed_H_U)
+        self.tables = _build_byte_tables(packed_H)
+        self._info_tables_list = self.info_tables.tolist()
+        self._tables_list = self.tables.tolist()
+        self.redundancy_tables = _build_byte_tables(packed_H_V)
+        self._redundancy_tables_list = self.redundancy_tables.tolist()
+        self.error_positions = _build_syndrome_decode_table(packed_H)
+
+        # Every valid v for each syndrome (64 × 128 packed for the 6×45 code), and the
+        # per-Δ-syndrome choice they reduce to when v_prev satisfies its own syndrome
+        if selection == MIN_TRANSITIONS:
+            self.candidates = _build_candidate_table(self.leader_words, packed_H_V.nullspace())
+            self.min_transition_deltas = _min_transition_deltas(self.candidates, self.n_V)
 
 
     def get_bus_size(self, k, M=None) -> int:
         """
         Implements: Bus width calculation for syndrome-based encoder,
                     accounting for the additional redundancy bits.
+
+        Args:
+            k (int): Number of input data bits (the encoder is built for self.k)
+            M (int): Unused parameter for compatibility (default: None)
+
+        Returns:
+            int: Total bus width k + n_V (45 for the default 32-bit code).
+        """
+        return self.k + self.n_V
+
+
+    def for_info_bits(self, k):
+        """
+        Implements: Encoder with the same selection mode, seed and H_V search, built for k information bits
+                    (a replacement H_U only fits its own k, so a new encoder uses the code's H_U).
+
+        Args:
+            k (int): Number of information bits
+
+        Returns:
+            SyndromeBasedEncoder: This encoder if it already uses k bits, a new one otherwise.
         """
-        n = 45 # 32 + 13
-        return n
+        if k == self.k:
+            return self
+        return SyndromeBasedEncoder(self.selection, k=k, seed=self.seed, hv_search_time=self.hv_search_time)
+
+
+    def reset_state(self, side=None) -> None:
+        """
+        Implements: Return of the Δ-syndrome state to the all-zero syndrome (the decoder is stateless).
+
+        Args:
+            side (str): ENCODER, DECODER or None for both (default: None)
+
+        Returns:
+            None
+        """
+        if "syndrome_prev" in self.state_fields(side):
+            self.syndrome_prev = 0
 
 
     def encode(self, u_bits: list, c_prev: list, M=None, mode=None) -> list:
         """Compute v using Δ-syndrome approach with previous state"""
 
-        u_array = np.array(u_bits)
-        v_prev = np.array(c_prev[32:])
+        v_prev = bits_to_int(c_prev[self.k:])
         
-        # Compute current syndrome s_curr = H_U @ u_bits
-        s_curr = (self.H_U @ u_array) % 2
+        # Compute current syndrome s_curr = H_U @ u_bits (packed)
+        s_curr = self.info_syndrome(bits_to_int(u_bits))
         
-        # Compute delta syndrome: s_prev XOR s_curr
-        delta_s = self.syndrome_prev ^ s_curr
-        
-        # Lookup delta_v = get_leader(delta_s)
-        # Convert syndrome to tuple of int64 for lookup
-        delta_s_tuple = tuple(np.int64(x) for x in delta_s)
-        delta_v = get_leader(delta_s_tuple)
-        if delta_v is None:
-            logging.error(f"No coset leader found for syndrome {delta_s}")
-            # Use zero vector as fallback
-            delta_v = np.array([0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0])
+        if self.selection == MIN_TRANSITIONS:
+            # Among all v with H_V @ v = s_curr, take the fewest transitions against v_prev
+            # (ties go to the smallest v_prev XOR v)
+            diffs = self.candidates[s_curr] ^ np.uint64(v_prev)
+            keys = (popcount(diffs).astype(np.uint64) << np.uint64(self.n_V)) | diffs
+            v_curr = v_prev ^ int(diffs[np.argmin(keys)])
         else:
-            delta_v = np.array(delta_v)
-        
-        # Set v_curr = prev_v XOR delta_v
-        v_curr = v_prev ^ delta_v
+            # Compute delta syndrome: s_prev XOR s_curr
+            delta_s = self.syndrome_prev ^ s_curr
+            
+            # Lookup delta_v = coset leader of delta_s, indexed by the packed syndrome
+            delta_v = self._leader_list[delta_s]
+            
+            # Set v_curr = prev_v XOR delta_v
+            v_curr = v_prev ^ delta_v
 
         # Only update syndrome state if not in exhaustive mode (mode 3)
         if mode != 3:
             self.syndrome_prev = s_curr
 
-        c = np.concatenate((u_array, v_curr))
+        c = [int(bit) for bit in u_bits] + int_to_bits(v_curr, self.n_V)
         logging.debug(f"Syndrome-based encoded word:            {c}")
-        return c.tolist()
+        return c
+
+
+    def encode_batch(self, S, c_prev, M=None, mode=None) -> np.ndarray:
+        """
+        Implements: Vectorized Δ-syndrome encoding of a block of words. The Δ-syndromes of the
+                    whole block are looked up with one coset-leader gather, and the redundancy
+                    words follow as a running XOR of the gathered leaders (one fused compiled loop
+                    with the Numba backend). In MIN_TRANSITIONS selection the first word is
+                    measured against the syndrome of c_prev itself.
+
+        Args:
+            S (np.ndarray): Bit matrix of shape (N, k), one information word per row
+            c_prev (list[int]): Codeword on the bus before the first word of the block
+            M (int): Unused parameter for compatibility (default: None)
+            mode (int): Simulation mode; in mode 3 every word is encoded against c_prev
+                        independently and the syndrome state is left unchanged
+
+        Returns:
+            np.ndarray: Bit matrix of shape (N, k + n_V), one codeword per row.
+        """
+        S = np.asarray(S, dtype=np.uint8)
+        if len(S) == 0:
+            return np.empty((0, self.n), dtype=np.uint8)
+        v_prev = np.uint64(bits_to_int(c_prev[self.k:]))
+
+        if self.selection == MIN_TRANSITIONS:
+            s_prev = _table_syndrome(int(v_prev), self._redundancy_tables_list)
+            deltas = self.min_transition_deltas
+        else:
+            s_prev = self.syndrome_prev
+            deltas = self.leader_words
+
+        if kernels.BACKEND == kernels.NUMBA and self.k <= 64:
+            v_curr, s_last = kernels.delta_syndrome_run(pack_rows(S), self.info_tables, deltas, v_prev, s_prev, mode == 3)
+        else:
+            s_curr = _bit_matrix_syndromes(S, self.info_tables)
+            if mode == 3:
+                v_curr = v_prev ^ deltas[s_prev ^ s_curr]
+            else:
+                delta_s = np.empty_like(s_curr)
+                delta_s[0] = s_prev ^ s_curr[0]
+                delta_s[1:] = s_curr[:-1] ^ s_curr[1:]
+                v_curr = v_prev ^ np.bitwise_xor.accumulate(deltas[delta_s])
+            s_last = s_curr[-1]
+
+        if mode != 3:
+            self.syndrome_prev = int(s_last)
+
+        C = np.empty((S.shape[0], self.n), dtype=np.uint8)
+        C[:, :self.k] = S
+        C[:, self.k:] = unpack_rows(v_curr, self.n_V)
+        return C
     
 
     def decode(self, c: list, M=None) -> list:
@@ -85,24 +252,237 @@ class SyndromeBasedEncoder(CodingScheme):
         Implements: Syndrome-based decoder for Δ-syndrome encoding
                     with precomputed coset leaders.
         """
-        c_array = np.array(c)
-        s_curr = (self.H @ c_array) % 2
+        syndrome = self.codeword_syndrome(bits_to_int(c))
+        position = self.error_positions[syndrome]
 
-        if np.all(s_curr == 0):
+        if position == NO_ERROR:
             logging.debug(f"No error detected")
-            return c[:32]
-        else:
-            # Error detected - find which column of H matches the syndrome
-            # The syndrome corresponds to a single-bit error at the position
-            # where the column index matches the bit position in c
-            for col_idx in range(self.H.shape[1]):
-                if np.array_equal(s_curr, self.H[:, col_idx]):
-                    # Flip the bit at position col_idx
-                    c_corrected = c.copy()
-                    c_corrected[col_idx] = 1 - c_corrected[col_idx]
-                    logging.debug(f"Error detected and corrected at bit position {col_idx}")
-                    return c_corrected[:32]
-            
-            # If no matching column found, this is an uncorrectable error
-            logging.warning(f"Uncorrectable error detected - syndrome {s_curr} not found in H matrix")
-            return c[:32]  # Return original data without correction
+            return c[:self.k]
+
+        if position == UNCORRECTABLE:
+            logging.warning(f"Uncorrectable error detected - syndrome {syndrome:0{self.r}b} not found in H matrix")
+            return c[:self.k]  # Return original data without correction
+
+        # Flip the bit at the position whose column of H matches the syndrome
+        c_corrected = c.copy()
+        c_corrected[position] = 1 - c_corrected[position]
+        logging.debug(f"Error detected and corrected at bit position {position}")
+        return c_corrected[:self.k]
+
+
+    def decode_batch(self, C, M=None) -> np.ndarray:
+        """
+        Implements: Vectorized syndrome-based decoding of a block of codewords, correcting
+                    single-bit errors with one gather from the syndrome decoding table and one
+                    bit flip per corrected row.
+
+        Args:
+            C (np.ndarray): Bit matrix of shape (N, k + n_V), one received codeword per row
+            M (int): Unused parameter for compatibility (default: None)
+
+        Returns:
+            np.ndarray: Bit matrix of shape (N, k), one decoded word per row.
+        """
+        C = np.array(C, dtype=np.uint8)
+        positions = self.error_positions[_bit_matrix_syndromes(C, self.tables)]
+
+        uncorrectable = np.count_nonzero(positions == UNCORRECTABLE)
+        if uncorrectable:
+            logging.warning(f"Uncorrectable errors detected in {uncorrectable} codewords")
+
+        rows = np.flatnonzero(positions >= 0)
+        C[rows, positions[rows]] ^= 1
+        return C[:, :self.k]
+
+
+    def info_syndrome(self, u_packed: int) -> int:
+        """
+        Implements: Syndrome H_U @ u of a packed information word from the byte-sliced tables.
+
+        Args:
+            u_packed (int): Information word packed with its first bit as the MSB
+
+        Returns:
+            int: Packed syndrome (first row of H in the MSB).
+        """
+        return _table_syndrome(u_packed, self._info_tables_list)
+
+
+    def info_syndromes(self, words: np.ndarray) -> np.ndarray:
+        """
+        Implements: Syndromes H_U @ u of a block of packed information words, one table gather
+                    per byte XORed together (four gathers and three XORs for 32-bit words).
+
+        Args:
+            words (np.ndarray): Packed information words (uint64)
+
+        Returns:
+            np.ndarray: Packed syndromes (intp), usable as table indices.
+        """
+        return _table_syndromes(words, self.info_tables)
+
+
+    def codeword_syndrome(self, c_packed: int) -> int:
+        """
+        Implements: Syndrome H @ c of a packed codeword from the byte-sliced tables.
+
+        Args:
+            c_packed (int): Codeword packed with its first bit as the MSB
+
+        Returns:
+            int: Packed syndrome (first row of H in the MSB).
+        """
+        return _table_syndrome(c_packed, self._tables_list)
+
+
+    def codeword_syndromes(self, words: np.ndarray) -> np.ndarray:
+        """
+        Implements: Syndromes H @ c of a block of packed codewords from the byte-sliced tables.
+
+        Args:
+            words (np.ndarray): Packed codewords (uint64)
+
+        Returns:
+            np.ndarray: Packed syndromes (intp), usable as table indices.
+        """
+        return _table_syndromes(words, self.tables)
+
+
+def _build_syndrome_decode_table(H: GF2Matrix) -> np.ndarray:
+    """
+    Implements: Precomputation of the syndrome decoding table: a single-bit error at position j
+                produces column j of H as its syndrome, every other nonzero syndrome is uncorrectable.
+
+    Args:
+        H (GF2Matrix): Parity check matrix (r × n)
+
+    Returns:
+        np.ndarray: Error position per packed syndrome (NO_ERROR / UNCORRECTABLE for special entries).
+    """
+    r, n = H.shape
+    positions = np.full(1 << r, UNCORRECTABLE, dtype=np.int16)
+    positions[0] = NO_ERROR
+
+    # Reverse order so that the first matching column wins, as in a left-to-right scan
+    for col_idx in reversed(range(n)):
+        positions[H.column_ints[col_idx]] = col_idx
+
+    return positions
+
+
+def _build_candidate_table(leader_words: np.ndarray, kernel: GF2Matrix) -> np.ndarray:
+    """
+    Implements: Enumeration of every valid redundancy vector per syndrome: row s holds, in
+                increasing order, all packed v with H_V @ v = s (2^(n_V - r) = 128 for H_V 6×13),
+                i.e. the coset leader of s XORed with every vector of the null space of H_V.
+
+    Args:
+        leader_words (np.ndarray): Packed coset leader (uint64) per packed syndrome
+        kernel (GF2Matrix): Null space basis of H_V, one basis vector per row
+
+    Returns:
+        np.ndarray: Packed candidates (uint64) of shape (2^r, 2^(n_V - r)).
+    """
+    null_space = np.zeros(1, dtype=np.uint64)
+    for basis_vector in kernel.row_ints:
+        null_space = np.concatenate([null_space, null_space ^ np.uint64(basis_vector)])
+    return np.sort(leader_words[:, None] ^ null_space[None, :], axis=1)
+
+
+def _min_transition_deltas(candidates: np.ndarray, n_V: int) -> np.ndarray:
+    """
+    Implements: Per-Δ-syndrome minimum-transition redundancy change: the lowest-weight member of
+                each coset, ties broken by the smallest packed value (vectorized popcount argmin).
+
+    Args:
+        candidates (np.ndarray): Candidate table from _build_candidate_table
+        n_V (int): Number of redundancy bits
+
+    Returns:
+        np.ndarray: Packed redundancy change (uint64) per packed Δ-syndrome.
+    """
+    keys = (popcount(candidates).astype(np.uint64) << np.uint64(n_V)) | candidates
+    return candidates[np.arange(candidates.shape[0]), np.argmin(keys, axis=1)]
+
+
+def _build_byte_tables(H: GF2Matrix) -> np.ndarray:
+    """
+    Implements: Byte-sliced syndrome tables of a parity check matrix. Since the syndrome is
+                linear over GF(2), the syndrome of a packed word is the XOR over its bytes of
+                the syndrome of each byte alone, so one 256-entry table per byte suffices.
+
+    Args:
+        H (GF2Matrix): Parity check matrix (r × n), column j is bit n-1-j of a packed word
+
+    Returns:
+        np.ndarray: Array of shape (ceil(n / 8), 256) with tables[b, v] = packed syndrome of
+                    byte value v at byte b (byte 0 holds the least significant bits).
+    """
+    n = H.shape[1]
+    column_syndromes = H.column_ints
+
+    tables = np.zeros(((n + 7) // 8, 256), dtype=np.intp)
+    for byte_idx in range(tables.shape[0]):
+        for bit in range(8):
+            pos = 8 * byte_idx + bit
+            if pos >= n:
+                break
+            # Extend the table from 2^bit to 2^(bit+1) entries with the new column
+            tables[byte_idx, 1 << bit:2 << bit] = tables[byte_idx, :1 << bit] ^ column_syndromes[n - 1 - pos]
+    return tables
+
+
+def _table_syndrome(packed: int, tables: list) -> int:
+    """
+    Implements: Syndrome of a packed word as the XOR of its per-byte table entries.
+
+    Args:
+        packed (int): Word packed with its first bit as the MSB
+        tables (list[list[int]]): Byte-sliced syndrome tables
+
+    Returns:
+        int: Packed syndrome.
+    """
+    syndrome = 0
+    for table in tables:
+        syndrome ^= table[packed & 0xFF]
+        packed >>= 8
+    return syndrome
+
+
+def _table_syndromes(words: np.ndarray, tables: np.ndarray) -> np.ndarray:
+    """
+    Implements: Vectorized syndromes of a block of packed words, one gather per byte.
+
+    Args:
+        words (np.ndarray): Packed words (uint64)
+        tables (np.ndarray): Byte-sliced syndrome tables
+
+    Returns:
+        np.ndarray: Packed syndromes (intp).
+    """
+    words = np.asarray(words, dtype=np.uint64)
+    syndromes = tables[0][words & np.uint64(0xFF)]
+    for byte_idx in range(1, tables.shape[0]):
+        syndromes ^= tables[byte_idx][(words >> np.uint64(8 * byte_idx)) & np.uint64(0xFF)]
+    return syndromes
+
+
+def _bit_matrix_syndromes(bits: np.ndarray, tables: np.ndarray) -> np.ndarray:
+    """
+    Implements: Vectorized syndromes of a bit matrix of any width, packed 64 columns at a time
+                from the right so that each chunk uses its own eight byte-sliced tables.
+
+    Args:
+        bits (np.ndarray): Bit matrix of shape (N, width), first column is the MSB
+        tables (np.ndarray): Byte-sliced syndrome tables of the matching parity check matrix
+
+    Returns:
+        np.ndarray: Packed syndromes (intp).
+    """
+    width = bits.shape[1]
+    syndromes = np.zeros(bits.shape[0], dtype=np.intp)
+    for low in range(0, width, 64):
+        words = pack_rows(bits[:, max(width - low - 64, 0):width - low])
+        syndromes ^= _table_syndromes(words, tables[low // 8:low // 8 + 8])
+    return syndromes
@@ -16,7 +16,7 @@ from coding_schemes.syndrome_based import syndrome_based_encoder
 SIMULATION_PARAMS = {
     'INPUT_BITS': {
         'value': 32,
-        'range': (4, 32),
+        'range': (4, 128),
         'description': 'Number of input bits (k). Must be at least 4 for error correction.'
     },
     'NUM_RANDOM_WORDS': {
@@ -33,9 +33,44 @@ SIMULATION_PARAMS = {
         'value': 0.5,
         'range': (0.0, 1.0),
         'description': 'Probability of bit errors in transmission.'
+    },
+    'CI_TARGET': {
+        'value': 0.0,
+        'range': (0.0, 1.0),
+        'description': 'Relative confidence interval half-width at which random and LFSR runs stop early (0 runs exactly NUM_RANDOM_WORDS words).'
+    },
+    'CONFIDENCE_LEVEL': {
+        'value': 0.95,
+        'range': (0.5, 0.9999),
+        'description': 'Confidence level of the reported intervals.'
+    },
+    'MAX_RANDOM_WORDS': {
+        'value': 1000000,
+        'range': (100, 100000000),
+        'description': 'Word budget of runs with early stopping (NUM_RANDOM_WORDS is then the minimum).'
+    },
+    'COUPLING_FACTOR': {
+        'value': 2.8,
+        'range': (0.0, 10.0),
+        'description': 'Coupling to ground capacitance ratio (λ) of adjacent wires, weighting crosstalk energy.'
     }
 }
 
+# Bus energy model: capacitances in fF (one value for every wire/pair, or a list per wire/pair
+# in codeword order), supply voltage in V
+BUS_ENERGY_MODEL = {
+    'self_capacitance': 50.0,
+    'coupling_capacitance': 140.0,
+    'repeater_capacitance': 0.0,
+    'vdd': 1.0
+}
+
+# Transition histogram dump in the FPGA register file format (None to skip), e.g. "m4_registers.txt"
+REGISTER_DUMP_PATH = None
+
+# cProfile the first words of a run and print the most expensive functions (None to skip), e.g. 2000
+PROFILE_WORDS = None
+
 # Schemes from Paper 1: "Memory Bus Encoding for Low Power: A Tutorial"
 PAPER1_SCHEMES = {
     1: transition_signaling.Transition_Signaling(),
@@ -53,7 +88,8 @@ PAPER2_SCHEMES = {
 
 # Syndrome-based Error Correction Scheme
 SYNDROME_SCHEMES = {
-    8: syndrome_based_encoder.SyndromeBasedEncoder()
+    8: syndrome_based_encoder.SyndromeBasedEncoder(),
+    9: syndrome_based_encoder.SyndromeBasedEncoder(selection=syndrome_based_encoder.MIN_TRANSITIONS)
 }
 
 # Combined schemes dictionary
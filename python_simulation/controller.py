@@ -9,9 +9,9 @@
 """
 
 import logging
-from core import simulator
+from core import simulator, transition_histogram, crosstalk, energy
 from config.logging_config import configure_logging
-from config.simulation_config import SIMULATION_PARAMS, SCHEMES, SIMULATION_MODES
+from config.simulation_config import SIMULATION_PARAMS, SCHEMES, SYNDROME_SCHEMES, SIMULATION_MODES, REGISTER_DUMP_PATH, PROFILE_WORDS
 import time
 
 
@@ -32,7 +32,7 @@ def controller():
     params = _validate_simulation_params()
     if params is None:
         return
-    k, t, M, error_p = params
+    k, t, M, error_p, coupling, ci_target, confidence, max_words = params
 
     scheme_choice = int(input(_get_scheme_prompt()))
     if scheme_choice not in SCHEMES:
@@ -41,11 +41,12 @@ def controller():
     
     coding_scheme = SCHEMES[scheme_choice]
     
-    # Verify syndrome-based encoder requires exactly 32 bits
-    if scheme_choice == 8:  # Syndrome-based encoder
-        if k != 32:
-            controller_logger.error(f"Syndrome-based encoder requires exactly 32 bits, but {k} bits were configured.")
-            controller_logger.error("Please update the INPUT_BITS value in simulation_config.py to 32.")
+    # Syndrome-based encoders build (or load from cache) their matrices for the configured k
+    if scheme_choice in SYNDROME_SCHEMES:
+        try:
+            coding_scheme = coding_scheme.for_info_bits(k)
+        except (ValueError, RuntimeError) as e:
+            controller_logger.error(f"Cannot build a syndrome-based code for {k} bits: {e}")
             return
 
     generator_choice = int(input(_get_mode_prompt()))
@@ -58,9 +59,15 @@ def controller():
         t = 2 ** k
 
     start = time.perf_counter()   
-    max_transitions, avg_transitions, simulation_success = simulator.simulate(coding_scheme, k, t, error_p, M=M, mode=generator_choice)
+    max_transitions, avg_transitions, simulation_success = simulator.simulate(
+        coding_scheme, k, t, error_p, M=M, mode=generator_choice,
+        ci_target=ci_target or None, max_words=max_words, confidence=confidence, profile_words=PROFILE_WORDS)
     elapsed = time.perf_counter() - start
 
+    # Early stopping may end a run before or after t words
+    t = simulator.run_statistics['words']
+    transitions_estimate = simulator.run_statistics['transitions']
+
     # Check if simulation failed
     if not simulation_success:
         return
@@ -71,7 +78,7 @@ def controller():
     print("Parameters: ")
     print(f"    - Input word length (k): {k} bits")
     print(f"    - Data generation: {SIMULATION_MODES[generator_choice]}")
-    print(f"    - Total words processes: {t}")
+    print(f"    - Total words processes: {t}" + (" (stopped at CI target)" if simulator.run_statistics['stopped_early'] else ""))
     print(f"    - Error probability: {error_p}")
     if scheme_choice == 1:  
         print(f"    - M = {M}")
@@ -79,10 +86,35 @@ def controller():
     print("\nResults: ")
 
     print(f"    - Maximum transitions: {max_transitions}")
-    print(f"    - Average transitions: {avg_transitions / t:.4f}")
+    reg_num, sum_value = transition_histogram.register_outputs()
+    print(f"    - Histogram registers: reg_num = {reg_num}, sum_value = {sum_value}")
+    print(f"    - Average transitions: {avg_transitions / t:.4f} "
+          f"(± {transitions_estimate.half_width():.4f} at {confidence:.0%} confidence)")
+    classes, self_energy, coupling_energy = crosstalk.crosstalk_count()
+    print(f"    - Crosstalk classes (0C-4C): {', '.join(f'{c}C: {count}' for c, count in enumerate(classes))}")
+    print(f"    - Average crosstalk energy (λ = {coupling}): "
+          f"{crosstalk.crosstalk_energy(self_energy, coupling_energy, coupling) / t:.4f}")
+    max_energy, total_energy = energy.energy_count()
+    print(f"    - Bus energy: {total_energy / t:.4f} pJ/word average, {max_energy:.4f} pJ maximum")
     print(f"    - Area overhead: {coding_scheme.get_bus_size(k, M) - k} bits ({(coding_scheme.get_bus_size(k, M) - k) / k:.2%})")
     print(f"    - Simulation Duration: {elapsed:.4f} seconds\n")
 
+    profile = simulator.run_statistics['profile']
+    print(f"Stage breakdown (1 in {profile.sample_interval} words timed):")
+    for stage, seconds, share in profile.breakdown():
+        print(f"    - {stage:<16} {seconds:>9.4f} s  {share:>6.1%}")
+    print()
+
+    word_profiler = simulator.run_statistics['word_profiler']
+    if word_profiler is not None:
+        print(f"cProfile of the first {word_profiler.num_words} words:")
+        print(word_profiler.report())
+
+    if REGISTER_DUMP_PATH is not None:
+        header = f"m={M}:" if scheme_choice == 4 else coding_scheme.name
+        transition_histogram.write_registers(REGISTER_DUMP_PATH, header)
+        controller_logger.info(f"Transition histogram registers written to {REGISTER_DUMP_PATH}")
+
     controller_logger.debug("Simulation ended")
 
 
@@ -140,7 +172,7 @@ def _get_mode_prompt() -> str:
     return prompt
 
 
-def _validate_simulation_params() -> tuple[int, int, int, float]:
+def _validate_simulation_params() -> tuple[int, int, int, float, float, float, float, int]:
     """
     Implements: Validation of all simulation parameters from configuration file,
                 ensuring they fall within acceptable ranges and satisfy constraints.
@@ -149,7 +181,8 @@ def _validate_simulation_params() -> tuple[int, int, int, float]:
         None
 
     Returns:
-        tuple[int, int, int, float]: Validated parameters (k, t, M, error_p) or None if validation fails.
+        tuple[int, int, int, float, float, float, float, int]: Validated parameters (k, t, M, error_p, coupling,
+                                                                ci_target, confidence, max_words) or None if validation fails.
     """
     try:
         # Validate input bits (k)
@@ -183,7 +216,33 @@ def _validate_simulation_params() -> tuple[int, int, int, float]:
             logging.error(f"Invalid error probability in config: {error_p}. Must be between {error_range[0]} and {error_range[1]}")
             return None
 
-        return k, t, M, error_p
+        # Validate coupling factor (λ)
+        coupling = SIMULATION_PARAMS['COUPLING_FACTOR']['value']
+        coupling_range = SIMULATION_PARAMS['COUPLING_FACTOR']['range']
+        if not (coupling_range[0] <= coupling <= coupling_range[1]):
+            logging.error(f"Invalid coupling factor in config: {coupling}. Must be between {coupling_range[0]} and {coupling_range[1]}")
+            return None
+
+        # Validate early stopping parameters
+        ci_target = SIMULATION_PARAMS['CI_TARGET']['value']
+        ci_range = SIMULATION_PARAMS['CI_TARGET']['range']
+        if not (ci_range[0] <= ci_target <= ci_range[1]):
+            logging.error(f"Invalid CI target in config: {ci_target}. Must be between {ci_range[0]} and {ci_range[1]}")
+            return None
+
+        confidence = SIMULATION_PARAMS['CONFIDENCE_LEVEL']['value']
+        confidence_range = SIMULATION_PARAMS['CONFIDENCE_LEVEL']['range']
+        if not (confidence_range[0] <= confidence <= confidence_range[1]):
+            logging.error(f"Invalid confidence level in config: {confidence}. Must be between {confidence_range[0]} and {confidence_range[1]}")
+            return None
+
+        max_words = SIMULATION_PARAMS['MAX_RANDOM_WORDS']['value']
+        max_words_range = SIMULATION_PARAMS['MAX_RANDOM_WORDS']['range']
+        if not (max_words_range[0] <= max_words <= max_words_range[1]):
+            logging.error(f"Invalid word budget in config: {max_words}. Must be between {max_words_range[0]} and {max_words_range[1]}")
+            return None
+
+        return k, t, M, error_p, coupling, ci_target, confidence, max_words
     except KeyError as e:
         logging.error(f"Missing parameter in config file: {e}")
         return None
@@ -0,0 +1,118 @@
+"""
+======================================================
+    Power Efficient Error Correction Encoding for
+            On-Chip Interconnection Links
+
+            Shlomit Lenefsky & Omri Triki
+                        06.2025
+======================================================
+"""
+
+import math
+from statistics import NormalDist
+import numpy as np
+
+
+class RunningEstimate:
+    """
+    Implements: Online estimate of the mean of a per-word quantity (transitions, or 0/1 error
+                indicators for a rate) with a normal-approximation confidence interval. Blocks of
+                samples are merged with the parallel form of Welford's algorithm, so the estimate
+                is numerically stable at any number of words.
+
+    Args:
+        confidence (float): Confidence level of the interval (default: 0.95)
+
+    Returns:
+        None (class definition)
+    """
+
+    def __init__(self, confidence=0.95):
+        self.confidence = confidence
+        self.z = NormalDist().inv_cdf((1 + confidence) / 2)
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0  # Sum of squared deviations from the mean
+
+
+    def update(self, values) -> None:
+        """
+        Implements: Merge of a block of samples into the running mean and variance.
+
+        Args:
+            values (array-like): Samples of the block
+
+        Returns:
+            None
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if values.size == 0:
+            return
+        block_count = values.size
+        block_mean = float(values.mean())
+        block_m2 = float(((values - block_mean) ** 2).sum())
+
+        total = self.count + block_count
+        delta = block_mean - self.mean
+        self.mean += delta * block_count / total
+        self.m2 += block_m2 + delta ** 2 * self.count * block_count / total
+        self.count = total
+
+
+    def variance(self) -> float:
+        """
+        Implements: Unbiased sample variance.
+
+        Args:
+            None
+
+        Returns:
+            float: Variance (0 with fewer than two samples).
+        """
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+
+    def half_width(self) -> float:
+        """
+        Implements: Half-width of the confidence interval of the mean, z * s / sqrt(count).
+
+        Args:
+            None
+
+        Returns:
+            float: Half-width (infinite with fewer than two samples).
+        """
+        if self.count < 2:
+            return math.inf
+        return self.z * math.sqrt(self.variance() / self.count)
+
+
+    def relative_half_width(self) -> float:
+        """
+        Implements: Half-width of the confidence interval relative to the mean.
+
+        Args:
+            None
+
+        Returns:
+            float: Relative half-width (0 for a constant zero quantity, infinite for a zero mean
+                   with spread or too few samples).
+        """
+        half_width = self.half_width()
+        if self.mean == 0:
+            return 0.0 if half_width == 0 else math.inf
+        return half_width / abs(self.mean)
+
+
+    def interval(self) -> tuple:
+        """
+        Implements: The confidence interval of the mean.
+
+        Args:
+            None
+
+        Returns:
+            tuple[float, float]: Lower and upper bound.
+        """
+        half_width = self.half_width()
+        return self.mean - half_width, self.mean + half_width
@@ -0,0 +1,104 @@
+"""
+======================================================
+    Power Efficient Error Correction Encoding for
+            On-Chip Interconnection Links
+
+            Shlomit Lenefsky & Omri Triki
+                        06.2025
+======================================================
+"""
+
+import logging
+import numpy as np
+
+
+# Crosstalk classes 0C-4C: coupling capacitances effectively switched by a transitioning wire
+NUM_CLASSES = 5
+
+# Global variables
+class_histogram = np.zeros(NUM_CLASSES, dtype=np.int64)
+self_energy = 0
+coupling_energy = 0
+
+
+def transition_classes(C, C_prev) -> tuple:
+    """
+    Implements: Vectorized crosstalk classification of a block of bus words. With every wire
+                moving by d in {-1, 0, +1}, a transitioning wire i is in class pC where
+                p = sum over its neighbours j of |d_i - d_j| (0C: neighbours move with it,
+                4C: both neighbours move against it; edge wires have one neighbour). Wires are
+                taken to be laid out in codeword order, so shielding and duplicated bits sit
+                next to the wires they protect.
+
+    Args:
+        C (np.ndarray): Bit matrix of shape (N, n), one bus word per row
+        C_prev (np.ndarray): Bit matrix of shape (N, n), the bus word before each row of C
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: Class of every wire (N, n) with -1 for wires
+                                                   that do not switch, and per word the self
+                                                   term sum(d_i^2) and coupling term
+                                                   sum((d_i - d_{i+1})^2) of the energy.
+    """
+    d = np.asarray(C, dtype=np.int8) - np.asarray(C_prev, dtype=np.int8)
+    relative = d[:, 1:] - d[:, :-1]
+
+    abs_relative = np.abs(relative)
+    classes = np.zeros(d.shape, dtype=np.int8)
+    classes[:, :-1] += abs_relative
+    classes[:, 1:] += abs_relative
+    classes[d == 0] = -1
+
+    self_terms = np.count_nonzero(d, axis=1)
+    coupling_terms = (relative.astype(np.int64) ** 2).sum(axis=1)
+    return classes, self_terms, coupling_terms
+
+
+def crosstalk_energy(self_terms, coupling_terms, coupling_factor):
+    """
+    Implements: λ-weighted bus energy in units of the wire-to-ground capacitance times Vdd²:
+                E = sum(d_i^2) + λ * sum((d_i - d_{i+1})^2).
+
+    Args:
+        self_terms: Self (ground capacitance) term(s) from transition_classes
+        coupling_terms: Coupling term(s) from transition_classes
+        coupling_factor (float): λ, coupling to ground capacitance ratio of adjacent wires
+
+    Returns:
+        float | np.ndarray: Energy of the given word(s).
+    """
+    return self_terms + coupling_factor * coupling_terms
+
+
+def crosstalk_count(C=None, C_prev=None, RESET=False) -> tuple:
+    """
+    Implements: Accumulation of crosstalk statistics over blocks of consecutive bus words,
+                maintaining the 0C-4C class histogram and both energy terms like the running
+                counters of transition_count.
+
+    Args:
+        C (np.ndarray): Bit matrix of bus words, or None to only read the counters (default: None)
+        C_prev (np.ndarray): Bit matrix of the bus word before each row of C (default: None)
+        RESET (bool): Flag to reset global counters to initial state (default: False)
+
+    Returns:
+        tuple[np.ndarray, int, int]: Class histogram (count of switching wires per class) and
+                                     cumulative self and coupling energy terms.
+    """
+    global class_histogram
+    global self_energy
+    global coupling_energy
+
+    if RESET:
+        class_histogram = np.zeros(NUM_CLASSES, dtype=np.int64)
+        self_energy = 0
+        coupling_energy = 0
+        logging.debug("Crosstalk counters have been reset")
+
+    if C is not None and len(C) > 0:
+        classes, self_terms, coupling_terms = transition_classes(C, C_prev)
+        class_histogram = class_histogram + np.bincount(classes[classes >= 0], minlength=NUM_CLASSES)
+        self_energy += int(self_terms.sum())
+        coupling_energy += int(coupling_terms.sum())
+
+    return class_histogram.copy(), self_energy, coupling_energy
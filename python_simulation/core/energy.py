@@ -0,0 +1,154 @@
+"""
+======================================================
+    Power Efficient Error Correction Encoding for
+            On-Chip Interconnection Links
+
+            Shlomit Lenefsky & Omri Triki
+                        06.2025
+======================================================
+"""
+
+import logging
+import numpy as np
+
+
+# Capacitances are given in fF and Vdd in V, so C * Vdd^2 is in fJ
+FJ_PER_PJ = 1000.0
+
+# Global variables
+total_energy = 0.0
+max_energy = 0.0
+
+
+class BusEnergyModel:
+    """
+    Implements: Energy model of a routed bus with per-wire capacitance to ground (wire plus the
+                repeaters driving it) and per-neighbour coupling capacitance. A transition
+                drawing charge onto capacitance C dissipates C * Vdd^2 / 2, so with every wire
+                moving by d in {-1, 0, +1} a bus cycle dissipates
+                Vdd^2 / 2 * (sum_i C_self,i * d_i^2 + sum_i C_coupling,i * (d_i - d_{i+1})^2).
+                Wires are taken to be laid out in codeword order.
+
+    Args:
+        self_capacitance (float | list[float]): Wire-to-ground capacitance in fF, per wire or
+                                                one value for every wire
+        coupling_capacitance (float | list[float]): Capacitance in fF between wire i and i+1,
+                                                    per neighbour pair or one value for every pair
+        vdd (float): Supply voltage in V
+        repeater_capacitance (float | list[float]): Repeater capacitance in fF added to each
+                                                    wire's self capacitance (default: 0.0)
+
+    Returns:
+        None (class definition)
+    """
+
+    def __init__(self, self_capacitance, coupling_capacitance, vdd, repeater_capacitance=0.0):
+        self.self_capacitance = self_capacitance
+        self.coupling_capacitance = coupling_capacitance
+        self.vdd = vdd
+        self.repeater_capacitance = repeater_capacitance
+
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        Implements: Construction from an energy configuration dictionary (see BUS_ENERGY_MODEL).
+
+        Args:
+            config (dict): Dictionary with 'self_capacitance', 'coupling_capacitance', 'vdd' and
+                           optionally 'repeater_capacitance'
+
+        Returns:
+            BusEnergyModel: The configured model.
+        """
+        return cls(config['self_capacitance'], config['coupling_capacitance'], config['vdd'],
+                   config.get('repeater_capacitance', 0.0))
+
+
+    def capacitances(self, n) -> tuple:
+        """
+        Implements: Capacitance vectors of an n-wire bus, broadcasting single values.
+
+        Args:
+            n (int): Bus width
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Self capacitance per wire (n) including repeaters,
+                                           and coupling capacitance per neighbour pair (n - 1), in fF.
+        """
+        self_cap = _profile(self.self_capacitance, n, "self capacitance")
+        self_cap = self_cap + _profile(self.repeater_capacitance, n, "repeater capacitance")
+        coupling_cap = _profile(self.coupling_capacitance, n - 1, "coupling capacitance")
+        return self_cap, coupling_cap
+
+
+    def cycle_energies(self, C, C_prev) -> np.ndarray:
+        """
+        Implements: Vectorized energy of every bus cycle of a block: the transition mask and the
+                    coupling mask (d_i - d_{i+1})^2 of each word are multiplied with the self and
+                    coupling capacitance vectors.
+
+        Args:
+            C (np.ndarray): Bit matrix of shape (N, n), one bus word per row
+            C_prev (np.ndarray): Bit matrix of shape (N, n), the bus word before each row of C
+
+        Returns:
+            np.ndarray: Energy of each cycle in pJ.
+        """
+        d = np.asarray(C, dtype=np.int8) - np.asarray(C_prev, dtype=np.int8)
+        self_cap, coupling_cap = self.capacitances(d.shape[1])
+
+        transition_mask = (d != 0).astype(np.float64)
+        coupling_mask = ((d[:, 1:] - d[:, :-1]) ** 2).astype(np.float64)
+        charge = transition_mask @ self_cap + coupling_mask @ coupling_cap
+        return 0.5 * self.vdd ** 2 * charge / FJ_PER_PJ
+
+
+def energy_count(C=None, C_prev=None, model=None, RESET=False) -> tuple:
+    """
+    Implements: Accumulation of bus energy over blocks of consecutive bus words, maintaining the
+                running total and the highest single-cycle energy like transition_count.
+
+    Args:
+        C (np.ndarray): Bit matrix of bus words, or None to only read the counters (default: None)
+        C_prev (np.ndarray): Bit matrix of the bus word before each row of C (default: None)
+        model (BusEnergyModel): Energy model of the bus (default: None)
+        RESET (bool): Flag to reset global counters to initial state (default: False)
+
+    Returns:
+        tuple[float, float]: Highest single-cycle energy and cumulative energy, in pJ.
+    """
+    global total_energy
+    global max_energy
+
+    if RESET:
+        total_energy = 0.0
+        max_energy = 0.0
+        logging.debug("Energy counters have been reset")
+
+    if C is not None and len(C) > 0:
+        energies = model.cycle_energies(C, C_prev)
+        total_energy += float(energies.sum())
+        max_energy = max(max_energy, float(energies.max()))
+
+    return max_energy, total_energy
+
+
+def _profile(values, length, label) -> np.ndarray:
+    """
+    Implements: A capacitance profile of the given length from a single value or a vector.
+
+    Args:
+        values (float | list[float]): Single value or per-wire vector
+        length (int): Required length
+        label (str): Profile name for error messages
+
+    Returns:
+        np.ndarray: Profile as float64.
+    """
+    profile = np.asarray(values, dtype=np.float64)
+    if profile.ndim == 0:
+        return np.full(length, float(profile))
+    if profile.shape != (length,):
+        raise ValueError(f"The {label} profile has {profile.size} entries, expected {length}")
+    return profile
@@ -9,6 +9,7 @@
 """
 
 import random
+import numpy as np
 
 
 def generate_error(n, error_probability=0.1) -> list[int]:
@@ -35,4 +36,24 @@ def generate_error(n, error_probability=0.1) -> list[int]:
     random_index = random.randint(0, n - 1)
     error_vector[random_index] = 1
 
-    return error_vector
\ No newline at end of file
+    return error_vector
+
+
+def apply_error_batch(C, error_probability, rng) -> np.ndarray:
+    """
+    Implements: Vectorized form of generate_error applied to a block of bus words: every word
+                independently gets a single bit error at a random position with the given
+                probability.
+
+    Args:
+        C (np.ndarray): Bit matrix of shape (N, n), one bus word per row
+        error_probability (float): Probability of a single bit error per word
+        rng (np.random.Generator): Random generator
+
+    Returns:
+        np.ndarray: Copy of C with the errors applied.
+    """
+    C = np.array(C, dtype=np.uint8)
+    hit = np.flatnonzero(rng.random(len(C)) <= error_probability)
+    C[hit, rng.integers(0, C.shape[1], size=len(hit))] ^= 1
+    return C
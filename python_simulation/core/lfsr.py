@@ -50,3 +50,37 @@ def lfsr(k, polynomial = 0b10000000011011) -> list[int]:
     s = [register[-1] for register in lfsr.registers]
 
     return s
+
+
+def get_registers():
+    """
+    Implements: Snapshot of the LFSR registers, so that an LFSR run can be continued elsewhere
+                (e.g. the next segment of a long run on another worker) with set_registers.
+
+    Args:
+        None
+
+    Returns:
+        list[list[int]] | None: Copy of the register contents, or None before the first word.
+    """
+    if not hasattr(lfsr, 'registers'):
+        return None
+    return [register[:] for register in lfsr.registers]
+
+
+def set_registers(registers) -> None:
+    """
+    Implements: Restoring the LFSR registers from a snapshot taken by get_registers
+                (None re-seeds them randomly on the next word).
+
+    Args:
+        registers (list[list[int]] | None): Register contents
+
+    Returns:
+        None
+    """
+    if registers is None:
+        if hasattr(lfsr, 'registers'):
+            del lfsr.registers
+        return
+    lfsr.registers = [[int(bit) for bit in register] for register in registers]
@@ -0,0 +1,371 @@
+"""
+======================================================
+    Power Efficient Error Correction Encoding for
+            On-Chip Interconnection Links
+
+            Shlomit Lenefsky & Omri Triki
+                        06.2025
+======================================================
+"""
+
+import copy
+import multiprocessing
+import numpy as np
+from coding_schemes.base_coding_scheme import ENCODER, DECODER
+from core import error_generator
+
+
+# Default ring geometry: blocks of bus words, and blocks in flight between the endpoints
+DEFAULT_BLOCK_SIZE = 4096
+DEFAULT_NUM_BLOCKS = 8
+
+# Word count written to a ring slot to mark the end of the stream
+END_OF_STREAM = 0
+
+# Seconds between checks for an aborted link while an endpoint waits for a ring slot
+POLL_INTERVAL = 0.1
+
+
+class LinkAborted(RuntimeError):
+    """The link was aborted because the other endpoint failed"""
+
+
+class Transmitter:
+    """
+    Implements: Transmitting endpoint of a link: a private copy of the coding scheme used only
+                for encoding, and the bus word it drove last. Nothing is shared with the
+                receiver except the bus words themselves.
+
+    Args:
+        coding_scheme: The coding scheme object (copied, including its encoder state)
+        k (int): Number of input bits per word
+        M (int): Scheme-specific parameter (default: None)
+
+    Returns:
+        None (class definition)
+    """
+
+    def __init__(self, coding_scheme, k, M=None):
+        self.scheme = copy.deepcopy(coding_scheme)
+        self.scheme.reset_state(DECODER)
+        self.M = M
+        self.c_prev = [0] * self.scheme.get_bus_size(k, M)
+
+
+    def send(self, s) -> list[int]:
+        """
+        Implements: Encoding of one word against the bus and driving it onto the bus.
+
+        Args:
+            s (list[int]): Input word
+
+        Returns:
+            list[int]: Bus word.
+        """
+        self.c_prev = self.scheme.encode(list(s), self.c_prev, self.M)
+        return self.c_prev
+
+
+    def send_batch(self, S) -> np.ndarray:
+        """
+        Implements: Encoding of a block of consecutive words with the scheme's batch encoder.
+
+        Args:
+            S (np.ndarray): Bit matrix of shape (N, k), one input word per row
+
+        Returns:
+            np.ndarray: Bit matrix of shape (N, n), one bus word per row.
+        """
+        C = self.scheme.encode_batch(S, self.c_prev, self.M)
+        self.c_prev = C[-1].tolist()
+        return C
+
+
+class Receiver:
+    """
+    Implements: Receiving endpoint of a link: a private copy of the coding scheme used only
+                for decoding the bus words it observes.
+
+    Args:
+        coding_scheme: The coding scheme object (copied, including its decoder state)
+        M (int): Scheme-specific parameter (default: None)
+
+    Returns:
+        None (class definition)
+    """
+
+    def __init__(self, coding_scheme, M=None):
+        self.scheme = copy.deepcopy(coding_scheme)
+        self.scheme.reset_state(ENCODER)
+        self.M = M
+
+
+    def receive(self, c) -> list[int]:
+        """
+        Implements: Decoding of one bus word.
+
+        Args:
+            c (list[int]): Bus word as received
+
+        Returns:
+            list[int]: Decoded word.
+        """
+        return self.scheme.decode(list(c), self.M)
+
+
+    def receive_batch(self, C) -> np.ndarray:
+        """
+        Implements: Decoding of a block of consecutive bus words with the scheme's batch decoder.
+
+        Args:
+            C (np.ndarray): Bit matrix of shape (N, n), one received bus word per row
+
+        Returns:
+            np.ndarray: Bit matrix of shape (N, k), one decoded word per row.
+        """
+        return self.scheme.decode_batch(C, self.M)
+
+
+class SharedMemoryLink:
+    """
+    Implements: The bus between two processes as a single-producer, single-consumer ring buffer
+                of blocks of bus words in shared memory. Free and filled slots are counted by
+                two semaphores, so the transmitter blocks when the receiver falls a full ring
+                behind and the receiver blocks until a block arrives. A waiting endpoint checks
+                an abort flag every POLL_INTERVAL seconds and raises LinkAborted once it is set,
+                so a failure on one side cannot leave the other blocked forever.
+
+    Args:
+        n (int): Bus width
+        block_size (int): Bus words per ring slot (default: DEFAULT_BLOCK_SIZE)
+        num_blocks (int): Number of ring slots (default: DEFAULT_NUM_BLOCKS)
+        context: multiprocessing context the endpoint processes are started from (default: None)
+
+    Returns:
+        None (class definition)
+    """
+
+    def __init__(self, n, block_size=DEFAULT_BLOCK_SIZE, num_blocks=DEFAULT_NUM_BLOCKS, context=None):
+        context = context or multiprocessing.get_context()
+        self.n = n
+        self.block_size = block_size
+        self.num_blocks = num_blocks
+        self._words = context.RawArray('B', num_blocks * block_size * n)
+        self._counts = context.RawArray('l', num_blocks)
+        self._free = context.Semaphore(num_blocks)
+        self._filled = context.Semaphore(0)
+        self._aborted = context.Event()
+        self._write_slot = 0
+        self._read_slot = 0
+
+
+    def _slots(self) -> np.ndarray:
+        """View of the ring as (num_blocks, block_size, n) bits"""
+        return np.ctypeslib.as_array(self._words).reshape(self.num_blocks, self.block_size, self.n)
+
+
+    def _acquire(self, semaphore) -> None:
+        """Wait for a ring slot, raising LinkAborted if the link is aborted meanwhile"""
+        while not semaphore.acquire(timeout=POLL_INTERVAL):
+            if self._aborted.is_set():
+                raise LinkAborted("The other endpoint of the link failed")
+
+
+    def abort(self) -> None:
+        """
+        Implements: Abort of the link: every endpoint waiting on it, now or later, raises LinkAborted.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self._aborted.set()
+
+
+    def write(self, C) -> None:
+        """
+        Implements: Driving a block of bus words onto the link, split into ring slots.
+
+        Args:
+            C (np.ndarray): Bit matrix of shape (N, n), one bus word per row
+
+        Returns:
+            None
+        """
+        slots = self._slots()
+        for start in range(0, len(C), self.block_size):
+            chunk = C[start:start + self.block_size]
+            self._acquire(self._free)
+            slots[self._write_slot, :len(chunk)] = chunk
+            self._counts[self._write_slot] = len(chunk)
+            self._filled.release()
+            self._write_slot = (self._write_slot + 1) % self.num_blocks
+
+
+    def close_write(self) -> None:
+        """
+        Implements: End of the stream, seen by the reader after every block written before it.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self._acquire(self._free)
+        self._counts[self._write_slot] = END_OF_STREAM
+        self._filled.release()
+
+
+    def read(self):
+        """
+        Implements: Blocks of bus words in the order they were written, until the end of the stream.
+
+        Args:
+            None
+
+        Returns:
+            Generator[np.ndarray]: Bit matrices of shape (block length, n).
+        """
+        slots = self._slots()
+        while True:
+            self._acquire(self._filled)
+            count = self._counts[self._read_slot]
+            block = slots[self._read_slot, :count].copy()
+            self._free.release()
+            self._read_slot = (self._read_slot + 1) % self.num_blocks
+            if count == END_OF_STREAM:
+                return
+            yield block
+
+
+def transmit(coding_scheme, S, M=None, error_probability=0.0, seed=None,
+             block_size=DEFAULT_BLOCK_SIZE, num_blocks=DEFAULT_NUM_BLOCKS) -> tuple:
+    """
+    Implements: Two-stage pipelined link: a transmitter process encodes the words, injects
+                channel errors and counts bus transitions, while a receiver process decodes the
+                bus words taken from the shared-memory ring. Each endpoint starts from the
+                coding scheme's current encoder or decoder state, and the scheme is left unchanged.
+
+    Args:
+        coding_scheme: The coding scheme object to test
+        S (np.ndarray): Bit matrix of shape (N, k), one input word per row
+        M (int): Scheme-specific parameter (default: None)
+        error_probability (float): Probability of a single bit error per bus word, for schemes
+                                   that support errors (default: 0.0)
+        seed (int): Seed of the channel error generator (default: None)
+        block_size (int): Bus words per ring slot (default: DEFAULT_BLOCK_SIZE)
+        num_blocks (int): Number of ring slots (default: DEFAULT_NUM_BLOCKS)
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Transitions of every bus word against the one before it,
+                                       and the decoded words (N, k).
+
+    Raises:
+        RuntimeError: If an endpoint process fails; the link is aborted so the other one stops too.
+    """
+    S = np.asarray(S, dtype=np.uint8)
+    N, k = S.shape
+    context = multiprocessing.get_context()
+
+    transmitter = Transmitter(coding_scheme, k, M)
+    receiver = Receiver(coding_scheme, M)
+    link = SharedMemoryLink(len(transmitter.c_prev), block_size, num_blocks, context)
+
+    transitions = context.RawArray('l', N)
+    decoded = context.RawArray('B', N * k)
+
+    stages = [
+        context.Process(target=_run_endpoint,
+                        args=(_transmitter_stage, link, transmitter, S, transitions, error_probability, seed)),
+        context.Process(target=_run_endpoint, args=(_receiver_stage, link, receiver, decoded, k)),
+    ]
+    for stage in stages:
+        stage.start()
+    # An endpoint killed before it could abort the link is caught here from its exit code
+    while any(stage.is_alive() for stage in stages):
+        if any(stage.exitcode not in (None, 0) for stage in stages):
+            link.abort()
+        stages[0].join(POLL_INTERVAL)
+    for stage in stages:
+        stage.join()
+    if any(stage.exitcode != 0 for stage in stages):
+        raise RuntimeError("A link endpoint process failed")
+
+    return np.ctypeslib.as_array(transitions).copy(), np.ctypeslib.as_array(decoded).reshape(N, k).copy()
+
+
+def _run_endpoint(stage, link, *args) -> None:
+    """
+    Implements: Entry point of an endpoint process: runs the stage, aborting the link if it fails
+                and returning quietly if the other endpoint aborted it.
+
+    Args:
+        stage (callable): _transmitter_stage or _receiver_stage
+        link (SharedMemoryLink): The bus
+        *args: Remaining arguments of the stage
+
+    Returns:
+        None
+    """
+    try:
+        stage(link, *args)
+    except LinkAborted:
+        pass
+    except BaseException:
+        link.abort()
+        raise
+
+
+def _transmitter_stage(link, transmitter, S, transitions, error_probability, seed) -> None:
+    """
+    Implements: Transmitter process of transmit(): encoding, transition counting and channel
+                errors block by block.
+
+    Args:
+        link (SharedMemoryLink): The bus
+        transmitter (Transmitter): Transmitting endpoint
+        S (np.ndarray): Bit matrix of input words
+        transitions: Shared array receiving the transitions of every bus word
+        error_probability (float): Probability of a single bit error per bus word
+        seed (int): Seed of the channel error generator
+
+    Returns:
+        None
+    """
+    rng = np.random.default_rng(seed)
+    counts = np.ctypeslib.as_array(transitions)
+    with_errors = transmitter.scheme.supports_errors and error_probability > 0
+
+    for start in range(0, len(S), link.block_size):
+        bus_prev = np.asarray(transmitter.c_prev, dtype=np.uint8)
+        C = transmitter.send_batch(S[start:start + link.block_size])
+        counts[start:start + len(C)] = np.count_nonzero(C != np.vstack((bus_prev, C[:-1])), axis=1)
+
+        if with_errors:
+            C = error_generator.apply_error_batch(C, error_probability, rng)
+        link.write(C)
+
+    link.close_write()
+
+
+def _receiver_stage(link, receiver, decoded, k) -> None:
+    """
+    Implements: Receiver process of transmit(): decoding of every block taken from the link.
+
+    Args:
+        link (SharedMemoryLink): The bus
+        receiver (Receiver): Receiving endpoint
+        decoded: Shared array receiving the decoded words
+        k (int): Number of bits per decoded word
+
+    Returns:
+        None
+    """
+    out = np.ctypeslib.as_array(decoded).reshape(-1, k)
+    start = 0
+    for C in link.read():
+        out[start:start + len(C)] = receiver.receive_batch(C)
+        start += len(C)
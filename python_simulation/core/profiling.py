@@ -0,0 +1,216 @@
+"""
+======================================================
+    Power Efficient Error Correction Encoding for
+            On-Chip Interconnection Links
+
+            Shlomit Lenefsky & Omri Triki
+                        06.2025
+======================================================
+"""
+
+import cProfile
+import io
+import pstats
+import time
+from contextlib import contextmanager
+
+
+# Per-word stages of the simulation loop, in loop order, then the per-block statistics update
+WORD_STAGES = ("generation", "encoding", "counting", "error_injection", "decoding", "comparison")
+BLOCK_STAGES = ("statistics",)
+STAGES = WORD_STAGES + BLOCK_STAGES
+
+
+def no_clock() -> int:
+    """Stand-in for the clock on words that are not sampled"""
+    return 0
+
+
+class StageProfile:
+    """
+    Implements: Low-overhead per-stage timers of a simulation run. Per-word stages are timed with
+                the monotonic clock on one word in every sample_interval and extrapolated to all
+                words; per-block stages are timed once per block. simulate() has no batch path (it
+                encodes one word at a time), so there is no per-batch stage timing; the batch
+                kernels (encode_batch, decode_batch) are timed as a whole by benchmarks/suite.py.
+
+    Args:
+        sample_interval (int): One word in this many is timed (default: 16)
+
+    Returns:
+        None (class definition)
+    """
+
+    def __init__(self, sample_interval=16):
+        self.sample_interval = sample_interval
+        self.time_ns = dict.fromkeys(STAGES, 0)
+        self.items = dict.fromkeys(STAGES, 0)   # Words covered by the timed calls
+        self.calls = dict.fromkeys(STAGES, 0)   # Timed calls
+        self.words = 0
+        self.total_ns = 0
+        self._start = time.perf_counter_ns()
+
+
+    def clock(self, i):
+        """
+        Implements: The clock to read between the stages of word i: the monotonic clock on sampled
+                    words, no_clock otherwise.
+
+        Args:
+            i (int): Word index
+
+        Returns:
+            callable: Clock returning nanoseconds.
+        """
+        return time.perf_counter_ns if i % self.sample_interval == 0 else no_clock
+
+
+    def add_sample(self, timestamps) -> None:
+        """
+        Implements: Recording of one sampled word from the clock readings taken before the first
+                    stage and after every stage.
+
+        Args:
+            timestamps (tuple[int]): len(WORD_STAGES) + 1 clock readings in nanoseconds
+
+        Returns:
+            None
+        """
+        for stage, start, end in zip(WORD_STAGES, timestamps, timestamps[1:]):
+            self.time_ns[stage] += end - start
+            self.items[stage] += 1
+            self.calls[stage] += 1
+
+
+    @contextmanager
+    def stage(self, stage, items):
+        """
+        Implements: Timing of one call of a per-block stage.
+
+        Args:
+            stage (str): Stage name from BLOCK_STAGES
+            items (int): Number of words in the block
+
+        Returns:
+            Generator[None]: Context manager timing its body.
+        """
+        start = time.perf_counter_ns()
+        yield
+        self.time_ns[stage] += time.perf_counter_ns() - start
+        self.items[stage] += items
+        self.calls[stage] += 1
+
+
+    def finish(self, words) -> None:
+        """
+        Implements: End of the run: the number of words simulated and the total run time.
+
+        Args:
+            words (int): Number of words simulated
+
+        Returns:
+            None
+        """
+        self.words = words
+        self.total_ns = time.perf_counter_ns() - self._start
+
+
+    def breakdown(self) -> list:
+        """
+        Implements: Estimated time of every stage over the whole run (the mean time per timed word
+                    times the number of words), and the remainder as loop overhead.
+
+        Args:
+            None
+
+        Returns:
+            list[tuple[str, float, float]]: (stage, seconds, share of the run time) per stage,
+                                            followed by ("other", seconds, share).
+        """
+        total = self.total_ns / 1e9
+        rows = []
+        for stage in STAGES:
+            seconds = self.time_ns[stage] / self.items[stage] * self.words / 1e9 if self.items[stage] else 0.0
+            rows.append((stage, seconds, seconds / total if total else 0.0))
+        other = max(0.0, total - sum(seconds for _, seconds, _ in rows))
+        rows.append(("other", other, other / total if total else 0.0))
+        return rows
+
+
+    def to_dict(self) -> dict:
+        """
+        Implements: Plain representation of the breakdown, to be stored with the run results.
+
+        Args:
+            None
+
+        Returns:
+            dict: Words, sample interval, total seconds and the seconds, share and timed calls per stage.
+        """
+        return {
+            "words": self.words,
+            "sample_interval": self.sample_interval,
+            "total_seconds": self.total_ns / 1e9,
+            "stages": {stage: {"seconds": seconds, "share": share, "timed_calls": self.calls.get(stage, 0)}
+                       for stage, seconds, share in self.breakdown()},
+        }
+
+
+class WordProfiler:
+    """
+    Implements: Opt-in cProfile hook covering a fixed number of words from the start of a run.
+
+    Args:
+        num_words (int): Number of words to profile
+
+    Returns:
+        None (class definition)
+    """
+
+    def __init__(self, num_words):
+        self.num_words = num_words
+        self.profile = cProfile.Profile()
+        self.running = False
+
+
+    def start(self) -> None:
+        """Start profiling"""
+        self.profile.enable()
+        self.running = True
+
+
+    def word_done(self, words) -> None:
+        """
+        Implements: Stop after the configured number of words.
+
+        Args:
+            words (int): Number of words simulated so far
+
+        Returns:
+            None
+        """
+        if self.running and words >= self.num_words:
+            self.stop()
+
+
+    def stop(self) -> None:
+        """Stop profiling (also when the run ended before the configured number of words)"""
+        if self.running:
+            self.profile.disable()
+            self.running = False
+
+
+    def report(self, limit=20, sort="cumulative") -> str:
+        """
+        Implements: The profile as text, the most expensive functions first.
+
+        Args:
+            limit (int): Number of functions listed (default: 20)
+            sort (str): pstats sort key (default: "cumulative")
+
+        Returns:
+            str: pstats report.
+        """
+        stream = io.StringIO()
+        pstats.Stats(self.profile, stream=stream).sort_stats(sort).print_stats(limit)
+        return stream.getvalue()
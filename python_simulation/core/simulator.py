@@ -11,11 +11,27 @@
 import logging
 from typing import List
 from coding_schemes.paper1 import mbit_bi
-from core import generator, comparator, transition_count, error_generator
-from config.simulation_config import SIMULATION_MODES
+import numpy as np
+from core import generator, comparator, transition_count, transition_histogram, crosstalk, energy, error_generator, profiling
+from core.confidence import RunningEstimate
+from config.simulation_config import SIMULATION_MODES, SIMULATION_PARAMS, BUS_ENERGY_MODEL
 
 
-def simulate(coding_scheme, k, t, error_probability, M = 0, mode = 1):
+# Bus words buffered before each vectorized histogram, crosstalk, energy and estimate update
+CROSSTALK_BLOCK_SIZE = 1024
+
+# One word in this many is timed stage by stage
+PROFILE_SAMPLE_INTERVAL = 16
+
+# Statistics of the last run: words simulated, RunningEstimate of the transitions per word,
+# whether it stopped early, the StageProfile, and the WordProfiler (None unless profile_words
+# was given). There is no error-rate estimate: the run ends at the first word decoded wrongly,
+# so residual errors are reported as a failed run (pareto_explorer estimates their rate)
+run_statistics = {}
+
+
+def simulate(coding_scheme, k, t, error_probability, M = 0, mode = 1, energy_model = None,
+             ci_target = None, max_words = None, confidence = 0.95, profile_words = None):
     """
     Implements: The main simulation loop that encodes, transmits, and decodes words
                 while tracking transition statistics and error correction performance.
@@ -23,18 +39,30 @@ def simulate(coding_scheme, k, t, error_probability, M = 0, mode = 1):
     Args:
         coding_scheme: The coding scheme object to test (MbitBI, DAPBI, etc.)
         k (int): Number of input bits per word
-        t (int): Number of test words to process
+        t (int): Number of test words to process (the minimum number with early stopping)
         error_probability (float): Probability of introducing bit errors during transmission
         M (int): Number of segments for M-bit schemes (default: 0)
         mode (int): Word generation mode (1=random, 2=LFSR, 3=exhaustive)
+        energy_model (BusEnergyModel): Bus energy model (default: None, built from BUS_ENERGY_MODEL)
+        ci_target (float): In modes 1 and 2, stop once the relative confidence interval half-width
+                           of the mean transitions is at most this value; None runs exactly t
+                           words (default: None)
+        max_words (int): Word budget with early stopping (default: None, MAX_RANDOM_WORDS)
+        confidence (float): Confidence level of the intervals (default: 0.95)
+        profile_words (int): Run cProfile over this many words from the start (default: None, off)
 
     Returns:
         tuple[int, int, bool]: Maximum transitions, total average transitions, and success status (True if all words processed successfully, False if encoding/decoding mismatch occurred).
+                               The number of words simulated, the transitions estimate and the profiles are left in run_statistics.
     """
+    global run_statistics
+    profile = profiling.StageProfile(PROFILE_SAMPLE_INTERVAL)
+    word_profiler = profiling.WordProfiler(profile_words) if profile_words else None
     simulator_logger = logging.getLogger("Simulator")
     encoder = coding_scheme.encode
     decoder = coding_scheme.decode
     n = coding_scheme.get_bus_size(k, M)
+    energy_model = energy_model or energy.BusEnergyModel.from_config(BUS_ENERGY_MODEL)
 
     match = True
     
@@ -42,16 +70,36 @@ def simulate(coding_scheme, k, t, error_probability, M = 0, mode = 1):
     mode_description = SIMULATION_MODES[mode].format(t=t)
     simulator_logger.debug(mode_description)
     
-    # Initalize the bus, reset the counters
+    # Initalize the bus, the encoder/decoder state and the counters
     c_prev = [0] * n  
+    coding_scheme.reset_state()
     transition_count.transition_count(c_prev, c_prev, RESET=True)  
+    transition_histogram.histogram_count(size=transition_histogram.num_registers(n), RESET=True)
+    crosstalk.crosstalk_count(RESET=True)
+    energy.energy_count(RESET=True)
+    bus_words, bus_prev = [], []
+    transitions_estimate = RunningEstimate(confidence)
+
+    # With early stopping, random and LFSR runs go on until the confidence target or the budget
+    early_stopping = ci_target is not None and mode in [1, 2]
+    if early_stopping:
+        num_words = max(t, max_words or SIMULATION_PARAMS['MAX_RANDOM_WORDS']['value'])
+    else:
+        num_words = t if mode in [1, 2] else (2 ** k)
+    stopped_early = False
+    words = 0
+    if word_profiler is not None:
+        word_profiler.start()
 
-    num_words = t if mode in [1, 2] else (2 ** k)  
     for i in range(num_words):
         if mode == 3:  
             c_prev = [0] * n
+            coding_scheme.observe_bus(c_prev)
 
+        clock = profile.clock(i)
+        t0 = clock()
         s_in = generator.generate(k, mode=mode, i=i)
+        t1 = clock()
        
         # Check if encoder supports mode parameter by inspecting its signature
         import inspect
@@ -60,24 +108,60 @@ def simulate(coding_scheme, k, t, error_probability, M = 0, mode = 1):
             c = encoder(s_in, c_prev, M, mode=mode)
         else:
             c = encoder(s_in, c_prev, M)
+        t2 = clock()
+        # Copies: transition_count overwrites c_prev in place, and c becomes the next c_prev
+        bus_words.append(c[:])
+        bus_prev.append(c_prev[:])
         transition_count.transition_count(c, c_prev)
+        t3 = clock()
 
         # Generate error
         error = error_generator.generate_error(n, error_probability)
         c_with_error = coding_scheme.apply_error(c, error)
+        t4 = clock()
 
         s_out = decoder(c_with_error, M)
+        words = i + 1
+        t5 = clock()
 
         # Compare input and output words
         match = comparator.comparator(s_in, s_out)
+        if clock is not profiling.no_clock:
+            profile.add_sample((t0, t1, t2, t3, t4, t5, clock()))
+        if word_profiler is not None:
+            word_profiler.word_done(words)
         if not match:
             break
 
         # Update the previous codeword
         c_prev = c
 
-    # Get transition counts
+        if len(bus_words) == CROSSTALK_BLOCK_SIZE:
+            with profile.stage("statistics", len(bus_words)):
+                _update_block_statistics(bus_words, bus_prev, energy_model, transitions_estimate)
+            bus_words, bus_prev = [], []
+
+            if early_stopping and words >= t and _converged(transitions_estimate, ci_target):
+                stopped_early = True
+                break
+
+    # Get transition counts (histogram, crosstalk and energy statistics stay in their own counters)
     max_transitions, avg_transitions = transition_count.transition_count(c_prev, c_prev)
+    with profile.stage("statistics", len(bus_words)):
+        _update_block_statistics(bus_words, bus_prev, energy_model, transitions_estimate)
+    if word_profiler is not None:
+        word_profiler.stop()
+    profile.finish(words)
+    run_statistics = {
+        'words': words,
+        'transitions': transitions_estimate,
+        'stopped_early': stopped_early,
+        'profile': profile,
+        'word_profiler': word_profiler
+    }
+    if early_stopping:
+        simulator_logger.debug(f"Simulated {words} words, relative CI half-width "
+                               f"{transitions_estimate.relative_half_width():.4f} (target {ci_target})")
     
     # Log the result of the simulation ##### These need to be in the controller
     if match:
@@ -89,4 +173,40 @@ def simulate(coding_scheme, k, t, error_probability, M = 0, mode = 1):
     # Return transition counts with failure status if there's a mismatch
     simulator_logger.error("Simulation failed due to encoding/decoding mismatch")
     return max_transitions, avg_transitions, False
-    
\ No newline at end of file
+    
+
+
+def _update_block_statistics(bus_words, bus_prev, energy_model, transitions_estimate) -> None:
+    """
+    Implements: Vectorized update of the histogram, crosstalk and energy counters and of the
+                running estimate of the transitions with a block of buffered bus words.
+
+    Args:
+        bus_words (list[list[int]]): Bus words of the block
+        bus_prev (list[list[int]]): Bus word before each of them
+        energy_model (BusEnergyModel): Bus energy model
+        transitions_estimate (RunningEstimate): Estimate of the transitions per word
+
+    Returns:
+        None
+    """
+    if not bus_words:
+        return
+    transition_histogram.histogram_count(bus_words, bus_prev)
+    crosstalk.crosstalk_count(bus_words, bus_prev)
+    energy.energy_count(bus_words, bus_prev, energy_model)
+    transitions_estimate.update(np.count_nonzero(np.array(bus_words) != np.array(bus_prev), axis=1))
+
+
+def _converged(transitions_estimate, ci_target) -> bool:
+    """
+    Implements: Early stopping test: the mean transitions within the relative CI target.
+
+    Args:
+        transitions_estimate (RunningEstimate): Estimate of the transitions per word
+        ci_target (float): Target relative confidence interval half-width
+
+    Returns:
+        bool: True if the run can stop.
+    """
+    return transitions_estimate.relative_half_width() <= ci_target
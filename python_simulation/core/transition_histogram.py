@@ -0,0 +1,111 @@
+"""
+======================================================
+    Power Efficient Error Correction Encoding for
+            On-Chip Interconnection Links
+
+            Shlomit Lenefsky & Omri Triki
+                        06.2025
+======================================================
+"""
+
+import logging
+import numpy as np
+
+
+# Register widths of my_transition_counter (fpga_implementation/DataPath.v)
+COUNTER_BITS = 11   # registers_cnt
+SUM_BITS = 22       # sum_value
+REG_NUM_BITS = 5    # reg_num
+
+# Global variables
+registers = np.zeros(0, dtype=np.int64)
+reg_num = 0
+
+
+def num_registers(n) -> int:
+    """
+    Implements: Number of histogram registers of my_transition_counter #(n): registers_cnt[(n/2):0].
+
+    Args:
+        n (int): Bus width
+
+    Returns:
+        int: n // 2 + 1.
+    """
+    return n // 2 + 1
+
+
+def histogram_count(C=None, C_prev=None, size=None, RESET=False) -> np.ndarray:
+    """
+    Implements: Block-wise model of the histogram registers of my_transition_counter: every bus
+                cycle increments the register indexed by its transition count. As in the RTL, the
+                11-bit registers wrap around, and a count beyond the last register is not stored
+                (an out-of-range write to registers_cnt has no effect).
+
+    Args:
+        C (np.ndarray): Bit matrix of bus words, or None to only read the registers (default: None)
+        C_prev (np.ndarray): Bit matrix of the bus word before each row of C (default: None)
+        size (int): Number of registers, used with RESET (default: None)
+        RESET (bool): Flag to clear the registers (rst_n) (default: False)
+
+    Returns:
+        np.ndarray: Register values.
+    """
+    global registers
+    global reg_num
+
+    if RESET:
+        registers = np.zeros(size, dtype=np.int64)
+        reg_num = 0
+        logging.debug("Transition histogram registers have been reset")
+
+    if C is not None and len(C) > 0:
+        transitions = np.count_nonzero(np.asarray(C, dtype=np.uint8) != np.asarray(C_prev, dtype=np.uint8), axis=1)
+        counts = np.bincount(transitions, minlength=len(registers))[:len(registers)]
+        registers = (registers + counts) & ((1 << COUNTER_BITS) - 1)
+
+    return registers.copy()
+
+
+def register_outputs() -> tuple:
+    """
+    Implements: The reg_num and sum_value outputs latched on done: the index of the first
+                register holding the highest count (reg_num kept if every register is zero),
+                truncated to 5 bits, and sum(j * registers_cnt[j]) truncated to 22 bits.
+
+    Args:
+        None
+
+    Returns:
+        tuple[int, int]: reg_num and sum_value.
+    """
+    global reg_num
+
+    if registers.size and registers.max() > 0:
+        reg_num = int(np.argmax(registers)) & ((1 << REG_NUM_BITS) - 1)
+    sum_value = int(np.dot(np.arange(len(registers)), registers)) & ((1 << SUM_BITS) - 1)
+    return reg_num, sum_value
+
+
+def write_registers(path, header=None) -> None:
+    """
+    Implements: Register dump in the decimal format of the stored register files in
+                fpga_implementation/data_processing/register_values ("register %d: %d" with
+                Verilog's default widths: 11 columns for the 32-bit index, 4 for the 11-bit
+                value), as parsed by data_processing/scripts/registers_analysis.py. DataPath.v
+                itself prints the counts in hex ("register %d: %h"), so the dump is not a copy
+                of the raw $display output.
+
+    Args:
+        path (str): Output file path
+        header (str): First line of the file, e.g. "m=4:" (default: None)
+
+    Returns:
+        None
+    """
+    index_width = len(str(-(1 << 31)))
+    value_width = len(str((1 << COUNTER_BITS) - 1))
+    lines = [header] if header is not None else []
+    lines += [f"register {j:{index_width}d}: {int(value):{value_width}d}" for j, value in enumerate(registers)]
+    with open(path, "w") as f:
+        f.write("\n".join(lines) + "\n")
@@ -0,0 +1,229 @@
+"""
+======================================================
+    Power Efficient Error Correction Encoding for
+            On-Chip Interconnection Links
+
+            Shlomit Lenefsky & Omri Triki
+                        06.2025
+======================================================
+"""
+
+import argparse
+import heapq
+import json
+import logging
+import math
+import multiprocessing
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import numpy as np
+
+from coding_schemes.bit_ops import popcount
+from coding_schemes.gf2 import GF2Matrix
+from coding_schemes.syndrome_based.code_cache import artifact_path, code_params
+from coding_schemes.syndrome_based.syndrome_based_encoder import SyndromeBasedEncoder
+from config.logging_config import configure_logging
+from core import generator, lfsr
+from core.confidence import RunningEstimate
+
+
+K = 32
+NUM_SEEDS = 32
+TOP_K = 5
+MAX_WORKERS = None  # One worker per CPU
+
+# Reference workload: generator mode (1=random, 2=LFSR, 3=exhaustive counter) encoded as one stream
+WORKLOAD_MODE = 3
+NUM_WORDS = 65536
+WORKLOAD_SEED = 42
+
+BLOCK_WORDS = 4096   # Words per simulated block, the granularity of the pruning checks
+MIN_BLOCKS = 2       # Blocks simulated before a candidate may be pruned
+CONFIDENCE = 0.99    # Confidence level of the pruning bound
+
+OUTPUT_JSON = "matrix_search_results.json"
+
+# K-th best completed score, shared with the workers (see _init_worker)
+_threshold = None
+
+
+def reference_workload(k, mode=WORKLOAD_MODE, num_words=NUM_WORDS, seed=WORKLOAD_SEED) -> np.ndarray:
+    """
+    Implements: The word stream every candidate code is scored on, from the simulator's word
+                generator with a fixed seed.
+
+    Args:
+        k (int): Number of information bits
+        mode (int): Generator mode (1=random, 2=LFSR, 3=exhaustive counter)
+        num_words (int): Number of words
+        seed (int): Seed of the random and LFSR generators
+
+    Returns:
+        np.ndarray: Bit matrix of shape (num_words, k).
+    """
+    random.seed(seed)
+    lfsr.set_registers(None)
+    return np.array([generator.generate(k, mode=mode, i=i % (1 << k)) for i in range(num_words)], dtype=np.uint8)
+
+
+def validate_code(encoder) -> list:
+    """
+    Implements: Checks of a candidate code beyond those of its generation: every syndrome has a
+                coset leader of weight at most 2, and the columns of H are distinct and nonzero
+                (single-bit errors are corrected).
+
+    Args:
+        encoder (SyndromeBasedEncoder): Candidate encoder
+
+    Returns:
+        list[str]: Violated properties (empty for a valid code).
+    """
+    problems = []
+    if popcount(encoder.leader_words).max() > 2:
+        problems.append("some syndrome needs more than 2 redundancy bits")
+    columns = GF2Matrix(encoder.H).column_ints
+    if 0 in columns or len(set(columns)) != len(columns):
+        problems.append("H has zero or repeated columns")
+    return problems
+
+
+def _init_worker(threshold):
+    """Share the pruning threshold with a worker process"""
+    global _threshold
+    _threshold = threshold
+
+
+def evaluate_seed(seed, k, workload, r=None, n_V=None) -> dict:
+    """
+    Implements: Generation, validation and scoring of the code of one seed. The workload is
+                encoded block by block and the transitions per word are tracked with a confidence
+                interval; the run is pruned once the interval lies above the K-th best score
+                completed so far.
+
+    Args:
+        seed (int): Matrix generation seed
+        k (int): Number of information bits
+        workload (np.ndarray): Reference word stream, one k-bit word per row
+        r (int): Syndrome length, or None to pick the smallest that fits k
+        n_V (int): Number of redundancy bits, or None for the greedy minimum
+
+    Returns:
+        dict: Seed, status ("complete", "pruned" or "invalid"), score and words simulated.
+    """
+    result = {"seed": seed, "status": "invalid", "mean_transitions": None, "half_width": None, "words": 0}
+    start = time.perf_counter()
+    try:
+        encoder = SyndromeBasedEncoder(k=k, r=r, n_V=n_V, seed=seed)
+    except (ValueError, RuntimeError) as e:
+        result["error"] = str(e)
+        return result
+    result.update(r=encoder.r, n_V=encoder.n_V)
+    problems = validate_code(encoder)
+    if problems:
+        result["error"] = "; ".join(problems)
+        return result
+
+    estimate = RunningEstimate(CONFIDENCE)
+    c_prev = np.zeros(encoder.n, dtype=np.uint8)
+    result["status"] = "complete"
+    for block, low in enumerate(range(0, len(workload), BLOCK_WORDS)):
+        C = encoder.encode_batch(workload[low:low + BLOCK_WORDS], c_prev.tolist())
+        estimate.update(np.count_nonzero(C != np.vstack((c_prev, C[:-1])), axis=1))
+        c_prev = C[-1]
+        if (block + 1 >= MIN_BLOCKS and _threshold is not None
+                and estimate.interval()[0] > _threshold.value):
+            result["status"] = "pruned"
+            break
+
+    result.update(mean_transitions=estimate.mean, half_width=estimate.half_width(), words=estimate.count,
+                  seconds=time.perf_counter() - start)
+    return result
+
+
+def search(seeds, k=K, top_k=TOP_K, workload=None, r=None, n_V=None, max_workers=MAX_WORKERS) -> list:
+    """
+    Implements: Parallel multi-seed search: every seed is evaluated on a process pool, and the
+                K-th best complete score becomes the pruning threshold of the runs still going.
+
+    Args:
+        seeds (list[int]): Matrix generation seeds
+        k (int): Number of information bits (default: K)
+        top_k (int): Number of codes kept (default: TOP_K)
+        workload (np.ndarray): Reference word stream (default: reference_workload(k))
+        r (int): Syndrome length, or None to pick the smallest that fits k
+        n_V (int): Number of redundancy bits, or None for the greedy minimum
+        max_workers (int): Number of worker processes (default: MAX_WORKERS)
+
+    Returns:
+        list[dict]: Result of every seed, complete ones by increasing score first, each of the
+                    top_k with the path of its code artifact.
+    """
+    logger = logging.getLogger("MatrixSearch")
+    workload = reference_workload(k) if workload is None else workload
+    context = multiprocessing.get_context()
+    threshold = context.Value("d", math.inf)
+    best = []  # Max-heap (negated scores) of the top_k complete scores
+    results = []
+
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=context,
+                             initializer=_init_worker, initargs=(threshold,)) as executor:
+        futures = [executor.submit(evaluate_seed, seed, k, workload, r, n_V) for seed in seeds]
+        for done, future in enumerate(as_completed(futures), start=1):
+            result = future.result()
+            results.append(result)
+            if result["status"] == "complete":
+                heapq.heappush(best, -result["mean_transitions"])
+                if len(best) > top_k:
+                    heapq.heappop(best)
+                if len(best) == top_k:
+                    threshold.value = -best[0]
+            score = "" if result["mean_transitions"] is None else \
+                f"{result['mean_transitions']:.4f} ± {result['half_width']:.4f} transitions/word, "
+            logger.info(f"[{done}/{len(seeds)}] seed {result['seed']}: {result['status']}, {score}"
+                        f"{result['words']} words (threshold {threshold.value:.4f})")
+
+    ranked = sorted((result for result in results if result["status"] == "complete"),
+                    key=lambda result: (result["mean_transitions"], result["seed"]))
+    for result in ranked[:top_k]:
+        result["artifact"] = str(artifact_path(code_params(k, result["r"], n_V, result["seed"])))
+    return ranked + [result for result in results if result["status"] != "complete"]
+
+
+def main():
+    """Search generation seeds for the code with the fewest transitions on the reference workload."""
+    parser = argparse.ArgumentParser(description="Multi-seed search for syndrome-based codes")
+    parser.add_argument("--k", type=int, default=K)
+    parser.add_argument("--seeds", type=int, default=NUM_SEEDS, help="number of seeds, 0 to seeds - 1")
+    parser.add_argument("--top", type=int, default=TOP_K)
+    parser.add_argument("--workload", type=Path, help="trace as a .npy bit matrix (default: generated stream)")
+    parser.add_argument("--mode", type=int, default=WORKLOAD_MODE, choices=[1, 2, 3],
+                        help="generator mode of the default workload")
+    parser.add_argument("--output", type=Path, default=Path(OUTPUT_JSON))
+    args = parser.parse_args()
+
+    workload = np.load(args.workload) if args.workload else reference_workload(args.k, args.mode)
+    start = time.perf_counter()
+    results = search(list(range(args.seeds)), k=args.k, top_k=args.top, workload=workload)
+    elapsed = time.perf_counter() - start
+
+    print("\n============= TOP CODES =============\n")
+    print(f"{'Seed':>6} {'r':>3} {'n_V':>4} {'Transitions/word':>18}  Artifact")
+    for result in results[:args.top]:
+        if result["status"] != "complete":
+            break
+        print(f"{result['seed']:>6} {result['r']:>3} {result['n_V']:>4} {result['mean_transitions']:>18.4f}  "
+              f"{result['artifact']}")
+    counts = {status: sum(result["status"] == status for result in results) for status in ("complete", "pruned", "invalid")}
+    print(f"\n{counts['complete']} complete, {counts['pruned']} pruned, {counts['invalid']} invalid "
+          f"in {elapsed:.1f} seconds")
+
+    args.output.write_text(json.dumps(results, indent=2))
+    print(f"All results written to {args.output}")
+
+
+if __name__ == '__main__':
+    configure_logging(console_level=logging.INFO)
+    main()
@@ -0,0 +1,295 @@
+"""
+======================================================
+    Power Efficient Error Correction Encoding for
+            On-Chip Interconnection Links
+
+            Shlomit Lenefsky & Omri Triki
+                        06.2025
+======================================================
+"""
+
+import copy
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from coding_schemes.paper1.mbit_bi import MbitBI
+from config.logging_config import configure_logging
+from config.simulation_config import SIMULATION_PARAMS, SCHEMES, SYNDROME_SCHEMES, BUS_ENERGY_MODEL
+from core import error_generator
+from core.energy import BusEnergyModel
+from core.link import Transmitter, Receiver
+
+
+# Design space: input widths and M values (M-bit Bus-Invert only, M <= k / 2)
+K_RANGE = (8, 64)
+M_RANGE = (1, 16)
+
+# Coarse grid steps, halved around the Pareto front on every refinement round
+INITIAL_K_STEP = 8
+INITIAL_M_STEP = 4
+
+NUM_WORDS = 20000
+ERROR_PROBABILITY = SIMULATION_PARAMS['ERROR_PROBABILITY']['value']
+SEED = 42
+MAX_WORKERS = None  # One worker per CPU
+
+OUTPUT_CSV = "pareto_points.csv"
+
+# Objectives, all minimized. Per-bit figures compare links of different widths.
+OBJECTIVES = ["overhead_ratio", "avg_transitions_per_bit", "max_transitions_per_bit", "residual_error_rate"]
+
+
+def uses_m(scheme_key) -> bool:
+    """
+    Implements: Whether a scheme is parameterized by M (M-bit Bus-Invert).
+
+    Args:
+        scheme_key (int): Key of the scheme in SCHEMES
+
+    Returns:
+        bool: True if M is a design parameter of the scheme.
+    """
+    return isinstance(SCHEMES[scheme_key], MbitBI)
+
+
+def build_scheme(scheme_key, k):
+    """
+    Implements: A fresh instance of a scheme for k information bits.
+
+    Args:
+        scheme_key (int): Key of the scheme in SCHEMES
+        k (int): Number of information bits
+
+    Returns:
+        CodingScheme: Scheme with power-on state.
+    """
+    scheme = SCHEMES[scheme_key]
+    if scheme_key in SYNDROME_SCHEMES:
+        scheme = scheme.for_info_bits(k)
+    scheme = copy.deepcopy(scheme)
+    scheme.reset_state()
+    return scheme
+
+
+def evaluate_point(point, num_words=NUM_WORDS, error_probability=ERROR_PROBABILITY, seed=SEED) -> dict:
+    """
+    Implements: Evaluation of one design point over a random word stream through separate
+                transmitter and receiver endpoints: bus overhead, average and maximum transitions,
+                bus energy, and the residual error rate (words decoded wrongly) under the
+                single-bit channel error model, injected for every scheme.
+
+    Args:
+        point (tuple[int, int, int]): (scheme key, k, M), M is None for schemes without M
+        num_words (int): Number of random words (default: NUM_WORDS)
+        error_probability (float): Probability of a single bit error per bus word (default: ERROR_PROBABILITY)
+        seed (int): Base seed of the words and errors (default: SEED)
+
+    Returns:
+        dict: Metrics of the point.
+    """
+    scheme_key, k, M = point
+    scheme = build_scheme(scheme_key, k)
+    n = scheme.get_bus_size(k, M)
+    rng = np.random.default_rng([seed, scheme_key, k, M or 0])
+    S = rng.integers(0, 2, size=(num_words, k), dtype=np.uint8)
+
+    transmitter = Transmitter(scheme, k, M)
+    receiver = Receiver(scheme, M)
+    C_prev = np.zeros((1, n), dtype=np.uint8)
+    C = transmitter.send_batch(S)
+    C_prev = np.vstack((C_prev, C[:-1]))
+
+    transitions = np.count_nonzero(C != C_prev, axis=1)
+    energies = BusEnergyModel.from_config(BUS_ENERGY_MODEL).cycle_energies(C, C_prev)
+    received = error_generator.apply_error_batch(C, error_probability, rng) if error_probability > 0 else C
+    decoded = receiver.receive_batch(received)
+
+    return {
+        "scheme": scheme.name,
+        "scheme_key": scheme_key,
+        "k": k,
+        "M": M,
+        "n": n,
+        "overhead_bits": n - k,
+        "overhead_ratio": (n - k) / k,
+        "avg_transitions": float(transitions.mean()),
+        "max_transitions": int(transitions.max()),
+        "avg_transitions_per_bit": float(transitions.mean()) / k,
+        "max_transitions_per_bit": int(transitions.max()) / k,
+        "residual_error_rate": float(np.any(decoded != S, axis=1).mean()),
+        "energy_pj_per_word": float(energies.mean()),
+    }
+
+
+def pareto_front(results) -> list:
+    """
+    Implements: Non-dominated subset of the evaluated points: a point is dominated if another one
+                is no worse in every objective and strictly better in at least one.
+
+    Args:
+        results (list[dict]): Evaluated points
+
+    Returns:
+        list[dict]: The Pareto-optimal points.
+    """
+    values = np.array([[result[objective] for objective in OBJECTIVES] for result in results])
+    no_worse = (values[:, None, :] <= values[None, :, :]).all(axis=2)
+    better = (values[:, None, :] < values[None, :, :]).any(axis=2)
+    dominated = (no_worse & better).any(axis=0)
+    return [result for result, is_dominated in zip(results, dominated) if not is_dominated]
+
+
+def coarse_grid() -> set:
+    """
+    Implements: The initial design points: every scheme on the coarse k grid, and M-bit Bus-Invert
+                also on the coarse M grid.
+
+    Args:
+        None
+
+    Returns:
+        set[tuple[int, int, int]]: (scheme key, k, M) points.
+    """
+    points = set()
+    for k in range(K_RANGE[0], K_RANGE[1] + 1, INITIAL_K_STEP):
+        points |= _points_at(k, range(M_RANGE[0], M_RANGE[1] + 1, INITIAL_M_STEP))
+    return points
+
+
+def neighbours(result, k_step, m_step) -> set:
+    """
+    Implements: Design points around a front point at the current refinement steps: the same
+                scheme at k ± k_step, and for M-bit Bus-Invert also M ± m_step.
+
+    Args:
+        result (dict): Evaluated front point
+        k_step (int): Refinement step of k
+        m_step (int): Refinement step of M
+
+    Returns:
+        set[tuple[int, int, int]]: Valid neighbouring points.
+    """
+    scheme_key, k, M = result["scheme_key"], result["k"], result["M"]
+    points = set()
+    for dk in (-k_step, 0, k_step):
+        k_new = k + dk
+        if not K_RANGE[0] <= k_new <= K_RANGE[1]:
+            continue
+        if not uses_m(scheme_key):
+            points.add((scheme_key, k_new, None))
+            continue
+        for dm in (-m_step, 0, m_step):
+            if M_RANGE[0] <= M + dm <= min(M_RANGE[1], k_new / 2):
+                points.add((scheme_key, k_new, M + dm))
+    return points
+
+
+def evaluate_points(points, executor) -> list:
+    """
+    Implements: Parallel evaluation of design points. Syndrome-based codes for new widths are
+                generated in this process first, so that workers only read the on-disk cache.
+
+    Args:
+        points (set[tuple[int, int, int]]): Points to evaluate
+        executor (ProcessPoolExecutor): Worker pool
+
+    Returns:
+        list[dict]: Metrics of every point.
+    """
+    points = sorted(points, key=lambda p: (p[0], p[1], p[2] or 0))
+    for k in sorted({k for scheme_key, k, _ in points if scheme_key in SYNDROME_SCHEMES}):
+        build_scheme(next(iter(SYNDROME_SCHEMES)), k)
+    return list(executor.map(evaluate_point, points))
+
+
+def explore(max_workers=MAX_WORKERS) -> tuple:
+    """
+    Implements: Adaptive Pareto exploration: the coarse grid is evaluated, then only the
+                neighbourhood of the current front is evaluated with halved k and M steps,
+                until the steps reach 1.
+
+    Args:
+        max_workers (int): Number of worker processes (default: MAX_WORKERS)
+
+    Returns:
+        tuple[list[dict], list[dict]]: Every evaluated point and the final Pareto front.
+    """
+    logger = logging.getLogger("Explorer")
+    evaluated = {}
+    k_step, m_step = INITIAL_K_STEP, INITIAL_M_STEP
+    pending = coarse_grid()
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        while pending:
+            for result in evaluate_points(pending, executor):
+                evaluated[(result["scheme_key"], result["k"], result["M"])] = result
+            front = pareto_front(list(evaluated.values()))
+            logger.info(f"k step {k_step}, M step {m_step}: {len(pending)} points evaluated, "
+                        f"{len(front)} on the front")
+
+            if k_step == 1 and m_step == 1:
+                break
+            k_step, m_step = max(1, k_step // 2), max(1, m_step // 2)
+            pending = set().union(*(neighbours(result, k_step, m_step) for result in front)) - set(evaluated)
+
+    return list(evaluated.values()), front
+
+
+def full_grid_size() -> int:
+    """
+    Implements: Number of points of the exhaustive k/M grid, for comparison with the explored set.
+
+    Args:
+        None
+
+    Returns:
+        int: Number of (scheme, k, M) points.
+    """
+    return sum(len(_points_at(k, range(M_RANGE[0], M_RANGE[1] + 1))) for k in range(K_RANGE[0], K_RANGE[1] + 1))
+
+
+def _points_at(k, m_values) -> set:
+    """
+    Implements: Design points of every scheme at one width.
+
+    Args:
+        k (int): Number of information bits
+        m_values (range): M values for M-bit Bus-Invert
+
+    Returns:
+        set[tuple[int, int, int]]: (scheme key, k, M) points.
+    """
+    points = set()
+    for scheme_key in SCHEMES:
+        if uses_m(scheme_key):
+            points |= {(scheme_key, k, M) for M in m_values if M <= k / 2}
+        else:
+            points.add((scheme_key, k, None))
+    return points
+
+
+def main():
+    """Explore the design space, print the Pareto front and save every evaluated point."""
+    start = time.perf_counter()
+    results, front = explore()
+    elapsed = time.perf_counter() - start
+
+    table = pd.DataFrame([{**result, "on_front": result in front} for result in results])
+    table = table.sort_values(["k", "scheme_key", "M"])
+    table.to_csv(OUTPUT_CSV, index=False)
+
+    print("\n============= PARETO FRONT =============\n")
+    columns = ["scheme", "k", "M", "overhead_bits", "avg_transitions", "max_transitions",
+               "residual_error_rate", "energy_pj_per_word"]
+    print(table[table["on_front"]][columns].to_string(index=False))
+    print(f"\nEvaluated {len(results)} of {full_grid_size()} grid points in {elapsed:.1f} seconds")
+    print(f"All evaluated points written to {OUTPUT_CSV}")
+
+
+if __name__ == '__main__':
+    configure_logging(console_level=logging.INFO)
+    main()
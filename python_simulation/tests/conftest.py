@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Add python_simulation to path for imports
+sys.path.append(str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,85 @@
+"""
+======================================================
+    Power Efficient Error Correction Encoding for
+            On-Chip Interconnection Links
+
+            Shlomit Lenefsky & Omri Triki
+                        06.2025
+======================================================
+"""
+
+import numpy as np
+import pytest
+
+from coding_schemes import kernels
+from coding_schemes.paper1.mbit_bi import MbitBI
+from coding_schemes.paper1.offset import Offset
+from coding_schemes.paper1.offset_xor import Offset_XOR
+from coding_schemes.paper1.transition_signaling import Transition_Signaling
+from coding_schemes.paper2.dap import DAP
+from coding_schemes.paper2.dapbi import DAPBI
+from coding_schemes.paper2.hamming_x import HammingX
+from coding_schemes.syndrome_based.syndrome_based_encoder import SyndromeBasedEncoder, COSET_LEADER, MIN_TRANSITIONS
+
+
+NUM_WORDS = 100
+SPLIT = 60  # The block is encoded in two parts, with an empty block in between
+
+# (label, scheme factory taking k, M)
+SCHEMES = [
+    ("Transition Signaling", lambda k: Transition_Signaling(), None),
+    ("Offset", lambda k: Offset(), None),
+    ("Offset-XOR", lambda k: Offset_XOR(), None),
+    ("M-bit Bus-Invert (M=1)", lambda k: MbitBI(), 1),
+    ("M-bit Bus-Invert (M=4)", lambda k: MbitBI(), 4),
+    ("DAP", lambda k: DAP(), None),
+    ("DAPBI", lambda k: DAPBI(), None),
+    ("HammingX", lambda k: HammingX(), None),
+    ("Syndrome-based (coset leader)", lambda k: SyndromeBasedEncoder(COSET_LEADER, k=k), None),
+    ("Syndrome-based (min-transition)", lambda k: SyndromeBasedEncoder(MIN_TRANSITIONS, k=k), None),
+]
+
+BACKENDS = [kernels.PYTHON] + ([kernels.NUMBA] if kernels.numba is not None else [])
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    """Run the test with every available kernel backend, restoring the default afterwards"""
+    default = kernels.BACKEND
+    kernels.set_backend(request.param)
+    yield request.param
+    kernels.set_backend(default)
+
+
+def scalar_encode(scheme, S, c_prev, M):
+    """Word-by-word encoding, every word against the codeword before it"""
+    C = []
+    for s in S:
+        c_prev = scheme.encode(s.tolist(), list(c_prev), M)
+        C.append(c_prev)
+    return np.array(C, dtype=np.uint8)
+
+
+@pytest.mark.parametrize("k", [8, 32, 70])
+@pytest.mark.parametrize("label, make_scheme, M", SCHEMES, ids=[case[0] for case in SCHEMES])
+def test_batch_matches_per_word(backend, label, make_scheme, M, k):
+    rng = np.random.default_rng(k)
+    S = rng.integers(0, 2, (NUM_WORDS, k), dtype=np.uint8)
+    batch, scalar = make_scheme(k), make_scheme(k)
+    n = batch.get_bus_size(k, M)
+    c_prev = [0] * n
+
+    first = batch.encode_batch(S[:SPLIT], c_prev, M)
+    empty = batch.encode_batch(S[:0], first[-1].tolist(), M)
+    second = batch.encode_batch(S[SPLIT:], first[-1].tolist(), M)
+    C = scalar_encode(scalar, S, c_prev, M)
+    assert empty.shape == (0, n)
+    np.testing.assert_array_equal(np.vstack((first, second)), C)
+
+    # One flipped bit per received codeword
+    received = C.copy()
+    received[np.arange(NUM_WORDS), rng.integers(0, n, NUM_WORDS)] ^= 1
+    decoded = np.vstack((batch.decode_batch(received[:SPLIT], M), batch.decode_batch(received[:0], M).reshape(0, k),
+                         batch.decode_batch(received[SPLIT:], M)))
+    expected = np.array([scalar.decode(c.tolist(), M) for c in received], dtype=np.uint8)
+    np.testing.assert_array_equal(decoded, expected)
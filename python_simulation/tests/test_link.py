@@ -0,0 +1,47 @@
+"""
+======================================================
+    Power Efficient Error Correction Encoding for
+            On-Chip Interconnection Links
+
+            Shlomit Lenefsky & Omri Triki
+                        06.2025
+======================================================
+"""
+
+import numpy as np
+import pytest
+
+from coding_schemes.paper2.dapbi import DAPBI
+from core import link
+
+
+class FailingDecoder(DAPBI):
+    """DAPBI whose receiver fails on the first block"""
+
+    def decode_batch(self, C, M=None):
+        raise ValueError("decoder failure")
+
+
+class FailingEncoder(DAPBI):
+    """DAPBI whose transmitter fails on the first block"""
+
+    def encode_batch(self, S, c_prev, M=None):
+        raise ValueError("encoder failure")
+
+
+def words(num_words=20000, k=32):
+    return np.random.default_rng(0).integers(0, 2, (num_words, k), dtype=np.uint8)
+
+
+def test_transmit_decodes_every_word():
+    S = words()
+    transitions, decoded = link.transmit(DAPBI(), S, block_size=1024, num_blocks=4)
+    np.testing.assert_array_equal(decoded, S)
+    assert len(transitions) == len(S)
+
+
+@pytest.mark.parametrize("scheme", [FailingDecoder, FailingEncoder])
+def test_transmit_raises_when_an_endpoint_fails(scheme):
+    # More blocks than ring slots, so the healthy endpoint has to wait on the failed one
+    with pytest.raises(RuntimeError):
+        link.transmit(scheme(), words(), block_size=1024, num_blocks=4)
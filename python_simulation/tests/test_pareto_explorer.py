@@ -0,0 +1,31 @@
+"""
+======================================================
+    Power Efficient Error Correction Encoding for
+            On-Chip Interconnection Links
+
+            Shlomit Lenefsky & Omri Triki
+                        06.2025
+======================================================
+"""
+
+import pytest
+
+import pareto_explorer
+from config.simulation_config import SCHEMES
+
+
+# Every scheme at both ends of the design space, M-bit Bus-Invert at both ends of its M range
+POINTS = sorted(pareto_explorer._points_at(pareto_explorer.K_RANGE[0], pareto_explorer.M_RANGE)
+                | pareto_explorer._points_at(pareto_explorer.K_RANGE[1], pareto_explorer.M_RANGE),
+                key=lambda point: (point[0], point[1], point[2] or 0))
+
+
+@pytest.mark.parametrize("point", POINTS, ids=lambda point: f"{SCHEMES[point[0]].name}-k{point[1]}-M{point[2]}")
+def test_evaluate_point_covers_k_range(point):
+    result = pareto_explorer.evaluate_point(point, num_words=500)
+    scheme_key, k, M = point
+    assert result["k"] == k and result["n"] == k + result["overhead_bits"]
+    assert 0 < result["avg_transitions"] <= result["max_transitions"] <= result["n"]
+    if SCHEMES[scheme_key].supports_errors:
+        # Single-bit channel errors are corrected
+        assert result["residual_error_rate"] == 0